@@ -1,5 +1,5 @@
 # membership/handlers.py
-from typing import Callable, Optional
+from typing import Callable, Optional, Tuple
 
 from protocol.message import Message
 from protocol.message_types import MessageType
@@ -13,6 +13,25 @@ OnPeerDiscovered = Callable[[Peer], None]
 # Sender(peer_id, message) -> send to that peer
 
 
+def _parse_peer_entry(entry) -> Optional[Tuple[str, str, int]]:
+	"""
+	Validate a {"node_id", "host", "port"} mapping in one pass.
+
+	Returns (node_id, host, port), or None if the entry is malformed.
+	"""
+	try:
+		node_id = entry["node_id"]
+		host = entry["host"]
+		port = entry["port"]
+	except (KeyError, TypeError):
+		return None
+
+	if not node_id or not host or type(port) is not int:
+		return None
+
+	return node_id, host, port
+
+
 def make_membership_handlers(
 	peer_table: PeerTable,
 	send: Sender,
@@ -27,6 +46,28 @@ def make_membership_handlers(
 	"""
 	log = get_logger(__name__, self_node_id)
 
+	# PEER_LIST payload cache, rebuilt only when the PeerTable changes.
+	# Holds one (version, peers) tuple, replaced in a single assignment, so
+	# concurrent handlers (several reactor threads) never pair a list with
+	# another version.
+	peers_cache = [(None, [])]
+
+	def _peers_payload() -> list:
+		version = peer_table.version()
+		cached_version, peers = peers_cache[0]
+		if cached_version != version:
+			# version is read before the list, so the list is never older
+			peers = [
+				{
+					"node_id": p.node_id,
+					"host": p.host,
+					"port": p.port,
+				}
+				for p in peer_table.list_peers()
+			]
+			peers_cache[0] = (version, peers)
+		return peers
+
 	def _notify_discovered(peer: Peer) -> None:
 		if on_peer_discovered is None:
 			return
@@ -34,47 +75,37 @@ def make_membership_handlers(
 			on_peer_discovered(peer)
 		except Exception:
 			log.warning(
-				f"on_peer_discovered failed for peer {peer.node_id} {peer.host}:{peer.port}",
+				"on_peer_discovered failed for peer %s %s:%d",
+				peer.node_id,
+				peer.host,
+				peer.port,
 				exc_info=True,
 			)
 
 	def handle_join_request(msg: Message) -> None:
-		payload = msg.payload
-
-		node_id = payload.get("node_id")
-		host = payload.get("host")
-		port = payload.get("port")
-
-		if not node_id or not host or not isinstance(port, int):
+		parsed = _parse_peer_entry(msg.payload)
+		if parsed is None:
 			log.warning("Invalid JOIN_REQUEST payload")
 			return
 
+		node_id, host, port = parsed
+
 		# Ignore self-join completely (no side effects)
 		if node_id == self_node_id:
 			return
 
-		peer = Peer.new(node_id=node_id, host=host, port=port)
-		added = peer_table.add_peer(peer)
+		peer = peer_table.add_peer_by_id(node_id, host, port)
 
-		if added:
-			log.info(f"New peer joined: {node_id} {host}:{port}")
+		if peer is not None:
+			log.info("New peer joined: %s %s:%d", node_id, host, port)
 			_notify_discovered(peer)
 		else:
-			log.info(f"JOIN_REQUEST from known peer: {node_id}")
-
-		peers_payload = [
-			{
-				"node_id": p.node_id,
-				"host": p.host,
-				"port": p.port,
-			}
-			for p in peer_table.list_peers()
-		]
-
-		reply = Message(
+			log.info("JOIN_REQUEST from known peer: %s", node_id)
+
+		reply = Message.new_trusted(
 			msg_type=MessageType.PEER_LIST,
 			sender_id=self_node_id,
-			payload={"peers": peers_payload},
+			payload={"peers": _peers_payload()},
 		)
 
 		# Reply to transport-level sender, not logical node_id
@@ -91,22 +122,20 @@ def make_membership_handlers(
 		added_count = 0
 
 		for entry in peers:
-			node_id = entry.get("node_id")
-			host = entry.get("host")
-			port = entry.get("port")
-
-			if not node_id or not host or not isinstance(port, int):
+			parsed = _parse_peer_entry(entry)
+			if parsed is None:
 				continue
 
+			node_id, host, port = parsed
 			if node_id == self_node_id:
 				continue
 
-			peer = Peer.new(node_id=node_id, host=host, port=port)
-			if peer_table.add_peer(peer):
+			peer = peer_table.add_peer_by_id(node_id, host, port)
+			if peer is not None:
 				added_count += 1
 				_notify_discovered(peer)
 
 		if added_count > 0:
-			log.info(f"Integrated {added_count} new peers from PEER_LIST")
+			log.info("Integrated %d new peers from PEER_LIST", added_count)
 
 	return handle_join_request, handle_peer_list
\ No newline at end of file
@@ -6,13 +6,14 @@ import time
 PeerStatus = Literal["alive", "suspected", "dead"]
 
 
-@dataclass
+@dataclass(slots=True)
 class Peer:
     node_id: str
     host: str
     port: int
 
-    last_heartbeat: float
+    # time.monotonic_ns() of the last heartbeat (immune to clock steps)
+    last_heartbeat_ns: int
     phi: float
     status: PeerStatus
 
@@ -22,7 +23,7 @@ class Peer:
             node_id=node_id,
             host=host,
             port=port,
-            last_heartbeat=time.time(),
+            last_heartbeat_ns=time.monotonic_ns(),
             phi=0.0,
             status="alive",
         )
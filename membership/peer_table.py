@@ -1,4 +1,5 @@
 import threading
+import time
 from typing import Dict, List, Optional
 from membership.peer import Peer
 
@@ -11,6 +12,10 @@ class PeerTable:
     - Store peer identity and liveness state
     - Insert new peers without overwriting existing state
     - Provide read-only snapshots for gossip / replies
+
+    The peer dict is copy-on-write: writers build a new dict under the lock
+    and swap the reference, so readers never take the lock and always see a
+    consistent snapshot.
     """
 
     def __init__(self, self_node_id: str):
@@ -18,6 +23,9 @@ class PeerTable:
         self._lock = threading.Lock()
         self._peers: Dict[str, Peer] = {}
 
+        # Bumped on every membership change (used to cache derived views)
+        self._version = 0
+
     def add_peer(self, peer: Peer) -> bool:
         """
         Add a new peer if not already present.
@@ -28,29 +36,63 @@ class PeerTable:
         if peer.node_id == self._self_node_id:
             return False
 
+        if peer.node_id in self._peers:
+            return False
+
         with self._lock:
-            if peer.node_id in self._peers:
+            peers = self._peers
+            if peer.node_id in peers:
                 return False
 
-            self._peers[peer.node_id] = peer
+            new_peers = dict(peers)
+            new_peers[peer.node_id] = peer
+            self._peers = new_peers
+            self._version += 1
             return True
 
+    def add_peer_by_id(self, node_id: str, host: str, port: int) -> Optional[Peer]:
+        """
+        Add a peer given its address, building the Peer only if it is
+        neither this node nor already known (the common case for repeated
+        JOIN_REQUEST / PEER_LIST announcements).
+
+        Returns the new Peer if it was added, None otherwise.
+        """
+        if node_id == self._self_node_id or node_id in self._peers:
+            return None
+
+        peer = Peer.new(node_id=node_id, host=host, port=port)
+        return peer if self.add_peer(peer) else None
+
+    def version(self) -> int:
+        """
+        Return a counter incremented each time the peer set changes.
+        """
+        return self._version
+
     def get_peer(self, node_id: str) -> Optional[Peer]:
-        with self._lock:
-            return self._peers.get(node_id)
+        return self._peers.get(node_id)
 
-    def update_heartbeat(self, node_id: str, timestamp: float) -> None:
-        with self._lock:
-            peer = self._peers.get(node_id)
-            if peer is None:
-                return
+    def update_heartbeat(self, node_id: str, timestamp_ns: Optional[int] = None) -> None:
+        """
+        Record a heartbeat for a known peer and mark it alive.
 
-            peer.last_heartbeat = timestamp
+        timestamp_ns is a time.monotonic_ns() value; defaults to now.
+        """
+        if timestamp_ns is None:
+            timestamp_ns = time.monotonic_ns()
+
+        peer = self._peers.get(node_id)
+        if peer is None:
+            return
+
+        # Liveness fields are mutated in place; the lock serializes writers
+        with self._lock:
+            peer.last_heartbeat_ns = timestamp_ns
             peer.status = "alive"
 
     def list_peers(self) -> List[Peer]:
         """
         Return a snapshot list of all known peers.
         """
-        with self._lock:
-            return list(self._peers.values())
+        return list(self._peers.values())
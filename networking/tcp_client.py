@@ -1,15 +1,49 @@
+import collections
 import json
-import queue
+import logging
+import random
 import selectors
 import socket
 import struct
 import threading
 import time
 from dataclasses import dataclass
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 
+try:
+    import orjson
+except ImportError:  # optional C-accelerated encoder
+    orjson = None
 
-@dataclass(frozen=True)
+from protocol.message import Serializable
+
+
+# 4-byte big-endian length prefix of a frame
+_LEN = struct.Struct(">I")
+
+# Scatter-gather writes are POSIX-only
+_HAS_SENDMSG = hasattr(socket.socket, "sendmsg")
+
+# Kernel-side coalescing of back-to-back writes (Linux only)
+_HAS_CORK = hasattr(socket, "TCP_CORK")
+
+_log = logging.getLogger(__name__)
+
+# Upper bounds for coalescing queued frames into a single sendall()
+_MAX_BATCH_FRAMES = 64
+_MAX_BATCH_BYTES = 256 * 1024
+
+# Initial size of the per-worker framing buffer used without sendmsg()
+_SEND_BUF_INITIAL = 64 * 1024
+
+# Peer address cache: successful lookups are reused for _ADDR_TTL_S;
+# failed lookups (and addresses that fail to connect) are retried after
+# _NEGATIVE_ADDR_TTL_S so reconnect loops do not hammer DNS.
+_ADDR_TTL_S = 30.0
+_NEGATIVE_ADDR_TTL_S = 5.0
+
+
+@dataclass(frozen=True, slots=True)
 class Peer:
     node_id: str
     host: str
@@ -28,7 +62,9 @@ class TcpClient:
 
     Public API:
     - add_peer(peer), remove_peer(peer_id)
-    - send_json(peer_id, obj)
+    - send_json(peer_id, obj), send_raw(peer_id, payload)
+    - send_raw_batch(peer_id, payloads)
+    - send_json_many(peer_ids, obj)
     - stop()
     """
 
@@ -103,16 +139,99 @@ class TcpClient:
         - Best-effort: messages may be lost on disconnect/reconnect, but
           the client will not reorder messages that it successfully sends.
 
+        Serializable objects (e.g. Message) are immutable once built and
+        memoize their bytes, so their encoding is deferred to the peer
+        worker, right before the batched send; one that turns out too large
+        is dropped there. Other values are encoded here, so later mutation
+        by the caller cannot change what is sent and errors reach the caller.
+
         Raises:
         - KeyError if peer is unknown.
-        - TypeError if obj is not JSON serializable (or message-like).
+        - TypeError if obj is not JSON serializable.
+        - ValueError if the encoded payload exceeds max_frame_size.
         """
         worker = self._get_worker(peer_id)
+        if isinstance(obj, Serializable):
+            worker.enqueue(obj)
+            return
+
         payload = _serialize_to_json_bytes(obj)
         if len(payload) > self._max_frame_size:
             raise ValueError("payload exceeds maximum frame size")
         worker.enqueue(payload)
 
+    def send_raw(self, peer_id: str, payload: bytes) -> None:
+        """
+        Thread-safe, non-blocking enqueue of an already-encoded JSON payload.
+
+        Lets callers broadcasting one message to many peers encode it once
+        and share the bytes. Same ordering guarantees as send_json().
+
+        Raises:
+        - KeyError if peer is unknown.
+        - TypeError if payload is not bytes.
+        - ValueError if payload exceeds max_frame_size.
+        """
+        worker = self._get_worker(peer_id)
+        if not isinstance(payload, (bytes, bytearray)):
+            raise TypeError(f"payload must be bytes, got {type(payload)}")
+        if len(payload) > self._max_frame_size:
+            raise ValueError("payload exceeds maximum frame size")
+        worker.enqueue(bytes(payload))
+
+    def send_raw_batch(self, peer_id: str, payloads: list[bytes]) -> None:
+        """
+        Thread-safe, non-blocking enqueue of several already-encoded payloads.
+
+        The payloads are queued back to back with a single wakeup, so the
+        worker writes them as one scatter-gather batch. Same ordering
+        guarantees as send_json().
+
+        Raises:
+        - KeyError if peer is unknown.
+        - TypeError if a payload is not bytes.
+        - ValueError if a payload exceeds max_frame_size.
+        """
+        worker = self._get_worker(peer_id)
+        frames = []
+        for payload in payloads:
+            if not isinstance(payload, (bytes, bytearray)):
+                raise TypeError(f"payload must be bytes, got {type(payload)}")
+            if len(payload) > self._max_frame_size:
+                raise ValueError("payload exceeds maximum frame size")
+            frames.append(bytes(payload))
+        if frames:
+            worker.enqueue_many(frames)
+
+    def send_json_many(self, peer_ids: Iterable[str], obj: Any) -> list[str]:
+        """
+        Encode obj once and enqueue the same bytes to every listed peer.
+
+        Fan-out helper for broadcasts (bootstrap, gossip): P peers cost one
+        encoding instead of P. Per-peer ordering is as for send_json().
+
+        Returns the peer_ids that were unknown (nothing was enqueued to them).
+
+        Raises:
+        - TypeError if obj is not JSON serializable.
+        - ValueError if the encoded payload exceeds max_frame_size.
+        """
+        payload = _serialize_to_json_bytes(obj)
+        if len(payload) > self._max_frame_size:
+            raise ValueError("payload exceeds maximum frame size")
+
+        with self._lock:
+            workers = [(pid, self._workers.get(pid)) for pid in peer_ids]
+
+        unknown: list[str] = []
+        for pid, worker in workers:
+            if worker is None:
+                unknown.append(pid)
+                continue
+            worker.enqueue(payload)
+
+        return unknown
+
     def stop(self) -> None:
         """
         Stop all reconnect loops and close all sockets.
@@ -139,15 +258,22 @@ def _serialize_to_json_bytes(obj: Any) -> bytes:
     Serialize to JSON UTF-8 bytes.
 
     Supports:
-    - Objects exposing to_bytes() -> bytes (e.g. your Message class)
+    - bytes, taken as already-encoded JSON (see TcpClient.send_raw)
+    - Serializable objects (e.g. protocol Message) via to_bytes()
     - dict / list / primitives JSON-serializable
     """
-    to_bytes = getattr(obj, "to_bytes", None)
-    if callable(to_bytes):
-        raw = to_bytes()
-        if not isinstance(raw, (bytes, bytearray)):
-            raise TypeError("to_bytes() must return bytes")
-        return bytes(raw)
+    if type(obj) is bytes:
+        return obj
+
+    if isinstance(obj, Serializable):
+        return obj.to_bytes()
+
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            # orjson is stricter (e.g. non-str keys); defer to json below
+            pass
 
     try:
         return json.dumps(obj).encode("utf-8")
@@ -186,10 +312,38 @@ class _PeerWorker:
         self._idle_check_interval_s = idle_check_interval_s
         self._tcp_keepalive = tcp_keepalive
 
-        self._queue: queue.Queue[bytes] = queue.Queue()
+        # Jitter source seeded from OS entropy: every node's worker for the
+        # same restarted peer must draw different delays, or the fleet
+        # still reconnects in lockstep
+        self._rng = random.Random()
+
+        # Send queue of payload bytes and not-yet-encoded Serializables:
+        # deque append/popleft are atomic, _not_empty signals the worker
+        # that new objects are available (or that stop() ran).
+        self._queue: collections.deque[Any] = collections.deque()
+        self._not_empty = threading.Event()
         self._sock_lock = threading.Lock()
         self._sock: Optional[socket.socket] = None
 
+        # Queued objects discarded by _collect_batch() (encode error or
+        # oversize frame); only written by the worker thread.
+        self._dropped = 0
+
+        # Resolved (family, sockaddr) of the peer, or None (negative entry);
+        # only touched by the worker thread.
+        self._addr: Optional[tuple] = None
+        self._addr_expires_at = 0.0
+
+        # Framing buffers reused for the worker's lifetime (only touched by
+        # the worker thread): one length prefix slot per batched frame, and
+        # a contiguous buffer for platforms without sendmsg().
+        self._hdr_buf = bytearray(_LEN.size * _MAX_BATCH_FRAMES)
+        self._send_buf = bytearray(_SEND_BUF_INITIAL)
+
+        # Readability probe for idle closure detection; the current socket
+        # is registered on connect and unregistered on close.
+        self._sel = selectors.DefaultSelector()
+
         self._thread = threading.Thread(
             target=self._run,
             name=f"tcp-peer-{peer.node_id}",
@@ -201,25 +355,42 @@ class _PeerWorker:
     def start(self) -> None:
         self._thread.start()
 
+    @property
+    def dropped(self) -> int:
+        """
+        Number of queued objects dropped because they could not be framed.
+        """
+        return self._dropped
+
     def stop(self) -> None:
         """
         Stop this worker and close its socket. Drops any queued messages.
         """
         self._local_stop.set()
+        self._not_empty.set()
         self._close_socket()
         self._thread.join(timeout=5.0)
 
-        while True:
-            try:
-                self._queue.get_nowait()
-            except queue.Empty:
-                break
+        self._queue.clear()
+
+        try:
+            self._sel.close()
+        except Exception:
+            pass
 
-    def enqueue(self, payload: bytes) -> None:
+    def enqueue(self, obj: Any) -> None:
         """
-        Enqueue a raw JSON payload (already UTF-8 bytes).
+        Enqueue an object to be JSON-encoded and sent by the worker thread.
         """
-        self._queue.put(payload)
+        self._queue.append(obj)
+        self._not_empty.set()
+
+    def enqueue_many(self, objs: list) -> None:
+        """
+        Enqueue several objects with a single wakeup of the worker thread.
+        """
+        self._queue.extend(objs)
+        self._not_empty.set()
 
     def _run(self) -> None:
         backoff_s = self._backoff_initial_s
@@ -232,16 +403,30 @@ class _PeerWorker:
                     continue
                 backoff_s = self._backoff_initial_s
 
+            # Block until a message arrives; the timeout doubles as the idle
+            # interval for detecting server-side closure.
+            if not self._wait_for_messages():
+                if self._detect_server_closed():
+                    self._close_socket()
+                continue
+
             if not self._drain_send_queue_once():
                 self._close_socket()
-                continue
 
-            if self._queue.empty():
-                if self._detect_server_closed():
-                    self._close_socket()
-                    continue
+    def _wait_for_messages(self) -> bool:
+        """
+        Wait up to idle_check_interval_s for queued payloads.
 
-                self._sleep_interruptible(self._idle_check_interval_s)
+        Returns True if the queue is non-empty.
+        """
+        if self._queue:
+            return True
+
+        self._not_empty.wait(timeout=self._idle_check_interval_s)
+        # Clear before re-checking: an append racing with clear() either is
+        # seen below or sets the event again for the next wait.
+        self._not_empty.clear()
+        return bool(self._queue)
 
     def _should_stop(self) -> bool:
         return self._stop_event.is_set() or self._local_stop.is_set()
@@ -249,28 +434,35 @@ class _PeerWorker:
     def _connect(self) -> bool:
         """
         Establish a TCP connection to the peer. Returns True on success.
+
+        The peer address comes from the worker's DNS cache (_resolve), so
+        reconnect attempts normally cost no getaddrinfo() call.
         """
         if self._should_stop():
             return False
 
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(self._connect_timeout_s)
-
-        if self._tcp_keepalive:
-            try:
-                sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
-            except OSError:
-                pass
+        addr = self._resolve()
+        if addr is None:
+            return False
+        family, sockaddr = addr
 
+        sock = socket.socket(family, socket.SOCK_STREAM)
         try:
-            sock.connect((self._peer.host, self._peer.port))
+            sock.settimeout(self._connect_timeout_s)
+            sock.connect(sockaddr)
         except OSError:
-            try:
-                sock.close()
-            except OSError:
-                pass
+            sock.close()
+            # The address may be stale (e.g. a restarted container): look
+            # it up again soon rather than at the end of the positive TTL.
+            self._addr_expires_at = min(
+                self._addr_expires_at,
+                time.monotonic() + _NEGATIVE_ADDR_TTL_S,
+            )
             return False
 
+        # Options are applied only once a connection exists, so failed
+        # attempts during a reconnect storm cost no extra syscalls.
+        self._configure_socket(sock)
         sock.settimeout(self._send_timeout_s)
 
         with self._sock_lock:
@@ -281,43 +473,240 @@ class _PeerWorker:
                     pass
                 return False
             self._sock = sock
+            try:
+                self._sel.register(sock, selectors.EVENT_READ)
+            except (KeyError, ValueError, OSError):
+                pass
 
         return True
 
+    def _resolve(self) -> Optional[tuple]:
+        """
+        Return the peer's (family, sockaddr), resolving it only when the
+        cached entry has expired. Returns None if resolution failed.
+        """
+        now = time.monotonic()
+        if now < self._addr_expires_at:
+            return self._addr
+
+        try:
+            infos = socket.getaddrinfo(
+                self._peer.host,
+                self._peer.port,
+                type=socket.SOCK_STREAM,
+            )
+        except OSError:
+            infos = []
+
+        if infos:
+            family, _type, _proto, _canonname, sockaddr = infos[0]
+            self._addr = (family, sockaddr)
+            self._addr_expires_at = now + _ADDR_TTL_S
+        else:
+            self._addr = None
+            self._addr_expires_at = now + _NEGATIVE_ADDR_TTL_S
+
+        return self._addr
+
+    def _configure_socket(self, sock: socket.socket) -> None:
+        """
+        Apply per-connection socket options (best-effort).
+        """
+        if self._tcp_keepalive:
+            try:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            except OSError:
+                pass
+
+        # Frames are coalesced in user space; disable Nagle so small
+        # messages are not delayed waiting for ACKs.
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except OSError:
+            pass
+
     def _drain_send_queue_once(self) -> bool:
         """
         Attempt to send queued messages until the queue is empty or a send fails.
 
+        All frames currently queued (up to a bounded batch) are coalesced into
+        a single sendall() to collapse N syscalls into one. A lone frame is sent
+        directly, so an isolated message pays no extra latency.
+
+        When a burst spans several batches, the socket is corked (TCP_CORK)
+        until the queue is drained so the kernel packs the writes into full
+        segments instead of emitting a short packet per batch.
+
         Returns True if still connected and no send failure occurred.
         Returns False if the connection appears broken.
         """
-        while not self._should_stop():
-            try:
-                payload = self._queue.get_nowait()
-            except queue.Empty:
-                return True
+        corked = False
+        try:
+            while not self._should_stop():
+                batch = self._collect_batch()
+                if not batch:
+                    return True
+
+                if not corked and self._queue:
+                    # More batches follow this one
+                    corked = self._set_cork(True)
+
+                if len(batch) == 1:
+                    ok = self._send_frame(batch[0])
+                else:
+                    ok = self._send_batch(batch)
+                if not ok:
+                    return False
 
-            ok = self._send_frame(payload)
-            if not ok:
-                return False
+            return True
+        finally:
+            if corked:
+                # Uncorking flushes any partial segment immediately
+                self._set_cork(False)
+
+    def _set_cork(self, enabled: bool) -> bool:
+        """
+        Toggle TCP_CORK on the current socket (best-effort).
+        Returns True if the option was applied.
+        """
+        if not _HAS_CORK:
+            return False
+
+        sock = self._get_socket()
+        if sock is None:
+            return False
 
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_CORK, 1 if enabled else 0)
+        except OSError:
+            return False
         return True
 
+    def _collect_batch(self) -> list[bytes]:
+        """
+        Pop queued objects in FIFO order and encode them, bounded by
+        _MAX_BATCH_FRAMES and _MAX_BATCH_BYTES.
+
+        Objects that cannot be encoded or exceed max_frame_size are dropped
+        and counted in dropped; one bad object never stops the worker.
+        """
+        batch: list[bytes] = []
+        size = 0
+
+        while len(batch) < _MAX_BATCH_FRAMES and size < _MAX_BATCH_BYTES:
+            try:
+                obj = self._queue.popleft()
+            except IndexError:
+                break
+
+            try:
+                payload = _serialize_to_json_bytes(obj)
+            except Exception:
+                self._drop(obj, "encode failed", exc_info=True)
+                continue
+            if len(payload) > self._max_frame_size:
+                self._drop(obj, f"{len(payload)} bytes exceeds max_frame_size")
+                continue
+
+            batch.append(payload)
+            size += len(payload)
+
+        return batch
+
+    def _drop(self, obj: Any, reason: str, exc_info: bool = False) -> None:
+        self._dropped += 1
+        _log.debug(
+            "Dropping %s queued for peer %s: %s (dropped=%d)",
+            type(obj).__name__,
+            self._peer.node_id,
+            reason,
+            self._dropped,
+            exc_info=exc_info,
+        )
+
     def _send_frame(self, payload: bytes) -> bool:
         """
         Send one length-prefixed frame. Returns False on broken connection.
         """
-        if len(payload) > self._max_frame_size:
+        return self._send_batch((payload,))
+
+    def _send_batch(self, payloads) -> bool:
+        """
+        Send several length-prefixed frames in one write.
+        Returns False on broken connection.
+
+        Length prefixes are packed into the worker's preallocated header
+        buffer, so framing allocates no per-frame bytes objects. Where
+        sendmsg() is unavailable the frames are copied into a reusable
+        send buffer and written with a single sendall().
+        """
+        if not _HAS_SENDMSG:
+            return self._send_joined(payloads)
+
+        hdr_buf = self._hdr_buf
+        hdr_view = memoryview(hdr_buf)
+        buffers = []
+        off = 0
+        for payload in payloads:
+            _LEN.pack_into(hdr_buf, off, len(payload))
+            buffers.append(hdr_view[off:off + _LEN.size])
+            buffers.append(payload)
+            off += _LEN.size
+        return self._send_buffers(buffers)
+
+    def _send_joined(self, payloads) -> bool:
+        """
+        Frame payloads into the reusable send buffer and sendall() it.
+        Returns False on broken connection.
+        """
+        total = 0
+        for payload in payloads:
+            total += _LEN.size + len(payload)
+
+        if len(self._send_buf) < total:
+            # Replaced rather than resized: exported views may still exist
+            self._send_buf = bytearray(total)
+        buf = self._send_buf
+
+        off = 0
+        for payload in payloads:
+            n = len(payload)
+            _LEN.pack_into(buf, off, n)
+            off += _LEN.size
+            buf[off:off + n] = payload
+            off += n
+
+        sock = self._get_socket()
+        if sock is None:
+            return False
+
+        try:
+            sock.sendall(memoryview(buf)[:total])
             return True
+        except (BrokenPipeError, ConnectionResetError, TimeoutError, OSError):
+            return False
 
-        frame = struct.pack(">I", len(payload)) + payload
+    def _send_buffers(self, buffers: list) -> bool:
+        """
+        Write all buffers in order with scatter-gather sendmsg(), so headers
+        and payloads are never concatenated; partial writes are resumed.
 
+        Returns False on broken connection.
+        """
         sock = self._get_socket()
         if sock is None:
             return False
 
         try:
-            sock.sendall(frame)
+            views = [memoryview(b) for b in buffers]
+            i = 0
+            while i < len(views):
+                sent = sock.sendmsg(views[i:])
+                while i < len(views) and sent >= len(views[i]):
+                    sent -= len(views[i])
+                    i += 1
+                if sent:
+                    views[i] = views[i][sent:]
             return True
         except (BrokenPipeError, ConnectionResetError, TimeoutError, OSError):
             return False
@@ -326,32 +715,24 @@ class _PeerWorker:
         """
         Best-effort detection of server-side closure while idle.
 
-        Uses a selector to check readability; if readable, we peek 1 byte.
-        If peek returns b"", the peer closed the connection.
+        Uses the worker's selector to check readability; if readable, we
+        peek 1 byte. If peek returns b"", the peer closed the connection.
 
         Returns True if the server side is considered closed.
         """
-        sock = self._get_socket()
-        if sock is None:
-            return True
+        with self._sock_lock:
+            sock = self._sock
+            if sock is None:
+                return True
 
-        try:
-            sel = selectors.DefaultSelector()
             try:
-                sel.register(sock, selectors.EVENT_READ)
-                events = sel.select(timeout=0.0)
-                if not events:
+                if not self._sel.select(timeout=0.0):
                     return False
 
                 data = sock.recv(1, socket.MSG_PEEK)
                 return data == b""
-            finally:
-                try:
-                    sel.close()
-                except Exception:
-                    pass
-        except (ConnectionResetError, OSError):
-            return True
+            except (ConnectionResetError, OSError):
+                return True
 
     def _get_socket(self) -> Optional[socket.socket]:
         with self._sock_lock:
@@ -361,6 +742,11 @@ class _PeerWorker:
         with self._sock_lock:
             sock = self._sock
             self._sock = None
+            if sock is not None:
+                try:
+                    self._sel.unregister(sock)
+                except (KeyError, ValueError, OSError):
+                    pass
 
         if sock is not None:
             try:
@@ -373,12 +759,17 @@ class _PeerWorker:
                 pass
 
     def _sleep_backoff(self, backoff_s: float) -> None:
-        self._sleep_interruptible(backoff_s)
+        jittered = backoff_s + self._rng.uniform(0.0, self._backoff_initial_s)
+        if jittered > self._backoff_max_s:
+            jittered = self._backoff_max_s
+        self._sleep_interruptible(jittered)
 
     def _sleep_interruptible(self, seconds: float) -> None:
-        end = time.time() + seconds
-        while time.time() < end and not self._should_stop():
-            time.sleep(0.05)
+        # stop() always sets _local_stop (TcpClient.stop() stops every
+        # worker), so waiting on it wakes up immediately on shutdown.
+        if self._stop_event.is_set():
+            return
+        self._local_stop.wait(timeout=seconds)
 
     def _next_backoff(self, current: float) -> float:
         if self._backoff_mode == "linear":
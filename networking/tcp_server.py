@@ -1,7 +1,22 @@
+import os
+import selectors
 import socket
 import struct
 import threading
-from typing import Optional, Protocol
+from typing import Optional, Protocol, Sequence
+
+
+# 4-byte big-endian length prefix of a frame
+_LEN = struct.Struct(">I")
+
+# Maximum bytes pulled from a connection per readiness event
+_RECV_CHUNK = 64 * 1024
+
+# Kernel-side load balancing of accepts across listening sockets (Linux/BSD)
+_HAS_REUSEPORT = hasattr(socket, "SO_REUSEPORT")
+
+# Per-thread CPU pinning (Linux)
+_HAS_SETAFFINITY = hasattr(os, "sched_setaffinity")
 
 
 class Dispatcher(Protocol):
@@ -12,17 +27,282 @@ class Dispatcher(Protocol):
         ...
 
 
+class _Connection:
+    """
+    Per-connection framing state owned by a reactor thread.
+
+    - buf holds bytes received in bulk that are not yet part of a frame.
+    - expected is None while the 4-byte header is still being read,
+      otherwise it holds the payload length of the frame in progress.
+    - frame/filled: when a payload is larger than what is buffered, it is
+      preallocated once and the remainder is read into it with recv_into().
+    """
+
+    __slots__ = ("sock", "buf", "expected", "frame", "filled")
+
+    def __init__(self, sock: socket.socket):
+        self.sock = sock
+        self.buf = bytearray()
+        self.expected: Optional[int] = None
+        self.frame: Optional[bytearray] = None
+        self.filled = 0
+
+
+class _Reactor:
+    """
+    One selector-driven event loop thread.
+
+    Owns a listening socket (its own SO_REUSEPORT socket, or one shared
+    with the other reactors), a selector, and the connections it accepted.
+    """
+
+    def __init__(
+        self,
+        server: "TcpServer",
+        listen_sock: socket.socket,
+        name: str,
+        cpu: Optional[int] = None,
+    ):
+        self._server = server
+        self.listen_sock = listen_sock
+        self._cpu = cpu
+
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(listen_sock, selectors.EVENT_READ, None)
+
+        # Active connections (touched only by this reactor's thread)
+        self._connections: dict[socket.socket, _Connection] = {}
+
+        # recv_into() target shared by this reactor's connections: only one
+        # is read at a time, so no bytes object is allocated per recv
+        self._scratch = bytearray(_RECV_CHUNK)
+        self._scratch_view = memoryview(self._scratch)
+
+        self.thread = threading.Thread(
+            target=self._loop,
+            name=name,
+            daemon=True,
+        )
+
+    def _loop(self) -> None:
+        """
+        Wait for readiness on the listening socket and on every accepted
+        connection, accepting new peers and feeding received bytes to the
+        per-connection framing state machine.
+        """
+        server = self._server
+        sel = self._selector
+        poll_timeout_s = min(server._recv_timeout_s, server._accept_timeout_s)
+
+        if self._cpu is not None and _HAS_SETAFFINITY:
+            try:
+                # pid 0 is the calling thread on Linux
+                os.sched_setaffinity(0, {self._cpu})
+            except OSError:
+                # CPU not in this process' allowed set: run unpinned
+                pass
+
+        try:
+            while not server._stop_event.is_set():
+                try:
+                    events = sel.select(timeout=poll_timeout_s)
+                except OSError:
+                    break
+
+                for key, _mask in events:
+                    if key.data is None:
+                        self._accept_ready()
+                    else:
+                        self._read_ready(key.data)
+        finally:
+            self._shutdown()
+
+    def _accept_ready(self) -> None:
+        """
+        Accept one pending connection on the listening socket.
+
+        The selector is level-triggered: if more connections are queued
+        the listening socket is reported ready again on the next select(),
+        so there is no inner loop ending in a wasted EAGAIN accept(), and
+        reactors sharing a listening socket are not starved.
+        """
+        try:
+            conn, _addr = self.listen_sock.accept()
+        except (BlockingIOError, InterruptedError):
+            # Nothing pending (or another reactor sharing the socket won)
+            return
+        except OSError:
+            return
+
+        conn.setblocking(False)
+
+        try:
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except OSError:
+            pass
+
+        state = _Connection(conn)
+        self._connections[conn] = state
+        self._selector.register(conn, selectors.EVENT_READ, state)
+
+    def _read_ready(self, state: _Connection) -> None:
+        """
+        Drain readable bytes from a connection and dispatch complete frames.
+        """
+        if state.frame is not None:
+            self._read_into_frame(state)
+            return
+
+        try:
+            got = state.sock.recv_into(self._scratch)
+        except (BlockingIOError, InterruptedError):
+            return
+        except (ConnectionResetError, OSError):
+            self._close_connection(state)
+            return
+
+        if got == 0:
+            # Peer closed connection
+            self._close_connection(state)
+            return
+
+        state.buf += self._scratch_view[:got]
+
+        for frame in self._extract_frames(state):
+            if frame is None:
+                # Framing error: protocol violation
+                self._close_connection(state)
+                return
+            self._server._handle_frame(frame)
+
+    def _read_into_frame(self, state: _Connection) -> None:
+        """
+        Fill the preallocated payload buffer of a partially received frame.
+        """
+        frame = state.frame
+        assert frame is not None
+
+        try:
+            got = state.sock.recv_into(memoryview(frame)[state.filled:])
+        except (BlockingIOError, InterruptedError):
+            return
+        except (ConnectionResetError, OSError):
+            self._close_connection(state)
+            return
+
+        if got == 0:
+            # Peer closed connection
+            self._close_connection(state)
+            return
+
+        state.filled += got
+        if state.filled < len(frame):
+            return
+
+        state.frame = None
+        state.filled = 0
+        state.expected = None
+        self._server._handle_frame(frame)
+
+    def _extract_frames(self, state: _Connection):
+        """
+        Yield complete payloads buffered on a connection.
+
+        Frame format:
+        - 4-byte unsigned integer (big-endian) indicating payload length
+        - payload bytes
+
+        If the buffered bytes hold only part of a payload, the payload buffer
+        is preallocated and the rest is read by _read_into_frame().
+
+        Yields None (and stops) if a frame exceeds max_frame_size.
+        """
+        buf = state.buf
+        max_frame_size = self._server._max_frame_size
+
+        while True:
+            if state.expected is None:
+                if len(buf) < _LEN.size:
+                    return
+                length = _LEN.unpack_from(buf, 0)[0]
+                del buf[:_LEN.size]
+
+                if length > max_frame_size:
+                    yield None
+                    return
+                state.expected = length
+
+            length = state.expected
+            if len(buf) < length:
+                frame = bytearray(length)
+                frame[:len(buf)] = buf
+                state.frame = frame
+                state.filled = len(buf)
+                buf.clear()
+                return
+
+            frame = bytes(buf[:length])
+            del buf[:length]
+            state.expected = None
+            yield frame
+
+    def _close_connection(self, state: _Connection) -> None:
+        self._connections.pop(state.sock, None)
+
+        try:
+            self._selector.unregister(state.sock)
+        except (KeyError, ValueError):
+            pass
+
+        try:
+            state.sock.close()
+        except OSError:
+            pass
+
+    def _shutdown(self) -> None:
+        """
+        Close all connections and the selector. Runs on the reactor thread
+        when the loop exits; the listening socket is closed by the server.
+        """
+        for state in list(self._connections.values()):
+            try:
+                state.sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            self._close_connection(state)
+
+        self._connections.clear()
+
+        try:
+            self._selector.close()
+        except Exception:
+            pass
+
+
 class TcpServer:
     """
-    Multi-threaded TCP server using a length-prefixed framing protocol.
+    Event-driven TCP server using a length-prefixed framing protocol.
 
     Responsibilities:
     - Accept incoming TCP connections.
-    - Spawn one thread per connection.
+    - Multiplex connections on selector-driven reactor threads.
     - Read framed messages from each connection.
     - Decode messages and hand them off to the dispatcher.
     - Track active connections for graceful shutdown.
 
+    All sockets are non-blocking and owned by the reactor that accepted
+    them; the dispatcher is invoked synchronously from that reactor.
+
+    With reactor_threads > 1, each reactor binds its own SO_REUSEPORT
+    listening socket so the kernel spreads accepts across them. Where
+    SO_REUSEPORT is unavailable the reactors share one listening socket.
+    The dispatcher must then be safe to call from several threads.
+
+    cpu_affinity optionally pins reactor i to CPU cpu_affinity[i % len]
+    (Linux only; ignored elsewhere), so a connection's socket state stays
+    on the core that accepted it. Pair it with NIC IRQ pinning to keep
+    packet processing on the same core.
+
     The server does NOT interpret message semantics.
     """
 
@@ -35,7 +315,14 @@ class TcpServer:
         accept_timeout_s: float = 1.0,
         max_frame_size: int = 1024 * 1024,
         backlog: int = 128,
+        reactor_threads: int = 1,
+        cpu_affinity: Optional[Sequence[int]] = None,
     ):
+        if reactor_threads < 1:
+            raise ValueError("reactor_threads must be >= 1")
+        if cpu_affinity is not None and len(cpu_affinity) == 0:
+            raise ValueError("cpu_affinity must name at least one CPU")
+
         # Network binding parameters
         self._host = host
         self._port = port
@@ -43,100 +330,87 @@ class TcpServer:
         # Dispatcher responsible for routing decoded messages
         self._dispatcher = dispatcher
 
-        # Socket timeouts and limits
+        # Socket timeouts and limits.
+        # The reactors never block in recv/accept; these bound how long
+        # select() waits before re-checking the stop flag.
         self._recv_timeout_s = recv_timeout_s
         self._accept_timeout_s = accept_timeout_s
         self._max_frame_size = max_frame_size
         self._backlog = backlog
+        self._reactor_threads = reactor_threads
+        self._cpu_affinity = tuple(cpu_affinity) if cpu_affinity is not None else None
 
         # Shutdown coordination
         self._stop_event = threading.Event()
 
-        # Listening socket and accept thread
+        # Listening sockets (the first one is exposed as _server_sock)
         self._server_sock: Optional[socket.socket] = None
-        self._accept_thread: Optional[threading.Thread] = None
+        self._listen_socks: list[socket.socket] = []
 
-        # Tracking of active connections and threads
-        self._lock = threading.Lock()
-        self._connections: set[socket.socket] = set()
-        self._conn_threads: set[threading.Thread] = set()
+        # Reactor threads
+        self._reactors: list[_Reactor] = []
 
     def start(self) -> None:
         """
         Start the TCP server.
 
-        Creates the listening socket and launches the accept loop
-        in a dedicated daemon thread.
+        Creates the listening socket(s) and launches the reactor loops
+        in dedicated daemon threads.
         """
-        if self._accept_thread is not None:
+        if self._reactors:
             raise RuntimeError("Server already started")
 
         self._stop_event.clear()
 
-        # Create, bind, and configure listening socket
-        server_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        server_sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        server_sock.bind((self._host, self._port))
-        server_sock.listen(self._backlog)
-        server_sock.settimeout(self._accept_timeout_s)
+        reuse_port = self._reactor_threads > 1 and _HAS_REUSEPORT
 
-        self._server_sock = server_sock
+        # The first bind may pick an ephemeral port; the rest reuse it
+        first = self._make_listen_socket(self._port, reuse_port)
+        self._server_sock = first
+        self._listen_socks = [first]
 
-        # Start accept loop in a dedicated thread
-        t = threading.Thread(
-            target=self._accept_loop,
-            name="tcp-accept",
-            daemon=True,
-        )
-        self._accept_thread = t
-        t.start()
+        if reuse_port:
+            bound_port = first.getsockname()[1]
+            try:
+                for _ in range(self._reactor_threads - 1):
+                    self._listen_socks.append(
+                        self._make_listen_socket(bound_port, reuse_port)
+                    )
+            except OSError:
+                for sock in self._listen_socks:
+                    sock.close()
+                self._listen_socks = []
+                self._server_sock = None
+                raise
+
+        cpus = self._cpu_affinity
+        for i in range(self._reactor_threads):
+            listen_sock = self._listen_socks[i % len(self._listen_socks)]
+            cpu = cpus[i % len(cpus)] if cpus else None
+            self._reactors.append(_Reactor(self, listen_sock, f"tcp-reactor-{i}", cpu))
+
+        for reactor in self._reactors:
+            reactor.thread.start()
 
     def stop(self) -> None:
         """
         Gracefully stop the server.
 
-        Signals all threads to stop, closes the listening socket,
-        shuts down all active connections, and joins all threads.
+        Signals the reactors to stop, waits for them to close all active
+        connections, then closes the listening socket(s).
         """
         self._stop_event.set()
 
-        # Close listening socket to unblock accept()
-        if self._server_sock is not None:
-            try:
-                self._server_sock.close()
-            except OSError:
-                pass
-
-        # Snapshot active connections and close them
-        with self._lock:
-            conns = list(self._connections)
+        for reactor in self._reactors:
+            reactor.thread.join(timeout=5.0)
+        self._reactors = []
 
-        for conn in conns:
+        for sock in self._listen_socks:
             try:
-                conn.shutdown(socket.SHUT_RDWR)
+                sock.close()
             except OSError:
                 pass
-            try:
-                conn.close()
-            except OSError:
-                pass
-
-        # Wait for accept thread to terminate
-        if self._accept_thread is not None:
-            self._accept_thread.join(timeout=5.0)
-            self._accept_thread = None
-
-        # Wait for all connection threads to terminate
-        with self._lock:
-            threads = list(self._conn_threads)
-
-        for t in threads:
-            t.join(timeout=5.0)
-
-        # Cleanup internal state
-        with self._lock:
-            self._connections.clear()
-            self._conn_threads.clear()
+        self._listen_socks = []
 
         self._server_sock = None
 
@@ -150,135 +424,31 @@ class TcpServer:
         self.stop()
         return False
 
-    def _accept_loop(self) -> None:
-        """
-        Accept loop running in a dedicated thread.
-
-        Accepts incoming connections and spawns one thread per
-        connection to handle message reception.
+    def _make_listen_socket(self, port: int, reuse_port: bool) -> socket.socket:
         """
-        assert self._server_sock is not None
-
-        while not self._stop_event.is_set():
-            try:
-                conn, _addr = self._server_sock.accept()
-            except socket.timeout:
-                continue
-            except OSError:
-                # Socket closed during shutdown
-                break
-
-            # Configure per-connection timeout
-            conn.settimeout(self._recv_timeout_s)
-
-            with self._lock:
-                self._connections.add(conn)
-
-            # Start per-connection receive loop
-            t = threading.Thread(
-                target=self._connection_loop,
-                args=(conn,),
-                name="tcp-conn",
-                daemon=True,
-            )
-            with self._lock:
-                self._conn_threads.add(t)
-            t.start()
-
-    def _connection_loop(self, conn: socket.socket) -> None:
-        """
-        Per-connection receive loop.
-
-        Reads framed messages from the socket, decodes them,
-        and forwards them to the dispatcher.
+        Create, bind, and configure a non-blocking listening socket.
         """
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if reuse_port:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        sock.bind((self._host, port))
+        sock.listen(self._backlog)
+        sock.setblocking(False)
+        return sock
+
+    def _handle_frame(self, frame) -> None:
         try:
-            while not self._stop_event.is_set():
-                frame = self._read_frame(conn)
-                if frame is None:
-                    # Connection closed or framing error
-                    break
-
-                try:
-                    msg = self._decode_message(frame)
-                except Exception:
-                    # Malformed message: ignore and continue
-                    continue
-
-                try:
-                    self._dispatcher.dispatch(msg)
-                except Exception:
-                    # Handler errors are not the server's concern
-                    continue
-        finally:
-            # Remove connection from tracking and close socket
-            with self._lock:
-                self._connections.discard(conn)
-
-            try:
-                conn.close()
-            except OSError:
-                pass
-
-            current = threading.current_thread()
-            with self._lock:
-                self._conn_threads.discard(current)
-
-    def _read_frame(self, conn: socket.socket) -> Optional[bytes]:
-        """
-        Read a single length-prefixed frame from the socket.
-
-        Frame format:
-        - 4-byte unsigned integer (big-endian) indicating payload length
-        - payload bytes
-
-        Returns:
-            The payload bytes, or None if the connection is closed or invalid.
-        """
-        header = self._recv_exact(conn, 4)
-        if header is None:
-            return None
-
-        length = struct.unpack(">I", header)[0]
-        if length == 0:
-            return b""
-
-        if length > self._max_frame_size:
-            # Frame too large: protocol violation
-            return None
-
-        payload = self._recv_exact(conn, length)
-        return payload
-
-    def _recv_exact(self, conn: socket.socket, n: int) -> Optional[bytes]:
-        """
-        Receive exactly n bytes from the socket.
+            msg = self._decode_message(frame)
+        except Exception:
+            # Malformed message: ignore and continue
+            return
 
-        Handles partial reads and timeouts.
-        Returns None if the connection is closed or interrupted.
-        """
-        chunks: list[bytes] = []
-        received = 0
-
-        while received < n and not self._stop_event.is_set():
-            try:
-                chunk = conn.recv(n - received)
-            except socket.timeout:
-                continue
-            except (ConnectionResetError, OSError):
-                return None
-
-            if chunk == b"":
-                # Peer closed connection
-                return None
-
-            chunks.append(chunk)
-            received += len(chunk)
-
-        if received < n:
-            return None
-
-        return b"".join(chunks)
+        try:
+            self._dispatcher.dispatch(msg)
+        except Exception:
+            # Handler errors are not the server's concern
+            return
 
     def _decode_message(self, frame: bytes):
         """
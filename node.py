@@ -4,7 +4,7 @@ import sys
 import time
 import logging
 import threading
-from queue import Queue
+import functools
 from dotenv import load_dotenv
 
 # --------------------------------------------------
@@ -44,7 +44,8 @@ threading.excepthook = thread_exception_hook
 # --------------------------------------------------
 
 from utils.config import load_config
-from utils.logging import setup_logging, get_logger
+from utils.logging import setup_logging, stop_logging, get_logger
+from utils.ring_queue import RingQueue
 
 from protocol.setup import setup_protocol
 from protocol.message import Message
@@ -64,9 +65,21 @@ from webapi.http_api import WebAPIServer
 
 load_dotenv()
 
+# Bound on buffered sensor events; the oldest are dropped when full
+SENSOR_EVENT_QUEUE_MAXLEN = 10000
+
+
+@functools.lru_cache(maxsize=1024)
+def _resolve_peer_host(node_id: str, host: str) -> str:
+	# If peer advertised bind-all, it's not connectable from other containers.
+	# In Docker networks, the service/container DNS name is usually the node_id.
+	if host == "0.0.0.0":
+		return node_id
+	return host
+
 
 def _make_join_request(self_node_id: str, host: str, port: int) -> Message:
-	return Message(
+	return Message.new_trusted(
 		msg_type=MessageType.JOIN_REQUEST,
 		sender_id=self_node_id,
 		payload={
@@ -77,18 +90,28 @@ def _make_join_request(self_node_id: str, host: str, port: int) -> Message:
 	)
 
 
-def bootstrap(self_node_id: str, host: str, port: int, peers, send, log) -> None:
+def bootstrap(self_node_id: str, host: str, port: int, peers, send_many, log) -> None:
+	"""
+	Send the same JOIN_REQUEST to every bootstrap peer.
+
+	send_many(peer_ids, msg) -> unknown peer_ids: the message is encoded
+	once and the bytes are shared across peers. Sending only enqueues;
+	connects run in parallel on the per-peer TcpClient workers, so an
+	unreachable peer does not delay the others.
+	"""
 	join_msg = _make_join_request(self_node_id=self_node_id, host=host, port=port)
 
+	try:
+		unknown = set(send_many([peer.node_id for peer in peers], join_msg))
+	except Exception:
+		log.error("JOIN_REQUEST fan-out failed", exc_info=True)
+		return
+
 	for peer in peers:
-		try:
-			send(peer.node_id, join_msg)
-			log.info(f"Sent JOIN_REQUEST to {peer.host}:{peer.port}")
-		except Exception:
-			log.error(
-				f"JOIN_REQUEST failed to {peer.host}:{peer.port}",
-				exc_info=True,
-			)
+		if peer.node_id in unknown:
+			log.error("JOIN_REQUEST failed to %s:%d (unknown peer)", peer.host, peer.port)
+		else:
+			log.info("Sent JOIN_REQUEST to %s:%d", peer.host, peer.port)
 
 
 def main():
@@ -113,7 +136,8 @@ def main():
 				pass
 		except OSError:
 			_bootstrap_log.error(
-				f"Failed to clear log file {config.log_file}",
+				"Failed to clear log file %s",
+				config.log_file,
 				exc_info=True,
 			)
 
@@ -137,7 +161,8 @@ def main():
 	# --------------------------------------------------
 	# State (LWW) - start early
 	# --------------------------------------------------
-	sensor_event_queue = Queue()
+	# Sensor threads produce, the state worker consumes; lock-free on put
+	sensor_event_queue = RingQueue(maxlen=SENSOR_EVENT_QUEUE_MAXLEN)
 
 	state_worker = NodeStateWorker(
 		node_id=config.node_id,
@@ -157,22 +182,23 @@ def main():
 	client_lock = threading.Lock()
 
 	def _ensure_client_peer(node_id: str, host: str, port: int) -> None:
+		# Fast path without the lock: set membership is atomic under the GIL
+		# and peers are only ever added, so a hit is final.
+		if node_id in known_client_peers:
+			return
+
+		try_host = _resolve_peer_host(node_id, host)
+
 		with client_lock:
+			# Re-check: another thread may have added it meanwhile
 			if node_id in known_client_peers:
 				return
 
-		try_host = host
-		# If peer advertised bind-all, it's not connectable from other containers.
-		# In Docker networks, the service/container DNS name is usually the node_id.
-		if try_host == "0.0.0.0":
-			try_host = node_id
-
-		try:
-			client.add_peer(TcpPeer(node_id=node_id, host=try_host, port=port))
-		except RuntimeError:
-			pass
+			try:
+				client.add_peer(TcpPeer(node_id=node_id, host=try_host, port=port))
+			except RuntimeError:
+				pass
 
-		with client_lock:
 			known_client_peers.add(node_id)
 
 	def on_peer_discovered(peer: MembershipPeer) -> None:
@@ -189,10 +215,13 @@ def main():
 		)
 		try:
 			client.send_json(peer.node_id, join_msg)
-			log.info(f"Discovery JOIN_REQUEST sent to {peer.node_id} {peer.host}:{peer.port}")
+			log.info("Discovery JOIN_REQUEST sent to %s %s:%d", peer.node_id, peer.host, peer.port)
 		except Exception:
 			log.warning(
-				f"Discovery JOIN_REQUEST failed to {peer.node_id} {peer.host}:{peer.port}",
+				"Discovery JOIN_REQUEST failed to %s %s:%d",
+				peer.node_id,
+				peer.host,
+				peer.port,
 				exc_info=True,
 			)
 
@@ -217,10 +246,14 @@ def main():
 		log.critical("Failed to setup protocol", exc_info=True)
 		raise
 
+	reactor_threads = config.reactor_threads
+
 	server = TcpServer(
 		host=config.host,
 		port=config.port,
 		dispatcher=dispatcher,
+		reactor_threads=reactor_threads,
+		cpu_affinity=config.reactor_cpus,
 	)
 
 	try:
@@ -229,7 +262,12 @@ def main():
 		log.critical("Failed to start TCP server", exc_info=True)
 		raise
 
-	log.info(f"Node listening on {config.host}:{config.port}")
+	log.info(
+		"Node listening on %s:%d (reactor_threads=%d)",
+		config.host,
+		config.port,
+		reactor_threads,
+	)
 
 	# --------------------------------------------------
 	# Seed membership with bootstrap peers (best-effort)
@@ -255,7 +293,7 @@ def main():
 			host=config.host,
 			port=config.port,
 			peers=bootstrap_peers,
-			send=client.send_json,
+			send_many=client.send_json_many,
 			log=log,
 		)
 	else:
@@ -265,10 +303,13 @@ def main():
 	# Sensor subsystem
 	# --------------------------------------------------
 	try:
-		sensor_manager = SensorManager(callback=sensor_event_queue.put)
+		sensor_manager = SensorManager(
+			callback=sensor_event_queue.put,
+			batch_callback=sensor_event_queue.put_many,
+		)
 		sensor_manager.load_from_env()
 		sensor_manager.start_all()
-		log.info(f"Started {len(sensor_manager.sensors)} sensors")
+		log.info("Started %d sensors", len(sensor_manager.sensors))
 
 		publisher = SensorUpdatePublisher(
 			self_node_id=config.node_id,
@@ -290,13 +331,15 @@ def main():
 	web_api_port = int(os.getenv("WEB_API_PORT", str(config.port + 1000)))
 
 	try:
-		log.info(f"Starting WebAPI on {config.host}:{web_api_port}")
+		log.info("Starting WebAPI on %s:%d", config.host, web_api_port)
 		web_api = WebAPIServer(
 			host=config.host,
 			port=web_api_port,
 			state_provider=state_worker.get_state_snapshot,
 			updates_provider=state_worker.get_updates_snapshot,
 			log=log,
+			state_version_provider=lambda: state_worker.state_version,
+			state_delta_provider=state_worker.get_state_delta,
 		)
 		web_api.start()
 		log.info("WebAPI started")
@@ -351,6 +394,9 @@ def main():
 
 		log.info("Node shutdown complete")
 
+		# Flush records still queued for the log listener thread
+		stop_logging()
+
 
 if __name__ == "__main__":
 	main()
\ No newline at end of file
@@ -1,5 +1,5 @@
 from .message_types import MessageType
-from .message import Message
+from .message import Message, Serializable
 from .dispatcher import MessageDispatcher, ProtocolError
 
-__all__ = ["MessageType", "Message", "MessageDispatcher", "ProtocolError"]
\ No newline at end of file
+__all__ = ["MessageType", "Message", "Serializable", "MessageDispatcher", "ProtocolError"]
\ No newline at end of file
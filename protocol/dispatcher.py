@@ -1,4 +1,4 @@
-from typing import Callable, Dict
+from typing import Callable, Dict, Mapping, Optional, Tuple
 from protocol.message import Message
 from protocol.message_types import MessageType
 
@@ -14,6 +14,24 @@ class MessageDispatcher:
     def __init__(self):
         self._handlers: Dict[MessageType, Handler] = {}
 
+        # Handlers indexed by MessageType.ordinal (None if unregistered),
+        # rebuilt on register() so dispatch() is a single tuple index.
+        self._handler_table: Tuple[Optional[Handler], ...] = (None,) * len(MessageType)
+
+    @classmethod
+    def from_table(cls, table: Mapping[MessageType, Handler]) -> "MessageDispatcher":
+        """
+        Build a dispatcher from a complete {MessageType: handler} table.
+
+        The table is trusted (built statically by protocol setup), so the
+        per-entry checks of register() are skipped and the dispatch tuple
+        is built once.
+        """
+        dispatcher = cls()
+        dispatcher._handlers = dict(table)
+        dispatcher._handler_table = tuple(dispatcher._handlers.get(mt) for mt in MessageType)
+        return dispatcher
+
     def register(self, msg_type: MessageType, handler: Handler) -> None:
         if not isinstance(msg_type, MessageType):
             raise TypeError("msg_type must be MessageType")
@@ -25,12 +43,11 @@ class MessageDispatcher:
             raise ProtocolError(f"Handler already registered for {msg_type}")
 
         self._handlers[msg_type] = handler
+        self._handler_table = tuple(self._handlers.get(mt) for mt in MessageType)
 
     def dispatch(self, msg: Message) -> None:
-        if not isinstance(msg, Message):
-            raise TypeError("msg must be Message")
-
-        handler = self._handlers.get(msg.msg_type)
+        # msg comes from Message.decode, which already validated msg_type
+        handler = self._handler_table[msg.msg_type.ordinal]
         if handler is None:
             self._handle_unknown_message(msg)
             return
@@ -1,4 +1,6 @@
 # protocol/handlers.py
+import logging
+
 from protocol.message import Message
 from utils.logging import get_logger
 
@@ -13,7 +15,7 @@ def handle_peer_list(msg: Message) -> None:
 
 def handle_ping(msg: Message) -> None:
 	log = get_logger(__name__, msg.sender_id)
-	log.info(f"Received PING with payload={msg.payload}")
+	log.info("Received PING with payload=%s", msg.payload)
 	raise NotImplementedError("PING not implemented yet")
 
 
@@ -21,6 +23,30 @@ def handle_pong(msg: Message) -> None:
 	raise NotImplementedError("PONG not implemented yet")
 
 
+def _parse_sensor_update(payload: dict, default_origin: str):
+	"""
+	Validate a SENSOR_UPDATE payload in a single pass.
+
+	Returns (sensor_id, value, ts_ms, origin, meta).
+	Raises ValueError naming the first invalid field.
+	"""
+	get = payload.get
+
+	sensor_id = get("sensor_id")
+	if type(sensor_id) is not str or not sensor_id:
+		raise ValueError("missing/invalid sensor_id")
+
+	origin = get("origin") or default_origin
+	if type(origin) is not str or not origin:
+		raise ValueError("missing/invalid origin")
+
+	ts_ms = get("ts_ms")
+	if type(ts_ms) is not int:
+		raise ValueError("missing/invalid ts_ms")
+
+	return sensor_id, get("value"), ts_ms, origin, get("meta") or {}
+
+
 def make_sensor_update_handler(state_worker, self_node_id: str):
 	"""
 	Create a SENSOR_UPDATE handler bound to the local NodeStateWorker.
@@ -37,44 +63,81 @@ def make_sensor_update_handler(state_worker, self_node_id: str):
 	log = get_logger(__name__, self_node_id)
 
 	def handle_sensor_update(msg: Message) -> None:
-		payload = msg.payload or {}
-
-		sensor_id = payload.get("sensor_id")
-		value = payload.get("value")
-		ts_ms = payload.get("ts_ms")
-		origin = payload.get("origin") or msg.sender_id
-		meta = payload.get("meta") or {}
+		try:
+			sensor_id, value, ts_ms, origin, meta = _parse_sensor_update(
+				msg.payload, msg.sender_id
+			)
+		except ValueError as exc:
+			log.warning("Invalid SENSOR_UPDATE: %s", exc)
+			return
 
-		if not isinstance(sensor_id, str) or sensor_id == "":
-			log.warning("Invalid SENSOR_UPDATE: missing/invalid sensor_id")
+		try:
+			# positional: no kwargs dict built per message
+			applied = state_worker.merge_update(sensor_id, value, ts_ms, origin, meta)
+		except Exception:
+			log.error("Failed to merge SENSOR_UPDATE", exc_info=True)
 			return
 
-		if not isinstance(origin, str) or origin == "":
-			log.warning("Invalid SENSOR_UPDATE: missing/invalid origin")
+		if applied and log.isEnabledFor(logging.INFO):
+			log.info(
+				"SENSOR_UPDATE applied: sensor=%s origin=%s ts=%d",
+				sensor_id,
+				origin,
+				ts_ms,
+			)
+
+	return handle_sensor_update
+
+
+def make_sensor_update_batch_handler(state_worker, self_node_id: str):
+	"""
+	Create a SENSOR_UPDATE_BATCH handler bound to the local NodeStateWorker.
+
+	Payload contract:
+	{
+		"items": [ <SENSOR_UPDATE payload>, ... ]
+	}
+
+	Invalid items are skipped; the valid ones are merged together with
+	state_worker.merge_updates().
+	"""
+	log = get_logger(__name__, self_node_id)
+
+	def handle_sensor_update_batch(msg: Message) -> None:
+		items = msg.payload.get("items")
+		if type(items) is not list:
+			log.warning("Invalid SENSOR_UPDATE_BATCH: missing/invalid items")
 			return
 
-		if not isinstance(ts_ms, int):
-			log.warning("Invalid SENSOR_UPDATE: missing/invalid ts_ms")
+		sender_id = msg.sender_id
+		updates = []
+		for item in items:
+			if type(item) is not dict:
+				log.warning("Invalid SENSOR_UPDATE_BATCH item: not an object")
+				continue
+			try:
+				updates.append(_parse_sensor_update(item, sender_id))
+			except ValueError as exc:
+				log.warning("Invalid SENSOR_UPDATE_BATCH item: %s", exc)
+
+		if not updates:
 			return
 
 		try:
-			applied = state_worker.merge_update(
-				sensor_id=sensor_id,
-				value=value,
-				ts_ms=ts_ms,
-				origin=origin,
-				meta=meta,
-			)
+			applied = state_worker.merge_updates(updates)
 		except Exception:
-			log.error("Failed to merge SENSOR_UPDATE", exc_info=True)
+			log.error("Failed to merge SENSOR_UPDATE_BATCH", exc_info=True)
 			return
 
-		if applied:
+		if applied and log.isEnabledFor(logging.INFO):
 			log.info(
-				f"SENSOR_UPDATE applied: sensor={sensor_id} origin={origin} ts={ts_ms}"
+				"SENSOR_UPDATE_BATCH applied: sender=%s applied=%d items=%d",
+				sender_id,
+				applied,
+				len(items),
 			)
 
-	return handle_sensor_update
+	return handle_sensor_update_batch
 
 
 def handle_sensor_update(msg: Message) -> None:
@@ -83,6 +146,12 @@ def handle_sensor_update(msg: Message) -> None:
 	return
 
 
+def handle_sensor_update_batch(msg: Message) -> None:
+	log = get_logger(__name__, msg.sender_id)
+	log.warning("SENSOR_UPDATE_BATCH received but handler is not wired")
+	return
+
+
 def handle_gossip_state(msg: Message) -> None:
 	raise NotImplementedError("GOSSIP_STATE not implemented yet")
 
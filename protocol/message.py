@@ -2,16 +2,63 @@ import time
 import json
 from protocol.message_types import MessageType
 
+try:
+	import orjson
+except ImportError:  # fall back to stdlib json
+	orjson = None
+
+
+# wire value -> MessageType, so decoding skips the Enum __call__ machinery
+_MT_BY_VALUE = {mt.value: mt for mt in MessageType}
+
+
+class Serializable:
+	"""
+	Marker base for objects that encode themselves to wire bytes.
+
+	Transport code checks isinstance(obj, Serializable) and calls
+	to_bytes() directly instead of probing for the method.
+	"""
+
+	__slots__ = ()
+
+	def to_bytes(self) -> bytes:
+		raise NotImplementedError
+
+
+class Message(Serializable):
+	"""
+	Protocol message exchanged between nodes.
+
+	Immutability contract: a Message is not mutated once built. to_bytes()
+	memoizes the encoding, so changing fields (including payload contents)
+	afterwards would not be reflected on the wire.
+	"""
+
+	__slots__ = ("msg_type", "sender_id", "payload", "timestamp", "_bytes_cache")
 
-class Message:
 	def __init__(self, msg_type: MessageType, sender_id: str, payload: dict, timestamp: int = None):
 		self.msg_type = msg_type			# MessageType enum identifying message category
 		self.sender_id = sender_id			# unique node identifier
 		self.payload = payload or {}		# message-specific key-value data
 		self.timestamp = timestamp if timestamp is not None else self._now_ms()  # logical time in ms
 
+		# encoded bytes, memoized by to_bytes() (messages are not mutated once sent)
+		self._bytes_cache = None
+
 		self._validate()
 
+	@classmethod
+	def new_trusted(cls, msg_type: MessageType, sender_id: str, payload: dict, timestamp: int = None):
+		# build a Message from trusted internal code, skipping _validate()
+		msg = cls.__new__(cls)
+		msg.msg_type = msg_type
+		msg.sender_id = sender_id
+		msg.payload = payload or {}
+		msg.timestamp = timestamp if timestamp is not None else cls._now_ms()
+		msg._bytes_cache = None
+		return msg
+
 	@staticmethod
 	def _now_ms():
 		# return current unix timestamp in milliseconds
@@ -44,12 +91,25 @@ class Message:
 		}
 
 	def to_json(self) -> str:
-		# return message as JSON-formatted string
-		return json.dumps(self.to_dict())
+		# return message as JSON-formatted string (logging/debug paths)
+		return self.to_bytes().decode("utf-8")
 
 	def to_bytes(self) -> bytes:
-		# return UTF-8 encoded JSON message bytes for TCP transmission
-		return self.to_json().encode("utf-8")
+		# return UTF-8 encoded JSON message bytes for TCP transmission;
+		# encoded once, so broadcasting one Message to N peers costs one dumps
+		if self._bytes_cache is None:
+			self._bytes_cache = self._encode()
+		return self._bytes_cache
+
+	def _encode(self) -> bytes:
+		data = self.to_dict()
+		if orjson is not None:
+			try:
+				return orjson.dumps(data)
+			except TypeError:
+				# orjson is stricter (e.g. non-str keys); use json below
+				pass
+		return json.dumps(data).encode("utf-8")
 
 	@classmethod
 	def from_json(cls, raw: dict):
@@ -61,9 +121,9 @@ class Message:
 		if type_str is None:
 			raise ValueError("Missing field: type")
 
-		try:
-			msg_type = MessageType(type_str)
-		except ValueError:
+		# non-str values (possibly unhashable) can never name a type
+		msg_type = _MT_BY_VALUE.get(type_str) if type(type_str) is str else None
+		if msg_type is None:
 			raise ValueError(f"Invalid message type: {type_str}")
 
 		sender_id = raw.get("sender_id")	# required field
@@ -85,5 +145,8 @@ class Message:
 	@staticmethod
 	def decode(json_bytes: bytes):
 		# decode UTF-8 bytes into Message instance
-		raw = json.loads(json_bytes.decode("utf-8"))
+		if orjson is not None:
+			raw = orjson.loads(json_bytes)
+		else:
+			raw = json.loads(json_bytes.decode("utf-8"))
 		return Message.from_json(raw)
@@ -8,6 +8,7 @@ class MessageType(Enum):
 	PONG = "PONG"
 
 	SENSOR_UPDATE = "SENSOR_UPDATE"
+	SENSOR_UPDATE_BATCH = "SENSOR_UPDATE_BATCH"
 	GOSSIP_STATE = "GOSSIP_STATE"
 
 	FULL_SYNC_REQUEST = "FULL_SYNC_REQUEST"
@@ -15,3 +16,10 @@ class MessageType(Enum):
 
 	ERROR = "ERROR"
 	ACK = "ACK"
+
+
+# Dense 0..N-1 index per member (declaration order), used by the
+# dispatcher to look up handlers by tuple index instead of enum hashing.
+for _ordinal, _member in enumerate(MessageType):
+	_member.ordinal = _ordinal
+del _ordinal, _member
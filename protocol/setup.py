@@ -13,6 +13,22 @@ from membership.handlers import make_membership_handlers
 OnPeerDiscovered = Callable[[MembershipPeer], None]
 
 
+# Handlers that do not depend on node state; membership and SENSOR_UPDATE(_BATCH)
+# handlers are bound per node in setup_protocol()
+_STATIC_HANDLERS = (
+	(MessageType.PING, handlers.handle_ping),
+	(MessageType.PONG, handlers.handle_pong),
+
+	(MessageType.GOSSIP_STATE, handlers.handle_gossip_state),
+
+	(MessageType.FULL_SYNC_REQUEST, handlers.handle_full_sync_request),
+	(MessageType.FULL_SYNC_RESPONSE, handlers.handle_full_sync_response),
+
+	(MessageType.ERROR, handlers.handle_error),
+	(MessageType.ACK, handlers.handle_ack),
+)
+
+
 def setup_protocol(
 	self_node_id: str,
 	send_function,
@@ -24,10 +40,9 @@ def setup_protocol(
 
 	- PeerTable (membership) is owned by the node.
 	- on_peer_discovered is invoked when membership learns a new peer.
-	- state_worker (if provided) is injected into SENSOR_UPDATE handling.
+	- state_worker (if provided) is injected into SENSOR_UPDATE and
+	  SENSOR_UPDATE_BATCH handling.
 	"""
-	dispatcher = MessageDispatcher()
-
 	peer_table = PeerTable(self_node_id=self_node_id)
 
 	join_handler, peer_list_handler = make_membership_handlers(
@@ -37,27 +52,26 @@ def setup_protocol(
 		on_peer_discovered=on_peer_discovered,
 	)
 
-	dispatcher.register(MessageType.JOIN_REQUEST, join_handler)
-	dispatcher.register(MessageType.PEER_LIST, peer_list_handler)
-
-	dispatcher.register(MessageType.PING, handlers.handle_ping)
-	dispatcher.register(MessageType.PONG, handlers.handle_pong)
-
 	if state_worker is not None:
 		sensor_update_handler = handlers.make_sensor_update_handler(
 			state_worker=state_worker,
 			self_node_id=self_node_id,
 		)
-		dispatcher.register(MessageType.SENSOR_UPDATE, sensor_update_handler)
+		sensor_update_batch_handler = handlers.make_sensor_update_batch_handler(
+			state_worker=state_worker,
+			self_node_id=self_node_id,
+		)
 	else:
-		dispatcher.register(MessageType.SENSOR_UPDATE, handlers.handle_sensor_update)
-
-	dispatcher.register(MessageType.GOSSIP_STATE, handlers.handle_gossip_state)
+		sensor_update_handler = handlers.handle_sensor_update
+		sensor_update_batch_handler = handlers.handle_sensor_update_batch
 
-	dispatcher.register(MessageType.FULL_SYNC_REQUEST, handlers.handle_full_sync_request)
-	dispatcher.register(MessageType.FULL_SYNC_RESPONSE, handlers.handle_full_sync_response)
+	# Declarative handler table: built once, no per-entry register() checks
+	handler_table = dict(_STATIC_HANDLERS)
+	handler_table[MessageType.JOIN_REQUEST] = join_handler
+	handler_table[MessageType.PEER_LIST] = peer_list_handler
+	handler_table[MessageType.SENSOR_UPDATE] = sensor_update_handler
+	handler_table[MessageType.SENSOR_UPDATE_BATCH] = sensor_update_batch_handler
 
-	dispatcher.register(MessageType.ERROR, handlers.handle_error)
-	dispatcher.register(MessageType.ACK, handlers.handle_ack)
+	dispatcher = MessageDispatcher.from_table(handler_table)
 
 	return dispatcher, peer_table
\ No newline at end of file
@@ -7,37 +7,90 @@ class BaseSensor:
 	def __init__(self, sensor_id, period_ms, callback, *, unit=None):
 		self.sensor_id = sensor_id
 		self.period_ms = period_ms
+		self.period_s = period_ms / 1000.0
 		self.callback = callback
 		self.unit = unit
 
+		# Constant per-sensor meta shared by every emitted event (consumers
+		# must not mutate it; NodeStateWorker copies what it keeps)
+		self._meta = {
+			"unit": unit,
+			"period_ms": period_ms,
+		}
+
 		self._stop_event = threading.Event()
 		self._thread = None
 
 	def generate_value(self):
 		raise NotImplementedError
 
-	def _loop(self):
-		next_deadline = time.monotonic()
-		period_s = self.period_ms / 1000.0
+	def make_generator(self):
+		"""
+		Return a zero-argument callable producing the next value.
+
+		Subclasses may return a closure over pre-bound locals instead of
+		the generate_value bound method; parameters are captured when the
+		generator is made.
+		"""
+		return self.generate_value
+
+	def _generate_value_overridden(self, cls):
+		# a subclass of cls replaced generate_value: its specialized
+		# generator would bypass the override
+		return type(self).generate_value is not cls.generate_value
 
-		while not self._stop_event.is_set():
-			value = self.generate_value()
+	def tick(self, ts_ms=None):
+		# generate one sample and emit it through the callback as a
+		# positional event tuple: (sensor_id, value, ts_ms, meta);
+		# schedulers pass ts_ms derived from the tick deadline
+		value = self.generate_value()
+		if ts_ms is None:
 			ts_ms = int(time.time() * 1000)
 
-			self.callback({
-				"sensor_id": self.sensor_id,
-				"value": value,
-				"ts_ms": ts_ms,
-				"meta": {
-					"unit": self.unit,
-					"period_ms": self.period_ms,
-				},
-			})
+		self.callback((self.sensor_id, value, ts_ms, self._meta))
+
+	def make_ticker(self, callback=None):
+		"""
+		Return tick(ts_ms) specialized for this sensor: the callback,
+		generator and constant fields are bound as closure locals, so a
+		scheduler tick does no attribute lookups on the sensor.
+
+		callback overrides self.callback (e.g. a scheduler batch buffer).
+		"""
+		if callback is None:
+			callback = self.callback
+		generate = self.make_generator()
+		sensor_id = self.sensor_id
+		meta = self._meta
+
+		def tick(ts_ms):
+			callback((sensor_id, generate(), ts_ms, meta))
+
+		return tick
+
+	def _loop(self):
+		# standalone mode: SensorManager drives its sensors from a shared
+		# scheduler thread instead of calling start()
+		next_deadline = epoch_mono = time.monotonic()
+		epoch_wall_ms = int(time.time() * 1000)
+		period_s = self.period_s
+		stop_event = self._stop_event
+
+		if stop_event.is_set():
+			return
+
+		while True:
+			self.tick(epoch_wall_ms + int((next_deadline - epoch_mono) * 1000))
 
 			next_deadline += period_s
 			sleep_time = next_deadline - time.monotonic()
+			# wait() returns True once stopped, so the sleep doubles as the
+			# stop check; only a late tick needs the separate is_set()
 			if sleep_time > 0:
-				self._stop_event.wait(timeout=sleep_time)
+				if stop_event.wait(timeout=sleep_time):
+					return
+			elif stop_event.is_set():
+				return
 
 	def start(self):
 		if self._thread is not None:
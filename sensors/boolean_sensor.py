@@ -10,7 +10,20 @@ class BooleanSensor(BaseSensor):
 			callback=callback,
 			unit=unit,
 		)
-		self.p_true = p_true
+		self.p_true = float(p_true)
+		self._r = random.random
 
 	def generate_value(self):
-		return random.random() < self.p_true
+		return self._r() < self.p_true
+
+	def make_generator(self):
+		if self._generate_value_overridden(BooleanSensor):
+			return self.generate_value
+
+		p_true = self.p_true
+		r = self._r
+
+		def generate():
+			return r() < p_true
+
+		return generate
@@ -15,5 +15,27 @@ class CategoricalSensor(BaseSensor):
 		)
 		self.categories = list(categories)
 
+		# choice() inlined as cats[int(random() * n)], skipping _randbelow
+		self._cats = tuple(self.categories)
+		self._n = len(self._cats)
+		self._r = random.random
+
 	def generate_value(self):
-		return random.choice(self.categories)
+		return self._cats[int(self._r() * self._n)]
+
+	def make_generator(self):
+		if self._generate_value_overridden(CategoricalSensor):
+			return self.generate_value
+
+		cats = self._cats
+		if len(cats) == 1:
+			only = cats[0]
+			return lambda: only
+
+		n = len(cats)
+		r = self._r
+
+		def generate():
+			return cats[int(r() * n)]
+
+		return generate
@@ -25,12 +25,33 @@ class IncrementalSensor(BaseSensor):
 
 		self.value = float(start)
 		self.step_pct = float(step_pct)
+		# step_pct = 10 -> +/-10% of current value
+		self._step_frac = self.step_pct / 100.0
+		self._r = random.random
 
 	def generate_value(self):
-		# step_pct = 10 -> +/-10% of current value
-		delta = abs(self.value) * (self.step_pct / 100.0)
+		delta = abs(self.value) * self._step_frac
 
 		if delta > 0:
-			self.value += random.uniform(-delta, delta)
+			# uniform(-delta, delta) inlined
+			self.value += delta * (2.0 * self._r() - 1.0)
 
 		return self.value
+
+	def make_generator(self):
+		if self._generate_value_overridden(IncrementalSensor):
+			return self.generate_value
+
+		step_frac = self._step_frac
+		r = self._r
+
+		def generate():
+			# running value stays on the sensor so it remains inspectable
+			value = self.value
+			delta = abs(value) * step_frac
+			if delta > 0:
+				value += delta * (2.0 * r() - 1.0)
+				self.value = value
+			return value
+
+		return generate
@@ -26,5 +26,23 @@ class NoiseSensor(BaseSensor):
 		self.base = float(base)
 		self.noise = float(noise)
 
+		# base + uniform(-noise, noise) inlined as low + span * random()
+		self._low = self.base - self.noise
+		self._span = 2.0 * self.noise
+		self._r = random.random
+
 	def generate_value(self):
-		return self.base + random.uniform(-self.noise, self.noise)
+		return self._low + self._span * self._r()
+
+	def make_generator(self):
+		if self._generate_value_overridden(NoiseSensor):
+			return self.generate_value
+
+		low = self._low
+		span = self._span
+		r = self._r
+
+		def generate():
+			return low + span * r()
+
+		return generate
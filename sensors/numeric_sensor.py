@@ -31,5 +31,22 @@ class NumericSensor(BaseSensor):
 		self.min_val = min_val
 		self.max_val = max_val
 
+		# uniform(min, max) inlined as min + span * random()
+		self._span = max_val - min_val
+		self._r = random.random
+
 	def generate_value(self):
-		return random.uniform(self.min_val, self.max_val)
+		return self.min_val + self._span * self._r()
+
+	def make_generator(self):
+		if self._generate_value_overridden(NumericSensor):
+			return self.generate_value
+
+		low = self.min_val
+		span = self._span
+		r = self._r
+
+		def generate():
+			return low + span * r()
+
+		return generate
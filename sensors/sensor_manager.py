@@ -1,4 +1,9 @@
+import heapq
+import itertools
+import logging
 import os
+import threading
+import time
 
 from sensors.numeric_sensor import NumericSensor
 from sensors.boolean_sensor import BooleanSensor
@@ -14,165 +19,280 @@ class SensorManager:
 	"""
 	Loads and manages sensors based on environment configuration.
 	Each sensor emits structured events through the provided callback.
+	If batch_callback is given, the scheduler instead collects the events
+	of each wake and hands them over in one batch_callback(events) call
+	(e.g. RingQueue.put_many); the list is reused, so it must be copied.
+
+	All sensors are driven by one scheduler thread that keeps a heap of
+	(next_deadline, seq, sensors) and ticks whichever group is due next,
+	instead of one sleeping thread per sensor. Sensors with the same
+	period form one group and are ticked on a single wake.
 	"""
 
-	def __init__(self, callback):
+	def __init__(self, callback, batch_callback=None):
 		self.callback = callback
+		self.batch_callback = batch_callback
 		self.sensors = []
 
+		self._stop_event = threading.Event()
+		self._thread = None
+
 	def load_from_env(self):
 		if self.sensors:
 			raise RuntimeError("Sensors already loaded")
 
+		# One snapshot instead of an os.environ lookup (and encode) per key
+		env = os.environ.copy()
+
 		try:
-			count = int(os.getenv("SENSORS", "0"))
+			count = int(env.get("SENSORS", "0"))
 		except ValueError:
 			raise ValueError("SENSORS must be an integer")
 
 		for i in range(count):
 			prefix = f"SENSOR_{i}_"
 
-			s_type = os.getenv(prefix + "TYPE")
+			s_type = env.get(prefix + "TYPE")
 			if not s_type:
 				raise ValueError(f"Missing {prefix}TYPE")
 
-			period_ms = int(os.getenv(prefix + "PERIOD_MS", "0"))
+			period_ms = int(env.get(prefix + "PERIOD_MS", "0"))
 			if period_ms <= 0:
 				raise ValueError(f"Invalid {prefix}PERIOD_MS")
 
-			name = os.getenv(prefix + "NAME", f"sensor_{i}")
+			name = env.get(prefix + "NAME", f"sensor_{i}")
 			sensor_id = f"{name}@{i}"
 
 			# OPTIONAL METADATA
-			unit = os.getenv(prefix + "UNIT")
-
-			# NUMERIC
-			if s_type == "numeric":
-				min_val = float(os.getenv(prefix + "MIN"))
-				max_val = float(os.getenv(prefix + "MAX"))
-
-				sensor = NumericSensor(
-					sensor_id,
-					min_val,
-					max_val,
-					period_ms,
-					callback=self.callback,
-					unit=unit,
-				)
-
-			# BOOLEAN
-			elif s_type == "boolean":
-				p_true = float(os.getenv(prefix + "P_TRUE", 0.5))
-
-				sensor = BooleanSensor(
-					sensor_id,
-					p_true,
-					period_ms,
-					callback=self.callback,
-					unit=unit,
-				)
-
-			# CATEGORICAL
-			elif s_type == "categorical":
-				values = [
-					v.strip()
-					for v in os.getenv(prefix + "VALUES", "").split(",")
-					if v.strip()
-				]
-				if not values:
-					raise ValueError(f"{prefix}VALUES must not be empty")
-
-				sensor = CategoricalSensor(
-					sensor_id,
-					values,
-					period_ms,
-					callback=self.callback,
-					unit=unit,
-				)
-
-			# INCREMENTAL
-			elif s_type == "incremental":
-				start = float(os.getenv(prefix + "START", 0))
-				step_pct = float(os.getenv(prefix + "STEP_PCT", 1))
-
-				sensor = IncrementalSensor(
-					sensor_id,
-					start,
-					step_pct,
-					period_ms,
-					callback=self.callback,
-					unit=unit,
-				)
-
-			# TREND
-			elif s_type == "trend":
-				start = float(os.getenv(prefix + "START", 0))
-				slope = float(os.getenv(prefix + "SLOPE", 0.1))
-				noise = float(os.getenv(prefix + "NOISE", 0.0))
-
-				sensor = TrendSensor(
-					sensor_id,
-					start,
-					slope,
-					noise,
-					period_ms,
-					callback=self.callback,
-					unit=unit,
-				)
-
-			# SPIKE
-			elif s_type == "spike":
-				baseline = float(os.getenv(prefix + "BASELINE", 0))
-				spike_height = float(os.getenv(prefix + "SPIKE_HEIGHT", 10))
-				p_spike = float(os.getenv(prefix + "P_SPIKE", 0.2))
-
-				sensor = SpikeSensor(
-					sensor_id,
-					baseline,
-					spike_height,
-					p_spike,
-					period_ms,
-					callback=self.callback,
-					unit=unit,
-				)
-
-			# WAVE
-			elif s_type == "wave":
-				amplitude = float(os.getenv(prefix + "AMPLITUDE", 1))
-				frequency = float(os.getenv(prefix + "FREQUENCY", 1))
-
-				sensor = WaveSensor(
-					sensor_id,
-					amplitude,
-					frequency,
-					period_ms,
-					callback=self.callback,
-					unit=unit,
-				)
-
-			# NOISE
-			elif s_type == "noise":
-				base = float(os.getenv(prefix + "BASE", 0))
-				noise = float(os.getenv(prefix + "NOISE", 1))
-
-				sensor = NoiseSensor(
-					sensor_id,
-					base,
-					noise,
-					period_ms,
-					callback=self.callback,
-					unit=unit,
-				)
-
-			else:
+			unit = env.get(prefix + "UNIT")
+
+			builder = _BUILDERS.get(s_type)
+			if builder is None:
 				raise ValueError(f"Unsupported sensor type: {s_type}")
 
+			sensor = builder(env, sensor_id, prefix, period_ms, unit, self.callback)
 			self.sensors.append(sensor)
 
 	def start_all(self):
-		for s in self.sensors:
-			s.start()
+		if self._thread is not None or not self.sensors:
+			return
+
+		self._stop_event.clear()
+		self._thread = threading.Thread(
+			target=self._run,
+			name="sensor-scheduler",
+			daemon=True,
+		)
+		self._thread.start()
 
 	def stop_all(self):
+		self._stop_event.set()
+		if self._thread is not None:
+			self._thread.join(timeout=2)
+			self._thread = None
+
+		# sensors started standalone (BaseSensor.start) own their thread
 		for s in self.sensors:
 			s.stop()
+
+	def _run(self):
+		seq = itertools.count()
+
+		# ts_ms is derived from the tick deadline: one clock read per wait
+		# (monotonic) instead of an extra time.time() per event
+		now = epoch_mono = time.monotonic()
+		epoch_wall_ms = int(time.time() * 1000)
+
+		# sensors sharing a period share a heap entry, so the scheduler
+		# wakes once per distinct period and ticks the whole group; tick
+		# is specialized once per sensor by make_ticker()
+		batch_callback = self.batch_callback
+		pending = []
+		collect = pending.append if batch_callback is not None else None
+
+		groups = {}
+		for s in self.sensors:
+			groups.setdefault(s.period_ms, []).append((s.make_ticker(collect), s))
+
+		# heap entries: (deadline, seq, period_s, [(tick, sensor), ...])
+		heap = [(now, next(seq), group[0][1].period_s, group) for group in groups.values()]
+		heapq.heapify(heap)
+
+		while heap and not self._stop_event.is_set():
+			deadline, _, period_s, group = heap[0]
+
+			delay = deadline - time.monotonic()
+			if delay > 0 and self._stop_event.wait(timeout=delay):
+				break
+
+			heapq.heappop(heap)
+			ts_ms = epoch_wall_ms + int((deadline - epoch_mono) * 1000)
+
+			failed = None
+			for entry in group:
+				try:
+					entry[0](ts_ms)
+				except Exception:
+					# a failing sensor stops alone, as its own thread would have
+					logging.getLogger(__name__).error(
+						"Sensor %s failed; unscheduling it",
+						entry[1].sensor_id,
+						exc_info=True,
+					)
+					if failed is None:
+						failed = []
+					failed.append(entry)
+
+			if pending:
+				try:
+					batch_callback(pending)
+				except Exception:
+					logging.getLogger(__name__).error(
+						"Sensor batch callback failed; dropping %d events",
+						len(pending),
+						exc_info=True,
+					)
+				pending.clear()
+
+			if failed is not None:
+				group = [entry for entry in group if entry not in failed]
+				if not group:
+					continue
+
+			heapq.heappush(heap, (deadline + period_s, next(seq), period_s, group))
+
+
+# --------------------------------------------------
+# Per-type builders: each reads only its own SENSOR_<i>_* variables
+# from the environment snapshot taken by load_from_env()
+# --------------------------------------------------
+
+def _build_numeric(env, sensor_id, prefix, period_ms, unit, callback):
+	min_val = float(env.get(prefix + "MIN"))
+	max_val = float(env.get(prefix + "MAX"))
+
+	return NumericSensor(
+		sensor_id,
+		min_val,
+		max_val,
+		period_ms,
+		callback=callback,
+		unit=unit,
+	)
+
+
+def _build_boolean(env, sensor_id, prefix, period_ms, unit, callback):
+	p_true = float(env.get(prefix + "P_TRUE", 0.5))
+
+	return BooleanSensor(
+		sensor_id,
+		p_true,
+		period_ms,
+		callback=callback,
+		unit=unit,
+	)
+
+
+def _build_categorical(env, sensor_id, prefix, period_ms, unit, callback):
+	values = [
+		v.strip()
+		for v in env.get(prefix + "VALUES", "").split(",")
+		if v.strip()
+	]
+	if not values:
+		raise ValueError(f"{prefix}VALUES must not be empty")
+
+	return CategoricalSensor(
+		sensor_id,
+		values,
+		period_ms,
+		callback=callback,
+		unit=unit,
+	)
+
+
+def _build_incremental(env, sensor_id, prefix, period_ms, unit, callback):
+	start = float(env.get(prefix + "START", 0))
+	step_pct = float(env.get(prefix + "STEP_PCT", 1))
+
+	return IncrementalSensor(
+		sensor_id,
+		start,
+		step_pct,
+		period_ms,
+		callback=callback,
+		unit=unit,
+	)
+
+
+def _build_trend(env, sensor_id, prefix, period_ms, unit, callback):
+	start = float(env.get(prefix + "START", 0))
+	slope = float(env.get(prefix + "SLOPE", 0.1))
+	noise = float(env.get(prefix + "NOISE", 0.0))
+
+	return TrendSensor(
+		sensor_id,
+		start,
+		slope,
+		noise,
+		period_ms,
+		callback=callback,
+		unit=unit,
+	)
+
+
+def _build_spike(env, sensor_id, prefix, period_ms, unit, callback):
+	baseline = float(env.get(prefix + "BASELINE", 0))
+	spike_height = float(env.get(prefix + "SPIKE_HEIGHT", 10))
+	p_spike = float(env.get(prefix + "P_SPIKE", 0.2))
+
+	return SpikeSensor(
+		sensor_id,
+		baseline,
+		spike_height,
+		p_spike,
+		period_ms,
+		callback=callback,
+		unit=unit,
+	)
+
+
+def _build_wave(env, sensor_id, prefix, period_ms, unit, callback):
+	amplitude = float(env.get(prefix + "AMPLITUDE", 1))
+	frequency = float(env.get(prefix + "FREQUENCY", 1))
+
+	return WaveSensor(
+		sensor_id,
+		amplitude,
+		frequency,
+		period_ms,
+		callback=callback,
+		unit=unit,
+	)
+
+
+def _build_noise(env, sensor_id, prefix, period_ms, unit, callback):
+	base = float(env.get(prefix + "BASE", 0))
+	noise = float(env.get(prefix + "NOISE", 1))
+
+	return NoiseSensor(
+		sensor_id,
+		base,
+		noise,
+		period_ms,
+		callback=callback,
+		unit=unit,
+	)
+
+
+# SENSOR_<i>_TYPE -> builder
+_BUILDERS = {
+	"numeric": _build_numeric,
+	"boolean": _build_boolean,
+	"categorical": _build_categorical,
+	"incremental": _build_incremental,
+	"trend": _build_trend,
+	"spike": _build_spike,
+	"wave": _build_wave,
+	"noise": _build_noise,
+}
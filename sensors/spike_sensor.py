@@ -19,11 +19,26 @@ class SpikeSensor(BaseSensor):
 			callback,
 			unit=unit,
 		)
-		self.baseline = baseline
-		self.spike_height = spike_height
-		self.p_spike = p_spike
+		self.baseline = float(baseline)
+		self.spike_height = float(spike_height)
+		self.p_spike = float(p_spike)
+		self._r = random.random
 
 	def generate_value(self):
-		if random.random() < self.p_spike:
+		if self._r() < self.p_spike:
 			return self.baseline + self.spike_height
 		return self.baseline
+
+	def make_generator(self):
+		if self._generate_value_overridden(SpikeSensor):
+			return self.generate_value
+
+		baseline = self.baseline
+		spiked = self.baseline + self.spike_height
+		p_spike = self.p_spike
+		r = self._r
+
+		def generate():
+			return spiked if r() < p_spike else baseline
+
+		return generate
@@ -19,11 +19,28 @@ class TrendSensor(BaseSensor):
 			callback,
 			unit=unit,
 		)
-		self.value = start
-		self.slope = slope
-		self.noise = noise
+		self.value = float(start)
+		self.slope = float(slope)
+		self.noise = float(noise)
+		self._r = random.random
 
 	def generate_value(self):
-		self.value += self.slope
-		self.value += random.uniform(-self.noise, self.noise)
+		# slope + uniform(-noise, noise) inlined
+		self.value += self.slope + self.noise * (2.0 * self._r() - 1.0)
 		return self.value
+
+	def make_generator(self):
+		if self._generate_value_overridden(TrendSensor):
+			return self.generate_value
+
+		slope = self.slope
+		noise = self.noise
+		r = self._r
+
+		def generate():
+			# running value stays on the sensor so it remains inspectable
+			value = self.value + slope + noise * (2.0 * r() - 1.0)
+			self.value = value
+			return value
+
+		return generate
@@ -1,8 +1,10 @@
 import math
-import time
 from sensors.base_sensor import BaseSensor
 
 
+_TWO_PI = 2.0 * math.pi
+
+
 class WaveSensor(BaseSensor):
 	def __init__(
 		self,
@@ -19,10 +21,21 @@ class WaveSensor(BaseSensor):
 			callback,
 			unit=unit,
 		)
-		self.amplitude = amplitude
-		self.frequency = frequency
-		self.start_time = time.time()
+		# floats up front keep the per-tick arithmetic on the float fast path
+		self.amplitude = float(amplitude)
+		self.frequency = float(frequency)
+
+		# Phase accumulator: samples are taken once per period, so the phase
+		# advances by a constant step instead of re-reading the clock
+		self._phase = 0.0
+		self._dphi = (_TWO_PI * self.frequency * (period_ms / 1000.0)) % _TWO_PI
 
 	def generate_value(self):
-		t = time.time() - self.start_time
-		return self.amplitude * math.sin(2 * math.pi * self.frequency * t)
+		value = self.amplitude * math.sin(self._phase)
+
+		phase = self._phase + self._dphi
+		if phase >= _TWO_PI:
+			phase -= _TWO_PI
+		self._phase = phase
+
+		return value
@@ -8,12 +8,83 @@ with origin as tie-breaker (lexicographically larger origin wins).
 
 Snapshots are grouped by local node_id for UI/API compatibility with tests.
 Each sensor entry is exposed with a global key "origin:sensor_id".
+
+Records are stored as frozen, slotted SensorRecord instances (meta flattened
+into unit/period_ms) and rendered to plain dicts only at the snapshot
+boundary, so the UI/API and replication shapes are unchanged.
+
+State is split into SHARD_COUNT shards by hash(sensor_id), each with its
+own lock, so merges of unrelated sensors (ingest thread, network handlers)
+and snapshot readers do not serialize on one lock. Readers lock one shard
+at a time: a snapshot is point-in-time per shard, which is fine for LWW.
 """
 
+import collections
+import itertools
+import logging
+import sys
 import threading
 import time
+from dataclasses import dataclass
 from queue import Empty
-from copy import deepcopy
+from typing import Any, Optional
+
+
+# Upper bound on sensor events merged per lock acquisition
+DRAIN_BATCH_MAX = 256
+
+# Bound on replication updates buffered between publisher drains; beyond
+# it the oldest are dropped
+REPLICATION_QUEUE_MAXLEN = 100_000
+
+# Same for UI updates buffered between get_updates_snapshot() calls
+UI_UPDATES_MAXLEN = 10_000
+
+# Number of independently locked state shards (power of two)
+SHARD_COUNT = 16
+_SHARD_MASK = SHARD_COUNT - 1
+
+
+@dataclass(slots=True, frozen=True)
+class SensorRecord:
+	"""
+	One LWW-stored sensor reading; never mutated once stored.
+	"""
+
+	value: Any
+	ts_ms: int
+	origin: str
+	unit: Optional[str]
+	period_ms: Optional[int]
+
+	def to_dict(self) -> dict:
+		# snapshot/wire shape: {value, ts_ms, origin, meta: {unit, period_ms}}
+		return {
+			"value": self.value,
+			"ts_ms": self.ts_ms,
+			"origin": self.origin,
+			"meta": {
+				"unit": self.unit,
+				"period_ms": self.period_ms,
+			},
+		}
+
+
+class _StateShard:
+	"""
+	One lock plus the state map for the sensor_ids hashing to it.
+	"""
+
+	__slots__ = ("lock", "state", "versions")
+
+	def __init__(self):
+		self.lock = threading.Lock()
+
+		# LWW state: sensor_id -> SensorRecord
+		self.state = {}
+
+		# sensor_id -> state_version at which its record was applied
+		self.versions = {}
 
 
 class NodeStateWorker(threading.Thread):
@@ -23,9 +94,14 @@ class NodeStateWorker(threading.Thread):
 
 	Public API:
 	- merge_update(): apply a local or remote update with LWW merge
+	- merge_updates(): batched merge_update() under a single lock
 	- get_state_snapshot(): full state for UI/API
+	- state_version: change counter for caching get_state_snapshot() output
+	- get_state_delta(): records applied after a given state_version
 	- get_updates_snapshot(): incremental updates for UI/API
 	- pop_replication_updates(): incremental updates for replication
+	- replication_ready: Event signalling pending replication updates
+	- iter_records(): stream (sensor_id, SensorRecord) pairs shard by shard
 	- dump_full_state(): inspection-friendly full state view
 	- log_full_state(): log a full state dump for debugging
 	"""
@@ -38,19 +114,35 @@ class NodeStateWorker(threading.Thread):
 		self.log = log
 
 		self._stop_event = threading.Event()
-		self._lock = threading.Lock()
 
-		# LWW state:
-		# sensor_id -> {value, ts_ms, origin, meta}
-		self._state = {}
+		# Peak event_queue depth seen by run() (reported by log_full_state)
+		self._qdepth_peak = 0
+
+		# LWW state, sharded by sensor_id
+		self._shards = tuple(_StateShard() for _ in range(SHARD_COUNT))
+
+		# Updates for UI/observability: (sensor_id, record) in apply order,
+		# deduplicated to the latest per sensor by get_updates_snapshot()
+		self._ui_q = collections.deque(maxlen=UI_UPDATES_MAXLEN)
+		self._ui_drain_lock = threading.Lock()
+
+		# (origin, sensor_id) -> interned "origin:sensor_id" key
+		self._gid_cache = {}
 
-		# Updates for UI/observability (cleared on read)
-		# sensor_id -> record
-		self._updates_ui = {}
+		# Updates for replication: (sensor_id, record) in apply order,
+		# drained by pop_replication_updates() without blocking producers
+		self._repl_q = collections.deque(maxlen=REPLICATION_QUEUE_MAXLEN)
+		self._repl_drain_lock = threading.Lock()
 
-		# Updates for replication (cleared on read)
-		# sensor_id -> record
-		self._updates_replication = {}
+		# Set whenever a replication update is queued (see replication_ready)
+		self._repl_ready = threading.Event()
+
+		# Change counter for state_version, bumped after every applied update.
+		# Numbers are drawn under different shard locks, so publishing one
+		# takes _version_lock and only ever moves _version forward.
+		self._version_seq = itertools.count(1)
+		self._version = 0
+		self._version_lock = threading.Lock()
 
 		self._debug_dump_every_s = debug_dump_every_s
 		self._next_dump_ts = (
@@ -68,10 +160,24 @@ class NodeStateWorker(threading.Thread):
 			except Empty:
 				continue
 
+			# Drain whatever else is already queued so the batch is merged
+			# under a single lock acquisition
+			batch = [event]
 			try:
-				self._handle_sensor_event(event)
+				while len(batch) < DRAIN_BATCH_MAX:
+					batch.append(self.event_queue.get_nowait())
+			except Empty:
+				pass
+
+			# depth when this drain started: what was taken plus what is left
+			depth = len(batch) + self.event_queue.qsize()
+			if depth > self._qdepth_peak:
+				self._qdepth_peak = depth
+
+			try:
+				self._handle_sensor_events(batch)
 			except Exception:
-				self.log.error("Failed to handle sensor event", exc_info=True)
+				self.log.error("Failed to handle sensor events", exc_info=True)
 
 	def _maybe_log_periodic_dump(self):
 		if self._next_dump_ts is None:
@@ -84,13 +190,23 @@ class NodeStateWorker(threading.Thread):
 		self.log_full_state(level="INFO")
 		self._next_dump_ts = now + float(self._debug_dump_every_s)
 
-	def _normalize_meta(self, meta):
-		if not isinstance(meta, dict):
-			meta = {}
-		return {
-			"unit": meta.get("unit"),
-			"period_ms": meta.get("period_ms"),
-		}
+	@property
+	def replication_ready(self):
+		"""
+		Event set when pop_replication_updates() has something to return,
+		so a publisher can wait on it instead of polling; the consumer
+		clears it before popping.
+		"""
+		return self._repl_ready
+
+	@property
+	def state_version(self):
+		"""
+		Integer change counter: differs from a previously read value once
+		any update has been applied since, so callers can cache rendered
+		snapshots, or fetch get_state_delta() since a value they read.
+		"""
+		return self._version
 
 	def _log_msg(self, level, msg):
 		"""
@@ -111,15 +227,90 @@ class NodeStateWorker(threading.Thread):
 			if callable(method):
 				method(msg)
 
+	def _log_enabled(self, levelno):
+		"""
+		Whether a message at levelno would be emitted, so callers can skip
+		formatting it. Loggers without isEnabledFor() count as enabled.
+		"""
+		if self.log is None:
+			return False
+
+		is_enabled = getattr(self.log, "isEnabledFor", None)
+		return not callable(is_enabled) or is_enabled(levelno)
+
+	def _gid(self, origin, sensor_id):
+		# the set of (origin, sensor_id) pairs is bounded by the cluster's
+		# sensors, so the cache is unbounded; racing inserts are idempotent
+		key = (origin, sensor_id)
+		gid = self._gid_cache.get(key)
+		if gid is None:
+			gid = sys.intern(f"{origin}:{sensor_id}")
+			self._gid_cache[key] = gid
+		return gid
+
+	def _shard(self, sensor_id):
+		return self._shards[hash(sensor_id) & _SHARD_MASK]
+
+	def iter_records(self):
+		"""
+		Yield (sensor_id, SensorRecord) for the whole state, copying one
+		shard at a time, so a streaming consumer (e.g. a persistence
+		writer encoding record by record) holds at most one shard's items
+		rather than a full snapshot. The snapshot and dump paths are built
+		on it.
+		"""
+		for shard in self._shards:
+			with shard.lock:
+				items = list(shard.state.items())
+			yield from items
+
+	def _collect_state(self):
+		"""
+		Merge the per-shard state maps into a new dict (via iter_records(),
+		so a single shard is locked at a time).
+		"""
+		return dict(self.iter_records())
+
+	def _changed_since(self, since_version):
+		"""
+		Map sensor_id -> record for records applied after since_version,
+		locking a single shard at a time.
+		"""
+		changed = {}
+		for shard in self._shards:
+			with shard.lock:
+				state = shard.state
+				for sensor_id, version in shard.versions.items():
+					if version > since_version:
+						changed[sensor_id] = state[sensor_id]
+		return changed
+
+	def _state_items_by_origin(self):
+		"""
+		iter_records() sorted by (origin, sensor_id): one sort shared by
+		the dump paths, which then group consecutive origins.
+		"""
+		return sorted(self.iter_records(), key=lambda kv: (kv[1].origin, kv[0]))
+
+	@staticmethod
+	def _drain_latest(q, drain_lock):
+		"""
+		Pop every (sensor_id, record) queued so far in one C-level pass,
+		keeping the latest record per sensor (later entries are newer LWW
+		winners). Producers append without locking; drain_lock only keeps
+		concurrent readers from racing each other for the same items.
+		"""
+		with drain_lock:
+			return dict(itertools.islice(iter(q.popleft, None), len(q)))
+
 	def _format_record_line(self, sensor_id, rec):
-		meta = rec.get("meta") or {}
 		return (
 			f"sensor_id={sensor_id} "
-			f"winner_origin={rec.get('origin')} "
-			f"ts_ms={rec.get('ts_ms')} "
-			f"value={rec.get('value')} "
-			f"unit={meta.get('unit')} "
-			f"period_ms={meta.get('period_ms')}"
+			f"winner_origin={rec.origin} "
+			f"ts_ms={rec.ts_ms} "
+			f"value={rec.value} "
+			f"unit={rec.unit} "
+			f"period_ms={rec.period_ms}"
 		)
 
 	def dump_full_state(self):
@@ -141,38 +332,27 @@ class NodeStateWorker(threading.Thread):
 				"total": <int>
 			}
 		"""
-		with self._lock:
-			state_copy = deepcopy(self._state)
+		items = self._state_items_by_origin()
 
+		# merges only store records with a non-empty str origin, and items
+		# are origin-ordered, so each origin is one consecutive run
 		by_origin = {}
-		for sensor_id, rec in state_copy.items():
-			origin = rec.get("origin")
-			if not isinstance(origin, str) or origin == "":
-				origin = "UNKNOWN"
-
-			meta = rec.get("meta") or {}
-			item = {
-				"sensor_id": sensor_id,
-				"ts_ms": rec.get("ts_ms"),
-				"value": rec.get("value"),
-				"unit": meta.get("unit"),
-				"period_ms": meta.get("period_ms"),
-			}
-
-			bucket = by_origin.get(origin)
-			if bucket is None:
-				bucket = {"count": 0, "sensors": []}
-				by_origin[origin] = bucket
-
-			bucket["sensors"].append(item)
-			bucket["count"] += 1
-
-		for origin in by_origin:
-			by_origin[origin]["sensors"].sort(key=lambda x: x["sensor_id"])
+		for origin, group in itertools.groupby(items, key=lambda kv: kv[1].origin):
+			sensors = [
+				{
+					"sensor_id": sensor_id,
+					"ts_ms": rec.ts_ms,
+					"value": rec.value,
+					"unit": rec.unit,
+					"period_ms": rec.period_ms,
+				}
+				for sensor_id, rec in group
+			]
+			by_origin[origin] = {"count": len(sensors), "sensors": sensors}
 
 		return {
-			"by_origin": dict(sorted(by_origin.items(), key=lambda kv: kv[0])),
-			"total": len(state_copy),
+			"by_origin": by_origin,
+			"total": len(items),
 		}
 
 	def log_full_state(self, level="INFO"):
@@ -182,28 +362,30 @@ class NodeStateWorker(threading.Thread):
 		level:
 		- "DEBUG", "INFO", "WARNING", "ERROR"
 		"""
-		with self._lock:
-			items = list(self._state.items())
+		level_lc = str(level).lower()
+		if level_lc not in {"debug", "info", "warning", "error"}:
+			level_lc = "info"
+
+		# nothing would be emitted: skip the snapshot and formatting
+		if not self._log_enabled(getattr(logging, level_lc.upper())):
+			return
 
-		items.sort(key=lambda kv: (str(kv[1].get("origin")), kv[0]))
+		items = self._state_items_by_origin()
 
 		count_by_origin = {}
-		for sensor_id, rec in items:
-			origin = rec.get("origin")
-			if not isinstance(origin, str) or origin == "":
-				origin = "UNKNOWN"
-			count_by_origin[origin] = count_by_origin.get(origin, 0) + 1
+		for _, rec in items:
+			count_by_origin[rec.origin] = count_by_origin.get(rec.origin, 0) + 1
 
+		# items are origin-ordered, so count_by_origin already is too
 		header = (
 			f"FULL_STATE_DUMP node={self.node_id} "
 			f"total={len(items)} "
-			f"by_origin={dict(sorted(count_by_origin.items(), key=lambda kv: kv[0]))}"
+			f"by_origin={count_by_origin} "
+			f"qdepth={self.event_queue.qsize()} "
+			f"qdepth_peak={self._qdepth_peak} "
+			f"qdropped={getattr(self.event_queue, 'dropped', 0)}"
 		)
 
-		level_lc = str(level).lower()
-		if level_lc not in {"debug", "info", "warning", "error"}:
-			level_lc = "info"
-
 		self._log_msg(level_lc, header)
 		for sensor_id, rec in items:
 			self._log_msg(level_lc, self._format_record_line(sensor_id, rec))
@@ -220,126 +402,204 @@ class NodeStateWorker(threading.Thread):
 		- True if applied
 		- False if stale/invalid
 		"""
-		if meta is None:
-			meta = {}
-
-		if not isinstance(sensor_id, str) or sensor_id == "":
-			return False
-		if not isinstance(origin, str) or origin == "":
-			return False
-		if not isinstance(ts_ms, int):
+		update = self._make_record(sensor_id, value, ts_ms, origin, meta)
+		if update is None:
 			return False
 
-		update = {
-			"value": value,
-			"ts_ms": ts_ms,
-			"origin": origin,
-			"meta": self._normalize_meta(meta),
-		}
+		shard = self._shard(sensor_id)
+		with shard.lock:
+			return self._apply_locked(shard, sensor_id, update)
 
-		with self._lock:
-			prev = self._state.get(sensor_id)
-			if prev is None:
-				self._state[sensor_id] = update
-				self._updates_ui[sensor_id] = update
-				self._updates_replication[sensor_id] = update
+	def merge_updates(self, updates):
+		"""
+		Batched merge_update() for (sensor_id, value, ts_ms, origin, meta)
+		tuples.
 
-				self._log_msg(
-					"info",
-					f"LWW applied (insert): sensor={sensor_id} origin={origin} "
-					f"ts={ts_ms} value={value} unit={update['meta'].get('unit')} "
-					f"period_ms={update['meta'].get('period_ms')}",
-				)
-				self._log_msg("info", self._format_record_line(sensor_id, update))
-				return True
+		The batch is reduced to its LWW winner per sensor_id first, then
+		applied with one lock acquisition per touched shard.
+
+		Returns the number of applied updates.
+		"""
+		make_record = self._make_record
+		records = []
+		for sensor_id, value, ts_ms, origin, meta in updates:
+			update = make_record(sensor_id, value, ts_ms, origin, meta)
+			if update is not None:
+				records.append((sensor_id, update))
+
+		return self._merge_trusted(records)
+
+	def _merge_trusted(self, records):
+		"""
+		Merge already validated (sensor_id, SensorRecord) pairs: reduce to
+		the LWW winner per sensor_id, then apply with one lock acquisition
+		per touched shard. Returns the number of applied updates.
+		"""
+		wins = self._wins
+		winners = {}
+		for sensor_id, update in records:
+			best = winners.get(sensor_id)
+			if best is None or wins(update.ts_ms, update.origin, best.ts_ms, best.origin):
+				winners[sensor_id] = update
+
+		if not winners:
+			return 0
+
+		by_shard = {}
+		for sensor_id, update in winners.items():
+			shard = self._shard(sensor_id)
+			batch = by_shard.get(shard)
+			if batch is None:
+				by_shard[shard] = batch = []
+			batch.append((sensor_id, update))
+
+		applied = 0
+		for shard, batch in by_shard.items():
+			with shard.lock:
+				for sensor_id, update in batch:
+					if self._apply_locked(shard, sensor_id, update):
+						applied += 1
+		return applied
+
+	@staticmethod
+	def _wins(ts_ms, origin, prev_ts, prev_origin):
+		# newer ts_ms wins; on tie, lexicographically larger origin wins
+		return ts_ms > prev_ts or (ts_ms == prev_ts and origin > prev_origin)
+
+	def _make_record(self, sensor_id, value, ts_ms, origin, meta):
+		"""
+		Validate an untrusted update and build its state record (None if
+		invalid or already stale).
+		"""
+		# single guard per field: exact type, then truthiness for ""
+		if type(sensor_id) is not str or not sensor_id:
+			return None
+		if type(origin) is not str or not origin:
+			return None
+		if type(ts_ms) is not int:
+			return None
+
+		# Unlocked peek: a stored record only ever gets replaced by a newer
+		# winner, so if any observed prev beats this update the current one
+		# does too; losers are dropped before allocating a record
+		prev = self._shard(sensor_id).state.get(sensor_id)
+		if prev is not None and not self._wins(ts_ms, origin, prev.ts_ms, prev.origin):
+			self._log_stale(sensor_id, value, ts_ms, origin, prev)
+			return None
+
+		if type(meta) is not dict:
+			meta = {}
 
-			prev_ts = prev.get("ts_ms")
-			prev_origin = prev.get("origin")
+		return SensorRecord(value, ts_ms, origin, meta.get("unit"), meta.get("period_ms"))
 
-			if ts_ms > prev_ts:
-				self._state[sensor_id] = update
-				self._updates_ui[sensor_id] = update
-				self._updates_replication[sensor_id] = update
+	def _apply_locked(self, shard, sensor_id, update):
+		"""
+		LWW-apply a validated record; caller holds shard.lock.
+		"""
+		ts_ms = update.ts_ms
+		origin = update.origin
+
+		prev = shard.state.get(sensor_id)
+		if prev is None:
+			reason = "insert"
+		elif ts_ms > prev.ts_ms:
+			reason = "newer_ts"
+		elif ts_ms == prev.ts_ms and origin > prev.origin:
+			reason = "tie_break"
+		else:
+			self._log_stale(sensor_id, update.value, ts_ms, origin, prev)
+			return False
 
+		# numbered under the shard lock, so a reader that sees this version
+		# in state_version finds the record in its shard
+		version = next(self._version_seq)
+		shard.state[sensor_id] = update
+		shard.versions[sensor_id] = version
+		entry = (sensor_id, update)
+		self._ui_q.append(entry)
+		self._repl_q.append(entry)
+		self._repl_ready.set()
+		with self._version_lock:
+			if version > self._version:
+				self._version = version
+
+		if self._log_enabled(logging.INFO):
+			if prev is None:
 				self._log_msg(
 					"info",
-					f"LWW applied (newer_ts): sensor={sensor_id} origin={origin} "
-					f"ts={ts_ms} value={value} prev_origin={prev_origin} prev_ts={prev_ts}",
+					f"LWW applied (insert): sensor={sensor_id} origin={origin} "
+					f"ts={ts_ms} value={update.value} unit={update.unit} "
+					f"period_ms={update.period_ms}",
 				)
-				self._log_msg("info", self._format_record_line(sensor_id, update))
-				return True
-
-			if ts_ms == prev_ts and origin > prev_origin:
-				self._state[sensor_id] = update
-				self._updates_ui[sensor_id] = update
-				self._updates_replication[sensor_id] = update
-
+			else:
 				self._log_msg(
 					"info",
-					f"LWW applied (tie_break): sensor={sensor_id} origin={origin} "
-					f"ts={ts_ms} value={value} prev_origin={prev_origin} prev_ts={prev_ts}",
+					f"LWW applied ({reason}): sensor={sensor_id} origin={origin} "
+					f"ts={ts_ms} value={update.value} prev_origin={prev.origin} "
+					f"prev_ts={prev.ts_ms}",
 				)
-				self._log_msg("info", self._format_record_line(sensor_id, update))
-				return True
+		return True
 
+	def _log_stale(self, sensor_id, value, ts_ms, origin, prev):
+		if self._log_enabled(logging.DEBUG):
 			self._log_msg(
 				"debug",
 				f"LWW ignored (stale): sensor={sensor_id} origin={origin} "
-				f"ts={ts_ms} value={value} prev_origin={prev_origin} prev_ts={prev_ts}",
+				f"ts={ts_ms} value={value} prev_origin={prev.origin} "
+				f"prev_ts={prev.ts_ms}",
 			)
-			self._log_msg("debug", self._format_record_line(sensor_id, prev))
-			return False
 
-	def _handle_sensor_event(self, event):
-		sensor_id = event["sensor_id"]
-		value = event["value"]
-		ts_ms = event["ts_ms"]
-		meta = event.get("meta", {})
-
-		self.merge_update(
-			sensor_id=sensor_id,
-			value=value,
-			ts_ms=ts_ms,
-			origin=self.node_id,
-			meta=meta,
-		)
+	def _handle_sensor_events(self, events):
+		# events are BaseSensor tuples: (sensor_id, value, ts_ms, meta), built
+		# by our own sensors, so fields are trusted and only the shape is
+		# checked; remote updates go through merge_update(s) validation
+		node_id = self.node_id
+		records = []
+		for event in events:
+			try:
+				sensor_id, value, ts_ms, meta = event
+				record = SensorRecord(value, ts_ms, node_id, meta.get("unit"), meta.get("period_ms"))
+			except (TypeError, ValueError, AttributeError):
+				self.log.error("Failed to handle sensor event", exc_info=True)
+				continue
+			records.append((sensor_id, record))
+
+		self._merge_trusted(records)
 
 	def _snapshot_grouped_for_ui(self, state_map):
 		"""
-		Render internal {sensor_id: record} to the UI/API shape expected
-		by tests: { self.node_id: { "origin:sensor_id": record, ... } }.
+		Render internal {sensor_id: SensorRecord} to the UI/API shape
+		expected by tests: { self.node_id: { "origin:sensor_id": dict } }.
 		"""
-		per_node = {}
-		for sensor_id, record in state_map.items():
-			origin = record.get("origin")
-			if not isinstance(origin, str) or origin == "":
-				origin = self.node_id
-			global_sensor_id = f"{origin}:{sensor_id}"
-			per_node[global_sensor_id] = record
-		return {self.node_id: per_node}
+		gid = self._gid
+		return {self.node_id: {
+			gid(record.origin, sensor_id): record.to_dict()
+			for sensor_id, record in state_map.items()
+		}}
 
 	def get_state_snapshot(self):
-		with self._lock:
-			return self._snapshot_grouped_for_ui(deepcopy(self._state))
+		return self._snapshot_grouped_for_ui(self._collect_state())
+
+	def get_state_delta(self, since_version):
+		"""
+		Return (version, snapshot) where snapshot has the get_state_snapshot()
+		shape but holds only records applied after since_version; pass the
+		returned version as since_version next time. A record may be
+		repeated in two consecutive deltas, never skipped.
+
+		A since_version ahead of the current version cannot come from this
+		worker (e.g. it predates a restart), so the full state is returned.
+		"""
+		version = self._version
+		if since_version > version:
+			since_version = 0
+		return version, self._snapshot_grouped_for_ui(self._changed_since(since_version))
 
 	def get_updates_snapshot(self):
-		with self._lock:
-			snapshot = self._snapshot_grouped_for_ui(deepcopy(self._updates_ui))
-			self._updates_ui.clear()
-			return snapshot
+		return self._snapshot_grouped_for_ui(self._drain_latest(self._ui_q, self._ui_drain_lock))
 
 	def pop_replication_updates(self):
-		with self._lock:
-			per_node = {}
-			for sensor_id, record in self._updates_replication.items():
-				origin = record.get("origin")
-				if not isinstance(origin, str) or origin == "":
-					origin = self.node_id
-				global_sensor_id = f"{origin}:{sensor_id}"
-				per_node[global_sensor_id] = deepcopy(record)
-
-			self._updates_replication.clear()
-			return {self.node_id: per_node}
+		return self._snapshot_grouped_for_ui(self._drain_latest(self._repl_q, self._repl_drain_lock))
 
 	def stop(self):
 		"""Request thread termination."""
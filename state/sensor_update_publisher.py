@@ -5,13 +5,24 @@ from protocol.message import Message
 from protocol.message_types import MessageType
 
 
+# Updates carried by one SENSOR_UPDATE_BATCH message, bounding frame size
+MAX_BATCH_ITEMS = 256
+
+
 class SensorUpdatePublisher(threading.Thread):
 	"""
 	Publishes local-origin updates to all peers in peer_table.
 
 	- Uses NodeStateWorker.pop_replication_updates() so it does not steal UI updates.
+	- Wakes on the worker's replication_ready event, so updates go out as
+	  soon as they are merged; interval_s caps the wait (state workers
+	  without the event are polled every interval_s instead).
 	- Filters out non-local origin to avoid re-broadcast loops for now.
-	- Best-effort: if TcpClient does not know a peer_id, it adds it on the fly.
+	- Best-effort: peers the TcpClient does not know yet are added once,
+	  before the flush is sent.
+	- Batches per flush: the updates are packed into SENSOR_UPDATE_BATCH
+	  messages of up to MAX_BATCH_ITEMS items, encoded once, and each peer
+	  gets all of them in one send_raw_batch() call (one scatter-gather write).
 	"""
 
 	def __init__(
@@ -32,19 +43,39 @@ class SensorUpdatePublisher(threading.Thread):
 		self._log = log
 		self._interval_s = interval_s
 
+		# global "origin:sensor_id" key -> sensor_id, so each key is split
+		# once rather than on every flush
+		self._sensor_id_by_gid = {}
+
+		# peer ids registered with the TcpClient (see _ensure_client_peers)
+		self._known_peer_ids = set()
+
 		self._stop_event = threading.Event()
+		self._ready = getattr(state_worker, "replication_ready", None)
 
 	def stop(self) -> None:
 		self._stop_event.set()
+		if self._ready is not None:
+			# wake a run() blocked on the state worker's event
+			self._ready.set()
 
 	def run(self) -> None:
+		ready = self._ready
 		while not self._stop_event.is_set():
+			if ready is not None:
+				ready.wait(timeout=self._interval_s)
+				if self._stop_event.is_set():
+					break
+				# clear before popping: updates merged meanwhile set it again
+				ready.clear()
+
 			try:
 				self._publish_once()
 			except Exception:
 				self._log.error("SensorUpdatePublisher failed", exc_info=True)
 
-			self._stop_event.wait(timeout=self._interval_s)
+			if ready is None:
+				self._stop_event.wait(timeout=self._interval_s)
 
 	def _publish_once(self) -> None:
 		snapshot = self._state_worker.pop_replication_updates() or {}
@@ -52,55 +83,83 @@ class SensorUpdatePublisher(threading.Thread):
 		if not updates:
 			return
 
-		peers = self._peer_table.list_peers()
+		peers = tuple(self._peer_table.list_peers())
 		if not peers:
 			return
 
+		me = self._self_node_id
+		sensor_id_by_gid = self._sensor_id_by_gid
+
+		items = []
 		for global_sensor_id, update in updates.items():
-			origin = update.get("origin")
-			if origin != self._self_node_id:
+			if update.get("origin") != me:
 				continue
 
-			sensor_id = global_sensor_id
-			if isinstance(global_sensor_id, str) and ":" in global_sensor_id:
-				sensor_id = global_sensor_id.split(":", 1)[1]
-
-			msg = Message(
-				msg_type=MessageType.SENSOR_UPDATE,
-				sender_id=self._self_node_id,
-				payload={
-					"sensor_id": sensor_id,
-					"value": update.get("value"),
-					"ts_ms": update.get("ts_ms"),
-					"origin": origin,
-					"meta": update.get("meta", {}),
-				},
-			)
+			sensor_id = sensor_id_by_gid.get(global_sensor_id)
+			if sensor_id is None:
+				# "origin:sensor_id" -> "sensor_id"; keys without ":" as is
+				sensor_id = global_sensor_id.partition(":")[2] or global_sensor_id
+				sensor_id_by_gid[global_sensor_id] = sensor_id
+
+			items.append({
+				"sensor_id": sensor_id,
+				"value": update.get("value"),
+				"ts_ms": update.get("ts_ms"),
+				"origin": me,
+				"meta": update.get("meta", {}),
+			})
+
+		if not items:
+			return
+
+		# Encode once, share the bytes across all peers
+		payloads = [
+			Message.new_trusted(
+				msg_type=MessageType.SENSOR_UPDATE_BATCH,
+				sender_id=me,
+				payload={"items": items[i:i + MAX_BATCH_ITEMS]},
+			).to_bytes()
+			for i in range(0, len(items), MAX_BATCH_ITEMS)
+		]
+
+		self._ensure_client_peers(peers)
+		for p in peers:
+			self._send_to_peer(p, payloads)
+
+	def _ensure_client_peers(self, peers) -> None:
+		"""
+		Register peers not yet known to the TcpClient, once per peer rather
+		than on every failed send. A failed add is retried next flush.
+		"""
+		missing = [p for p in peers if p.node_id not in self._known_peer_ids]
+		if not missing:
+			return
+
+		from networking.tcp_client import Peer as TcpPeer
 
-			for p in peers:
-				self._send_to_peer(p, msg)
+		for peer in missing:
+			try:
+				self._client.add_peer(TcpPeer(node_id=peer.node_id, host=peer.host, port=peer.port))
+			except RuntimeError:
+				pass  # already registered elsewhere (e.g. by the node)
+			except Exception:
+				self._log.warning(
+					"Failed to add peer_id=%s for SENSOR_UPDATE",
+					peer.node_id,
+					exc_info=True,
+				)
+				continue
+			self._known_peer_ids.add(peer.node_id)
 
-	def _send_to_peer(self, peer, msg: Message) -> None:
+	def _send_to_peer(self, peer, payloads: list) -> None:
 		try:
-			self._client.send_json(peer.node_id, msg)
-			return
+			self._client.send_raw_batch(peer.node_id, payloads)
 		except KeyError:
-			pass
+			# removed from the client meanwhile: re-add on the next flush
+			self._known_peer_ids.discard(peer.node_id)
 		except Exception:
 			self._log.warning(
-				f"Failed to send SENSOR_UPDATE to peer_id={peer.node_id}",
+				"Failed to send SENSOR_UPDATE to peer_id=%s",
+				peer.node_id,
 				exc_info=True,
 			)
-			return
-
-		try:
-			from networking.tcp_client import Peer as TcpPeer
-
-			tcp_peer = TcpPeer(node_id=peer.node_id, host=peer.host, port=peer.port)
-			self._client.add_peer(tcp_peer)
-			self._client.send_json(peer.node_id, msg)
-		except Exception:
-			self._log.warning(
-				f"Failed to add/connect peer_id={peer.node_id} for SENSOR_UPDATE",
-				exc_info=True,
-			)
\ No newline at end of file
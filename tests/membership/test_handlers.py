@@ -146,3 +146,84 @@ def test_peer_list_integrates_new_peers_only():
     ids = {p.node_id for p in peers}
 
     assert ids == {"node-2", "node-3"}
+
+
+def test_join_request_peer_list_reflects_new_members():
+    table = PeerTable(self_node_id="node-1")
+    sender = FakeSender()
+
+    handle_join, _ = make_membership_handlers(
+        peer_table=table,
+        send=sender.send,
+        self_node_id="node-1",
+    )
+
+    def join(node_id, port):
+        handle_join(Message(
+            msg_type=MessageType.JOIN_REQUEST,
+            sender_id=node_id,
+            payload={"node_id": node_id, "host": "127.0.0.1", "port": port},
+        ))
+
+    join("node-2", 9001)
+    join("node-2", 9001)
+    join("node-3", 9002)
+
+    first = {p["node_id"] for p in sender.sent[0][1].payload["peers"]}
+    second = {p["node_id"] for p in sender.sent[1][1].payload["peers"]}
+    third = {p["node_id"] for p in sender.sent[2][1].payload["peers"]}
+
+    assert first == {"node-2"}
+    assert second == {"node-2"}
+    assert third == {"node-2", "node-3"}
+
+
+def test_peer_list_skips_malformed_entries():
+    table = PeerTable(self_node_id="node-1")
+    sender = FakeSender()
+
+    _handle_join, handle_peer_list = make_membership_handlers(
+        peer_table=table,
+        send=sender.send,
+        self_node_id="node-1",
+    )
+
+    peer_list_msg = Message(
+        msg_type=MessageType.PEER_LIST,
+        sender_id="peer-x",
+        payload={
+            "peers": [
+                "not-a-dict",
+                {"node_id": "node-2", "host": "127.0.0.1"},
+                {"node_id": "node-3", "host": "127.0.0.1", "port": "9002"},
+                {"node_id": "node-4", "host": "127.0.0.1", "port": 9003},
+            ]
+        },
+    )
+
+    handle_peer_list(peer_list_msg)
+
+    assert {p.node_id for p in table.list_peers()} == {"node-4"}
+
+
+def test_join_reply_peer_list_follows_membership_changes():
+    table = PeerTable(self_node_id="node-1")
+    sender = FakeSender()
+
+    handle_join, _handle_peer_list = make_membership_handlers(
+        peer_table=table,
+        send=sender.send,
+        self_node_id="node-1",
+    )
+
+    def join(node_id, port):
+        handle_join(Message(
+            msg_type=MessageType.JOIN_REQUEST,
+            sender_id=node_id,
+            payload={"node_id": node_id, "host": "127.0.0.1", "port": port},
+        ))
+        return sorted(p["node_id"] for p in sender.sent[-1][1].payload["peers"])
+
+    assert join("node-2", 9001) == ["node-2"]
+    assert join("node-2", 9001) == ["node-2"]  # unchanged: served from cache
+    assert join("node-3", 9002) == ["node-2", "node-3"]
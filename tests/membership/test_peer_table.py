@@ -44,14 +44,14 @@ def test_update_heartbeat_existing_peer():
     peer = Peer.new("node-2", "127.0.0.1", 9001)
     table.add_peer(peer)
 
-    old_ts = peer.last_heartbeat
-    new_ts = old_ts + 10.0
+    old_ts = peer.last_heartbeat_ns
+    new_ts = old_ts + 10_000_000_000
 
     table.update_heartbeat("node-2", new_ts)
 
     updated = table.get_peer("node-2")
     assert updated is not None
-    assert updated.last_heartbeat == new_ts
+    assert updated.last_heartbeat_ns == new_ts
     assert updated.status == "alive"
 
 
@@ -59,7 +59,7 @@ def test_update_heartbeat_unknown_peer_noop():
     table = PeerTable(self_node_id="node-1")
 
     # Should not raise and should not create the peer
-    table.update_heartbeat("node-unknown", time.time())
+    table.update_heartbeat("node-unknown", time.monotonic_ns())
 
     assert table.get_peer("node-unknown") is None
     assert table.list_peers() == []
@@ -84,3 +84,39 @@ def test_list_peers_returns_snapshot():
     # Table has both peers
     peers = table.list_peers()
     assert {p.node_id for p in peers} == {"node-2", "node-3"}
+
+
+def test_version_bumped_only_on_membership_change():
+    table = PeerTable(self_node_id="node-1")
+    v0 = table.version()
+
+    peer = Peer.new("node-2", "127.0.0.1", 9001)
+    table.add_peer(peer)
+    v1 = table.version()
+    assert v1 > v0
+
+    # Duplicate add and heartbeat do not change membership
+    table.add_peer(peer)
+    table.update_heartbeat("node-2")
+    assert table.version() == v1
+
+
+def test_add_peer_by_id_builds_peer_only_when_new(monkeypatch):
+    table = PeerTable(self_node_id="node-1")
+
+    built = []
+    real_new = Peer.new
+
+    def counting_new(*args, **kwargs):
+        built.append(args or kwargs)
+        return real_new(*args, **kwargs)
+
+    monkeypatch.setattr(Peer, "new", staticmethod(counting_new))
+
+    peer = table.add_peer_by_id("node-2", "127.0.0.1", 9001)
+    assert peer is not None
+    assert table.get_peer("node-2") is peer
+
+    assert table.add_peer_by_id("node-2", "127.0.0.1", 9001) is None
+    assert table.add_peer_by_id("node-1", "127.0.0.1", 9000) is None
+    assert len(built) == 1
@@ -1,5 +1,9 @@
 import threading
+import time
 
+import pytest
+
+from networking import tcp_client
 from networking.tcp_server import TcpServer
 from networking.tcp_client import TcpClient, Peer
 from protocol.message import Message
@@ -80,3 +84,244 @@ def test_server_receives_message_from_tcp_client():
     finally:
         client.stop()
         server.stop()
+
+
+def test_server_receives_burst_in_order_from_tcp_client():
+    host = "127.0.0.1"
+    port = 0
+
+    dispatcher = DummyDispatcher()
+
+    server = TcpServer(
+        host=host,
+        port=port,
+        dispatcher=dispatcher,
+        recv_timeout_s=0.2,
+        accept_timeout_s=0.2,
+    )
+
+    server.start()
+    try:
+        bound_port = server._server_sock.getsockname()[1]
+
+        client = TcpClient(
+            connect_timeout_s=1.0,
+            send_timeout_s=1.0,
+            backoff_initial_s=0.1,
+            backoff_max_s=0.5,
+        )
+
+        peer = Peer(node_id="server", host=host, port=bound_port)
+
+        # Burst of enqueues: the worker coalesces whatever is queued
+        count = 20
+        client.add_peer(peer)
+        for i in range(count):
+            client.send_json(
+                peer.node_id,
+                Message(
+                    msg_type=MessageType.PING,
+                    sender_id="client-1",
+                    payload={"seq": i},
+                ),
+            )
+
+        deadline = time.monotonic() + 2.0
+        while len(dispatcher.messages) < count and time.monotonic() < deadline:
+            time.sleep(0.05)
+
+        assert [m.payload["seq"] for m in dispatcher.messages] == list(range(count))
+
+    finally:
+        client.stop()
+        server.stop()
+
+
+@pytest.mark.parametrize("has_sendmsg", [True, False])
+def test_burst_spanning_several_batches_arrives_in_order(monkeypatch, has_sendmsg):
+    # Both framing paths: scatter-gather sendmsg() and the joined send buffer
+    monkeypatch.setattr(tcp_client, "_HAS_SENDMSG", has_sendmsg and tcp_client._HAS_SENDMSG)
+
+    host = "127.0.0.1"
+
+    dispatcher = DummyDispatcher()
+
+    server = TcpServer(
+        host=host,
+        port=0,
+        dispatcher=dispatcher,
+        recv_timeout_s=0.2,
+        accept_timeout_s=0.2,
+    )
+
+    server.start()
+    try:
+        bound_port = server._server_sock.getsockname()[1]
+
+        client = TcpClient(
+            connect_timeout_s=1.0,
+            send_timeout_s=1.0,
+            backoff_initial_s=0.1,
+            backoff_max_s=0.5,
+        )
+
+        peer = Peer(node_id="server", host=host, port=bound_port)
+
+        # More frames than one batch holds: drained as a corked sequence
+        count = 300
+        client.add_peer(peer)
+        for i in range(count):
+            client.send_json(peer.node_id, {"type": "PING", "sender_id": "c", "payload": {"seq": i}})
+
+        deadline = time.monotonic() + 3.0
+        while len(dispatcher.messages) < count and time.monotonic() < deadline:
+            time.sleep(0.05)
+
+        assert [m.payload["seq"] for m in dispatcher.messages] == list(range(count))
+
+    finally:
+        client.stop()
+        server.stop()
+
+
+def test_send_raw_delivers_pre_encoded_payload():
+    host = "127.0.0.1"
+
+    dispatcher = DummyDispatcher()
+
+    server = TcpServer(
+        host=host,
+        port=0,
+        dispatcher=dispatcher,
+        recv_timeout_s=0.2,
+        accept_timeout_s=0.2,
+    )
+
+    server.start()
+    try:
+        bound_port = server._server_sock.getsockname()[1]
+
+        client = TcpClient(
+            connect_timeout_s=1.0,
+            send_timeout_s=1.0,
+            backoff_initial_s=0.1,
+            backoff_max_s=0.5,
+        )
+
+        peer = Peer(node_id="server", host=host, port=bound_port)
+        client.add_peer(peer)
+
+        msg = Message(
+            msg_type=MessageType.PING,
+            sender_id="client-1",
+            payload={"timestamp": 456},
+        )
+
+        client.send_raw(peer.node_id, msg.to_bytes())
+
+        assert dispatcher.wait(2.0) is True
+        assert dispatcher.messages[0].payload["timestamp"] == 456
+
+    finally:
+        client.stop()
+        server.stop()
+
+
+def test_send_raw_batch_delivers_frames_in_order():
+    host = "127.0.0.1"
+
+    dispatcher = DummyDispatcher()
+
+    server = TcpServer(
+        host=host,
+        port=0,
+        dispatcher=dispatcher,
+        recv_timeout_s=0.2,
+        accept_timeout_s=0.2,
+    )
+
+    server.start()
+    try:
+        bound_port = server._server_sock.getsockname()[1]
+
+        client = TcpClient(
+            connect_timeout_s=1.0,
+            send_timeout_s=1.0,
+            backoff_initial_s=0.1,
+            backoff_max_s=0.5,
+        )
+
+        peer = Peer(node_id="server", host=host, port=bound_port)
+        client.add_peer(peer)
+
+        payloads = [
+            Message(
+                msg_type=MessageType.PING,
+                sender_id="client-1",
+                payload={"seq": i},
+            ).to_bytes()
+            for i in range(5)
+        ]
+        client.send_raw_batch(peer.node_id, payloads)
+
+        deadline = time.monotonic() + 2.0
+        while len(dispatcher.messages) < 5 and time.monotonic() < deadline:
+            time.sleep(0.05)
+
+        assert [m.payload["seq"] for m in dispatcher.messages] == list(range(5))
+
+        with pytest.raises(KeyError):
+            client.send_raw_batch("unknown", payloads)
+
+    finally:
+        client.stop()
+        server.stop()
+
+
+def test_send_json_many_fans_out_and_reports_unknown_peers():
+    host = "127.0.0.1"
+
+    dispatcher = DummyDispatcher()
+
+    server = TcpServer(
+        host=host,
+        port=0,
+        dispatcher=dispatcher,
+        recv_timeout_s=0.2,
+        accept_timeout_s=0.2,
+    )
+
+    server.start()
+    try:
+        bound_port = server._server_sock.getsockname()[1]
+
+        client = TcpClient(
+            connect_timeout_s=1.0,
+            send_timeout_s=1.0,
+            backoff_initial_s=0.1,
+            backoff_max_s=0.5,
+        )
+
+        # Two logical peers pointing at the same server
+        client.add_peer(Peer(node_id="a", host=host, port=bound_port))
+        client.add_peer(Peer(node_id="b", host=host, port=bound_port))
+
+        msg = Message(
+            msg_type=MessageType.PING,
+            sender_id="client-1",
+            payload={"timestamp": 789},
+        )
+
+        unknown = client.send_json_many(["a", "b", "missing"], msg)
+        assert unknown == ["missing"]
+
+        deadline = time.monotonic() + 2.0
+        while len(dispatcher.messages) < 2 and time.monotonic() < deadline:
+            time.sleep(0.05)
+
+        assert len(dispatcher.messages) == 2
+        assert all(m.payload["timestamp"] == 789 for m in dispatcher.messages)
+
+    finally:
+        client.stop()
+        server.stop()
@@ -0,0 +1,140 @@
+import json
+import socket
+import threading
+import time
+
+import pytest
+
+from networking import tcp_client
+from networking.tcp_client import Peer, _PeerWorker
+from protocol.message import Serializable
+
+
+def make_worker(host="peer.example", port=9000):
+    return _PeerWorker(
+        peer=Peer(node_id="p1", host=host, port=port),
+        stop_event=threading.Event(),
+        connect_timeout_s=0.2,
+        send_timeout_s=0.2,
+        max_frame_size=1024,
+        backoff_initial_s=0.1,
+        backoff_max_s=0.5,
+        backoff_mode="exponential",
+        idle_check_interval_s=0.1,
+        tcp_keepalive=False,
+    )
+
+
+def test_resolve_caches_successful_lookup(monkeypatch):
+    calls = []
+
+    def fake_getaddrinfo(host, port, type=0):
+        calls.append((host, port))
+        return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("10.0.0.7", port))]
+
+    monkeypatch.setattr(tcp_client.socket, "getaddrinfo", fake_getaddrinfo)
+    worker = make_worker()
+
+    assert worker._resolve() == (socket.AF_INET, ("10.0.0.7", 9000))
+    assert worker._resolve() == (socket.AF_INET, ("10.0.0.7", 9000))
+    assert calls == [("peer.example", 9000)]
+
+
+def test_resolve_caches_failed_lookup_until_ttl(monkeypatch):
+    calls = []
+    now = [100.0]
+
+    def failing_getaddrinfo(host, port, type=0):
+        calls.append(host)
+        raise socket.gaierror(socket.EAI_AGAIN, "temporary failure")
+
+    monkeypatch.setattr(tcp_client.socket, "getaddrinfo", failing_getaddrinfo)
+    monkeypatch.setattr(tcp_client.time, "monotonic", lambda: now[0])
+    worker = make_worker()
+
+    assert worker._resolve() is None
+    assert worker._resolve() is None
+    assert len(calls) == 1
+
+    # Retried once the negative entry expires
+    now[0] += tcp_client._NEGATIVE_ADDR_TTL_S + 0.1
+    assert worker._resolve() is None
+    assert len(calls) == 2
+
+
+def test_send_json_many_does_not_wait_for_unreachable_peers():
+    # Fan-out only enqueues; connects happen on the per-peer workers, so a
+    # dead bootstrap peer cannot stall sends to the others.
+    client = tcp_client.TcpClient(
+        connect_timeout_s=0.3,
+        backoff_initial_s=0.1,
+        backoff_max_s=0.2,
+    )
+    try:
+        client.add_peer(Peer(node_id="dead", host="10.255.255.1", port=9))
+        client.add_peer(Peer(node_id="also-dead", host="127.0.0.1", port=9))
+
+        started = time.monotonic()
+        unknown = client.send_json_many(["dead", "also-dead", "missing"], {"type": "PING"})
+        elapsed = time.monotonic() - started
+
+        assert unknown == ["missing"]
+        assert elapsed < 0.1
+    finally:
+        client.stop()
+
+
+def test_send_json_encodes_plain_values_eagerly():
+    client = tcp_client.TcpClient(
+        connect_timeout_s=0.3,
+        max_frame_size=64,
+        backoff_initial_s=0.1,
+        backoff_max_s=0.2,
+    )
+    try:
+        client.add_peer(Peer(node_id="p1", host="127.0.0.1", port=9))
+
+        payload = {"type": "PING", "seq": [1]}
+        client.send_json("p1", payload)
+        payload["seq"].append(2)  # caller reuses its dict after sending
+
+        # the peer is unreachable, so the frame is still queued as bytes
+        (queued,) = client._workers["p1"]._queue
+        assert json.loads(queued) == {"type": "PING", "seq": [1]}
+
+        with pytest.raises(TypeError):
+            client.send_json("p1", {"nested": {"bad": object()}})
+        with pytest.raises(ValueError):
+            client.send_json("p1", {"blob": "x" * 100})
+    finally:
+        client.stop()
+
+
+def test_collect_batch_drops_bad_objects_and_keeps_going():
+    class Exploding(Serializable):
+        def to_bytes(self):
+            raise RuntimeError("dictionary changed size during iteration")
+
+    class Oversize(Serializable):
+        def to_bytes(self):
+            return b"x" * 2048
+
+    worker = make_worker()
+    worker.enqueue_many([Exploding(), b"ok-1", Oversize(), b"ok-2"])
+
+    assert worker._collect_batch() == [b"ok-1", b"ok-2"]
+    assert worker.dropped == 2
+
+
+def test_backoff_jitter_differs_between_workers_for_same_peer():
+    # one worker per node, all reconnecting to the same restarted peer
+    def delays(worker):
+        slept = []
+        worker._sleep_interruptible = slept.append
+        for _ in range(5):
+            worker._sleep_backoff(0.1)
+        return slept
+
+    a, b = make_worker(), make_worker()
+
+    assert delays(a) != delays(b)
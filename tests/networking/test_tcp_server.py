@@ -1,6 +1,10 @@
+import os
 import socket
 import struct
 import threading
+import time
+
+import pytest
 
 from networking.tcp_server import TcpServer
 from protocol.message import Message
@@ -58,3 +62,181 @@ def test_tcp_server_dispatches_message(tmp_path):
         assert dispatcher.messages[0].msg_type == MessageType.PING
     finally:
         server.stop()
+
+
+def test_tcp_server_reassembles_split_frames_across_connections():
+    host = "127.0.0.1"
+
+    dispatcher = DummyDispatcher()
+
+    server = TcpServer(
+        host=host,
+        port=0,
+        dispatcher=dispatcher,
+        recv_timeout_s=0.2,
+        accept_timeout_s=0.2,
+    )
+
+    server.start()
+    try:
+        bound_port = server._server_sock.getsockname()[1]
+
+        payloads = [
+            Message(MessageType.PING, f"node-{i}", {"seq": i}).to_bytes()
+            for i in range(3)
+        ]
+        frames = [struct.pack(">I", len(p)) + p for p in payloads]
+
+        a = socket.create_connection((host, bound_port), timeout=2.0)
+        b = socket.create_connection((host, bound_port), timeout=2.0)
+        try:
+            # Header and payload split across writes, interleaved connections
+            a.sendall(frames[0][:2])
+            b.sendall(frames[1])
+            time.sleep(0.05)
+            a.sendall(frames[0][2:] + frames[2])
+
+            deadline = time.monotonic() + 2.0
+            while len(dispatcher.messages) < 3 and time.monotonic() < deadline:
+                time.sleep(0.02)
+        finally:
+            a.close()
+            b.close()
+
+        assert sorted(m.payload["seq"] for m in dispatcher.messages) == [0, 1, 2]
+    finally:
+        server.stop()
+
+
+def test_tcp_server_receives_frame_larger_than_recv_chunk():
+    host = "127.0.0.1"
+
+    dispatcher = DummyDispatcher()
+
+    server = TcpServer(
+        host=host,
+        port=0,
+        dispatcher=dispatcher,
+        recv_timeout_s=0.2,
+        accept_timeout_s=0.2,
+    )
+
+    server.start()
+    try:
+        bound_port = server._server_sock.getsockname()[1]
+
+        blob = "x" * (300 * 1024)
+        msg = Message(MessageType.PING, "node-1", {"blob": blob})
+
+        _send_frame(host, bound_port, msg.to_bytes())
+
+        assert dispatcher.wait(2.0) is True
+        assert dispatcher.messages[0].payload["blob"] == blob
+    finally:
+        server.stop()
+
+
+def test_tcp_server_with_multiple_reactors():
+    host = "127.0.0.1"
+
+    dispatcher = DummyDispatcher()
+
+    server = TcpServer(
+        host=host,
+        port=0,
+        dispatcher=dispatcher,
+        recv_timeout_s=0.2,
+        accept_timeout_s=0.2,
+        reactor_threads=3,
+    )
+
+    server.start()
+    try:
+        bound_port = server._server_sock.getsockname()[1]
+
+        for i in range(6):
+            msg = Message(MessageType.PING, f"node-{i}", {"seq": i})
+            _send_frame(host, bound_port, msg.to_bytes())
+
+        deadline = time.monotonic() + 2.0
+        while len(dispatcher.messages) < 6 and time.monotonic() < deadline:
+            time.sleep(0.02)
+
+        assert sorted(m.payload["seq"] for m in dispatcher.messages) == list(range(6))
+    finally:
+        server.stop()
+
+
+def test_tcp_server_accepts_burst_of_queued_connections():
+    host = "127.0.0.1"
+
+    dispatcher = DummyDispatcher()
+
+    server = TcpServer(
+        host=host,
+        port=0,
+        dispatcher=dispatcher,
+        recv_timeout_s=0.2,
+        accept_timeout_s=0.2,
+    )
+
+    server.start()
+    try:
+        bound_port = server._server_sock.getsockname()[1]
+
+        # All connections are queued in the backlog before any is served;
+        # one accept per readiness event must still pick up every one
+        socks = [socket.create_connection((host, bound_port), timeout=2.0) for _ in range(20)]
+        try:
+            for i, s in enumerate(socks):
+                payload = Message(MessageType.PING, f"node-{i}", {"seq": i}).to_bytes()
+                s.sendall(struct.pack(">I", len(payload)) + payload)
+
+            deadline = time.monotonic() + 2.0
+            while len(dispatcher.messages) < 20 and time.monotonic() < deadline:
+                time.sleep(0.02)
+        finally:
+            for s in socks:
+                s.close()
+
+        assert sorted(m.payload["seq"] for m in dispatcher.messages) == list(range(20))
+    finally:
+        server.stop()
+
+
+@pytest.mark.skipif(not hasattr(os, "sched_setaffinity"), reason="Linux only")
+def test_tcp_server_pins_reactors_to_cpu_affinity():
+    host = "127.0.0.1"
+    cpu = min(os.sched_getaffinity(0))
+
+    dispatcher = DummyDispatcher()
+
+    server = TcpServer(
+        host=host,
+        port=0,
+        dispatcher=dispatcher,
+        recv_timeout_s=0.2,
+        accept_timeout_s=0.2,
+        reactor_threads=2,
+        cpu_affinity=[cpu],
+    )
+
+    server.start()
+    try:
+        bound_port = server._server_sock.getsockname()[1]
+
+        msg = Message(MessageType.PING, "node-1", {"seq": 1})
+        _send_frame(host, bound_port, msg.to_bytes())
+        assert dispatcher.wait(2.0) is True
+
+        # each reactor pins itself when its loop starts
+        tids = [reactor.thread.native_id for reactor in server._reactors]
+        deadline = time.monotonic() + 2.0
+        while time.monotonic() < deadline:
+            if all(os.sched_getaffinity(tid) == {cpu} for tid in tids):
+                break
+            time.sleep(0.02)
+
+        assert all(os.sched_getaffinity(tid) == {cpu} for tid in tids)
+    finally:
+        server.stop()
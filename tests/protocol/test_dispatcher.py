@@ -64,3 +64,19 @@ def test_duplicate_handler_registration_fails():
 
     with pytest.raises(ProtocolError):
         dispatcher.register(MessageType.PING, handler)
+
+
+def test_from_table_dispatches_and_leaves_missing_types_unhandled():
+    called = []
+
+    dispatcher = MessageDispatcher.from_table({
+        MessageType.PING: lambda msg: called.append(msg.msg_type),
+    })
+
+    dispatcher.dispatch(Message(msg_type=MessageType.PING, sender_id="node-1", payload={}))
+    dispatcher.dispatch(Message(msg_type=MessageType.PONG, sender_id="node-1", payload={}))  # must not raise
+
+    assert called == [MessageType.PING]
+
+    with pytest.raises(ProtocolError):
+        dispatcher.register(MessageType.PING, lambda msg: None)
@@ -15,3 +15,11 @@ def test_encode_decode_roundtrip():
 	assert decoded.sender_id == original.sender_id
 	assert decoded.payload == original.payload
 	assert decoded.timestamp == original.timestamp
+
+@pytest.mark.protocol
+def test_to_bytes_is_memoized():
+	msg = Message(MessageType.PING, "node1", {"v": 1})
+
+	first = msg.to_bytes()
+	assert msg.to_bytes() is first
+	assert Message.decode(first).payload == {"v": 1}
@@ -15,3 +15,8 @@ def test_from_json_invalid_type():
 def test_from_json_missing_sender_id():
 	with pytest.raises(ValueError):
 		Message.from_json({"type": "PING"})
+
+@pytest.mark.protocol
+def test_from_json_non_string_type():
+	with pytest.raises(ValueError):
+		Message.from_json({"type": ["PING"], "sender_id": "n1"})
@@ -29,3 +29,13 @@ def test_invalid_payload_type():
 def test_invalid_timestamp():
 	with pytest.raises(ValueError):
 		Message(MessageType.PING, "n1", {}, timestamp="bad")
+
+@pytest.mark.protocol
+def test_new_trusted_builds_equivalent_message():
+	msg = Message.new_trusted(MessageType.PING, "node1", {"k": 1}, timestamp=42)
+
+	assert msg.msg_type == MessageType.PING
+	assert msg.sender_id == "node1"
+	assert msg.payload == {"k": 1}
+	assert msg.timestamp == 42
+	assert Message.decode(msg.to_bytes()).payload == {"k": 1}
@@ -0,0 +1,77 @@
+import pytest
+from protocol.handlers import make_sensor_update_batch_handler, make_sensor_update_handler
+from protocol.message import Message
+from protocol.message_types import MessageType
+
+
+class FakeStateWorker:
+	def __init__(self):
+		self.merged = []
+
+	def merge_update(self, sensor_id, value, ts_ms, origin, meta=None):
+		self.merged.append((sensor_id, value, ts_ms, origin, meta))
+		return True
+
+	def merge_updates(self, updates):
+		for update in updates:
+			self.merge_update(*update)
+		return len(updates)
+
+
+def _update(payload, sender_id="node-2"):
+	return Message(MessageType.SENSOR_UPDATE, sender_id, payload)
+
+
+@pytest.mark.protocol
+def test_sensor_update_merged_with_default_origin():
+	worker = FakeStateWorker()
+	handle = make_sensor_update_handler(worker, "node-1")
+
+	handle(_update({"sensor_id": "t@0", "value": 21.5, "ts_ms": 1000}))
+
+	assert worker.merged == [("t@0", 21.5, 1000, "node-2", {})]
+
+
+@pytest.mark.protocol
+@pytest.mark.parametrize("payload", [
+	{"value": 1, "ts_ms": 1000},
+	{"sensor_id": "", "value": 1, "ts_ms": 1000},
+	{"sensor_id": "t@0", "value": 1, "ts_ms": "1000"},
+	{"sensor_id": "t@0", "value": 1, "ts_ms": 1000, "origin": 7},
+])
+def test_invalid_sensor_update_ignored(payload):
+	worker = FakeStateWorker()
+	handle = make_sensor_update_handler(worker, "node-1")
+
+	handle(_update(payload))
+
+	assert worker.merged == []
+
+
+@pytest.mark.protocol
+def test_sensor_update_batch_merges_valid_items():
+	worker = FakeStateWorker()
+	handle = make_sensor_update_batch_handler(worker, "node-1")
+
+	handle(Message(MessageType.SENSOR_UPDATE_BATCH, "node-2", {"items": [
+		{"sensor_id": "t@0", "value": 21.5, "ts_ms": 1000},
+		{"sensor_id": "", "value": 1, "ts_ms": 1000},
+		"not-an-object",
+		{"sensor_id": "h@1", "value": 40, "ts_ms": 1001, "origin": "node-3", "meta": {"unit": "%"}},
+	]}))
+
+	assert worker.merged == [
+		("t@0", 21.5, 1000, "node-2", {}),
+		("h@1", 40, 1001, "node-3", {"unit": "%"}),
+	]
+
+
+@pytest.mark.protocol
+@pytest.mark.parametrize("payload", [{}, {"items": "nope"}, {"items": []}])
+def test_invalid_sensor_update_batch_ignored(payload):
+	worker = FakeStateWorker()
+	handle = make_sensor_update_batch_handler(worker, "node-1")
+
+	handle(Message(MessageType.SENSOR_UPDATE_BATCH, "node-2", payload))
+
+	assert worker.merged == []
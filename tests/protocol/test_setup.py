@@ -0,0 +1,62 @@
+import pytest
+
+from protocol.message import Message
+from protocol.message_types import MessageType
+from protocol.setup import setup_protocol
+
+
+class RecordingStateWorker:
+	def __init__(self):
+		self.merged = []
+
+	def merge_update(self, sensor_id, value, ts_ms, origin, meta=None):
+		self.merged.append((sensor_id, value, ts_ms, origin))
+		return True
+
+	def merge_updates(self, updates):
+		for sensor_id, value, ts_ms, origin, _meta in updates:
+			self.merge_update(sensor_id, value, ts_ms, origin)
+		return len(updates)
+
+
+@pytest.mark.protocol
+def test_setup_protocol_registers_every_message_type():
+	dispatcher, _peer_table = setup_protocol(self_node_id="n1", send_function=lambda *_: None)
+
+	assert all(handler is not None for handler in dispatcher._handler_table)
+
+
+@pytest.mark.protocol
+def test_setup_protocol_binds_sensor_update_to_state_worker():
+	worker = RecordingStateWorker()
+	dispatcher, _peer_table = setup_protocol(
+		self_node_id="n1",
+		send_function=lambda *_: None,
+		state_worker=worker,
+	)
+
+	dispatcher.dispatch(Message(
+		msg_type=MessageType.SENSOR_UPDATE,
+		sender_id="n2",
+		payload={"sensor_id": "temp", "value": 21.5, "ts_ms": 1000},
+	))
+
+	assert worker.merged == [("temp", 21.5, 1000, "n2")]
+
+
+@pytest.mark.protocol
+def test_setup_protocol_binds_sensor_update_batch_to_state_worker():
+	worker = RecordingStateWorker()
+	dispatcher, _peer_table = setup_protocol(
+		self_node_id="n1",
+		send_function=lambda *_: None,
+		state_worker=worker,
+	)
+
+	dispatcher.dispatch(Message(
+		msg_type=MessageType.SENSOR_UPDATE_BATCH,
+		sender_id="n2",
+		payload={"items": [{"sensor_id": "temp", "value": 21.5, "ts_ms": 1000}]},
+	))
+
+	assert worker.merged == [("temp", 21.5, 1000, "n2")]
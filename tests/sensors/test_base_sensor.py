@@ -19,7 +19,8 @@ def test_base_sensor_start_stop():
 			return 1
 
 	def cb(evt):
-		results.append((evt["sensor_id"], evt["value"], evt["ts_ms"]))
+		sensor_id, value, ts_ms, _meta = evt
+		results.append((sensor_id, value, ts_ms))
 
 	s = Dummy("dummy", 50, cb)
 
@@ -29,3 +30,74 @@ def test_base_sensor_start_stop():
 
 	assert len(results) >= 1
 	assert results[0][0] == "dummy"
+
+
+@pytest.mark.sensors
+def test_base_sensor_timestamps_follow_period():
+	results = []
+
+	class Dummy(BaseSensor):
+		def generate_value(self):
+			return 1
+
+	before_ms = int(time.time() * 1000)
+	s = Dummy("dummy", 20, lambda evt: results.append(evt[2]))
+
+	s.start()
+	time.sleep(0.15)
+	s.stop()
+
+	assert len(results) >= 3
+	assert results[0] >= before_ms
+	# deadline-derived: consecutive samples are exactly one period apart
+	assert all(b - a in (19, 20, 21) for a, b in zip(results, results[1:]))
+
+
+@pytest.mark.sensors
+def test_base_sensor_make_ticker_emits_event():
+	results = []
+
+	class Dummy(BaseSensor):
+		def generate_value(self):
+			return 7
+
+	s = Dummy("dummy", 250, results.append, unit="C")
+	tick = s.make_ticker()
+
+	tick(1234)
+
+	assert results == [("dummy", 7, 1234, {"unit": "C", "period_ms": 250})]
+
+
+@pytest.mark.sensors
+def test_base_sensor_reuses_meta_template():
+	results = []
+
+	class Dummy(BaseSensor):
+		def generate_value(self):
+			return 1
+
+	s = Dummy("dummy", 100, results.append, unit="C")
+	tick = s.make_ticker()
+	tick(1)
+	tick(2)
+	s.tick(3)
+
+	metas = [evt[3] for evt in results]
+	assert metas[0] == {"unit": "C", "period_ms": 100}
+	assert metas[0] is metas[1] is metas[2]
+
+
+@pytest.mark.sensors
+def test_make_generator_respects_generate_value_override():
+	from sensors.numeric_sensor import NumericSensor
+
+	class Fixed(NumericSensor):
+		def generate_value(self):
+			return 42
+
+	s = Fixed("fixed", 0, 1, 100, lambda evt: None)
+	assert s.make_generator()() == 42
+
+	plain = NumericSensor("plain", 0, 1, 100, lambda evt: None)
+	assert 0 <= plain.make_generator()() < 1
@@ -9,3 +9,16 @@ def test_categorical_sensor_values():
     value = s.generate_value()
 
     assert value in choices
+
+
+@pytest.mark.sensors
+def test_categorical_sensor_generator_covers_all_categories():
+    choices = ["red", "green", "blue"]
+    s = CategoricalSensor("cat", choices, 100, None)
+    gen = s.make_generator()
+
+    assert {gen() for _ in range(500)} == set(choices)
+
+    single = CategoricalSensor("one", ["only"], 100, None)
+    assert single.make_generator()() == "only"
+    assert single.generate_value() == "only"
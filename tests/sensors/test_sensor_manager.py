@@ -1,4 +1,6 @@
 import os
+import threading
+import time
 import pytest
 
 from sensors.sensor_manager import SensorManager
@@ -20,3 +22,117 @@ def test_sensor_manager_load_from_env(monkeypatch):
 	assert len(mgr.sensors) == 1
 	assert isinstance(mgr.sensors[0], NumericSensor)
 	assert mgr.sensors[0].sensor_id == "temp1@0"
+
+
+@pytest.mark.sensors
+def test_sensor_manager_drives_sensors_from_one_thread(monkeypatch):
+	monkeypatch.setenv("SENSORS", "2")
+	monkeypatch.setenv("SENSOR_0_TYPE", "numeric")
+	monkeypatch.setenv("SENSOR_0_MIN", "0")
+	monkeypatch.setenv("SENSOR_0_MAX", "1")
+	monkeypatch.setenv("SENSOR_0_PERIOD_MS", "20")
+	monkeypatch.setenv("SENSOR_1_TYPE", "boolean")
+	monkeypatch.setenv("SENSOR_1_PERIOD_MS", "30")
+
+	events = []
+	threads = []
+
+	def cb(evt):
+		events.append(evt[0])
+		threads.append(threading.get_ident())
+
+	mgr = SensorManager(callback=cb)
+	mgr.load_from_env()
+
+	mgr.start_all()
+	time.sleep(0.2)
+	mgr.stop_all()
+
+	assert "sensor_0@0" in events
+	assert "sensor_1@1" in events
+	assert len(set(threads)) == 1
+
+	# no ticks after stop_all()
+	count = len(events)
+	time.sleep(0.05)
+	assert len(events) == count
+
+
+@pytest.mark.sensors
+def test_sensor_manager_builds_every_type(monkeypatch):
+	types = ["numeric", "boolean", "categorical", "incremental", "trend", "spike", "wave", "noise"]
+	monkeypatch.setenv("SENSORS", str(len(types)))
+	for i, s_type in enumerate(types):
+		monkeypatch.setenv(f"SENSOR_{i}_TYPE", s_type)
+		monkeypatch.setenv(f"SENSOR_{i}_PERIOD_MS", "100")
+	monkeypatch.setenv("SENSOR_0_MIN", "0")
+	monkeypatch.setenv("SENSOR_0_MAX", "1")
+	monkeypatch.setenv("SENSOR_2_VALUES", "a, b")
+
+	mgr = SensorManager(callback=lambda *_: None)
+	mgr.load_from_env()
+
+	assert [type(s).__name__ for s in mgr.sensors] == [
+		"NumericSensor", "BooleanSensor", "CategoricalSensor", "IncrementalSensor",
+		"TrendSensor", "SpikeSensor", "WaveSensor", "NoiseSensor",
+	]
+	assert mgr.sensors[2].categories == ["a", "b"]
+
+
+@pytest.mark.sensors
+def test_sensor_manager_rejects_unsupported_type(monkeypatch):
+	monkeypatch.setenv("SENSORS", "1")
+	monkeypatch.setenv("SENSOR_0_TYPE", "laser")
+	monkeypatch.setenv("SENSOR_0_PERIOD_MS", "100")
+
+	mgr = SensorManager(callback=lambda *_: None)
+	with pytest.raises(ValueError, match="Unsupported sensor type"):
+		mgr.load_from_env()
+
+
+@pytest.mark.sensors
+def test_sensor_manager_ticks_same_period_group_together():
+	events = []
+	mgr = SensorManager(callback=events.append)
+
+	class Failing(NumericSensor):
+		def generate_value(self):
+			raise RuntimeError("boom")
+
+	mgr.sensors = [
+		NumericSensor("a", 0, 1, 20, events.append),
+		Failing("bad", 0, 1, 20, events.append),
+		NumericSensor("b", 0, 1, 20, events.append),
+	]
+
+	mgr.start_all()
+	time.sleep(0.15)
+	mgr.stop_all()
+
+	ts_a = [evt[2] for evt in events if evt[0] == "a"]
+	ts_b = [evt[2] for evt in events if evt[0] == "b"]
+
+	# the failing member is dropped, the rest of its group keeps ticking
+	assert len(ts_a) > 1
+	assert ts_a[:len(ts_b)] == ts_b[:len(ts_a)]
+
+
+@pytest.mark.sensors
+def test_sensor_manager_batch_callback_gets_one_call_per_wake():
+	batches = []
+	single = []
+	mgr = SensorManager(callback=single.append, batch_callback=lambda evts: batches.append(list(evts)))
+	mgr.sensors = [
+		NumericSensor("a", 0, 1, 20, single.append),
+		NumericSensor("b", 0, 1, 20, single.append),
+	]
+
+	mgr.start_all()
+	time.sleep(0.1)
+	mgr.stop_all()
+
+	assert single == []
+	assert batches
+	for batch in batches:
+		assert [evt[0] for evt in batch] == ["a", "b"]
+		assert batch[0][2] == batch[1][2]
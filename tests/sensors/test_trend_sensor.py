@@ -11,3 +11,14 @@ def test_trend_sensor_increasing():
     v3 = s.generate_value()
 
     assert v1 < v2 < v3
+
+
+@pytest.mark.sensors
+def test_trend_sensor_generator_keeps_value_on_sensor():
+    s = TrendSensor("trend", start=0, slope=1, noise=0, period_ms=100, callback=None)
+    gen = s.make_generator()
+
+    assert gen() == 1
+    assert gen() == 2
+    assert s.value == 2
+    assert s.generate_value() == 3
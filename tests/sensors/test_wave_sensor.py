@@ -9,3 +9,13 @@ def test_wave_sensor_output_within_amplitude():
     v = s.generate_value()
 
     assert -5 <= v <= 5
+
+
+@pytest.mark.sensors
+def test_wave_sensor_advances_one_period_per_sample():
+    # 1 Hz sampled every 250 ms: a quarter turn per sample
+    s = WaveSensor("wave", amplitude=2, frequency=1, period_ms=250, callback=None)
+
+    values = [s.generate_value() for _ in range(5)]
+
+    assert values == pytest.approx([0.0, 2.0, 0.0, -2.0, 0.0], abs=1e-9)
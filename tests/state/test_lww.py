@@ -1,6 +1,11 @@
 # tests/state/test_lww.py
+import threading
+import time
 from queue import Queue
-from state.node_state_worker import NodeStateWorker
+
+import pytest
+
+from state.node_state_worker import NodeStateWorker, SensorRecord
 
 
 class DummyLog:
@@ -71,4 +76,291 @@ def test_tie_break_origin_lower_loses():
 	assert applied is False
 	state = w.get_state_snapshot()["A"]
 	assert state["B:s1"]["value"] == 10
-	assert state["B:s1"]["origin"] == "B"
\ No newline at end of file
+	assert state["B:s1"]["origin"] == "B"
+
+def test_merge_updates_applies_batch_winners():
+	w = make_worker()
+	w.merge_update("s1", 1, 500, "A")
+
+	applied = w.merge_updates([
+		("s1", 10, 1000, "A", None),
+		("s1", 30, 3000, "A", None),
+		("s1", 20, 2000, "A", None),
+		("s2", 5, 100, "A", {"unit": "C"}),
+		("", 99, 100, "A", None),
+	])
+
+	assert applied == 2
+	state = w.get_state_snapshot()["A"]
+	assert state["A:s1"]["value"] == 30
+	assert state["A:s2"]["meta"]["unit"] == "C"
+	assert len(state) == 2
+
+
+def test_run_drains_queued_events():
+	w = make_worker()
+	for ts in (1000, 2000, 3000):
+		w.event_queue.put(("s1", ts, ts, {}))
+
+	w.start()
+	try:
+		deadline = time.monotonic() + 2.0
+		while time.monotonic() < deadline:
+			state = w.get_state_snapshot()["A"]
+			if state.get("A:s1", {}).get("value") == 3000:
+				break
+			time.sleep(0.01)
+	finally:
+		w.stop()
+
+	assert w.event_queue.empty()
+	assert w.get_state_snapshot()["A"]["A:s1"]["value"] == 3000
+
+
+def test_concurrent_merges_across_shards():
+	w = make_worker()
+
+	def writer(origin):
+		for i in range(200):
+			w.merge_update(f"s{i}", origin, 1000, origin)
+
+	threads = [threading.Thread(target=writer, args=(o,)) for o in ("A", "B", "C")]
+	for t in threads:
+		t.start()
+	for t in threads:
+		t.join()
+
+	state = w.get_state_snapshot()["A"]
+	assert len(state) == 200
+	# equal timestamps: the largest origin wins every sensor
+	assert all(rec["origin"] == "C" for rec in state.values())
+
+	repl = w.pop_replication_updates()["A"]
+	assert len(repl) == 200
+	assert w.pop_replication_updates() == {"A": {}}
+
+
+def test_snapshots_are_detached_from_state():
+	w = make_worker()
+	w.merge_update("s1", 10, 1000, "A", {"unit": "C"})
+
+	snap = w.get_state_snapshot()["A"]
+	assert snap["A:s1"]["meta"] == {"unit": "C", "period_ms": None}
+
+	# snapshots are plain dicts rendered from frozen records
+	snap["A:s1"]["value"] = 99
+	snap["A:s1"]["meta"]["unit"] = "F"
+	snap.clear()
+
+	rec = w.get_state_snapshot()["A"]["A:s1"]
+	assert rec["value"] == 10
+	assert rec["meta"]["unit"] == "C"
+
+
+def test_sensor_record_is_frozen_and_slotted():
+	rec = SensorRecord(1.0, 1000, "A", "C", 500)
+
+	assert not hasattr(rec, "__dict__")
+	with pytest.raises(AttributeError):
+		rec.value = 2.0
+
+
+def test_pop_replication_updates_keeps_latest_per_sensor():
+	w = make_worker()
+	w.merge_update("s1", 10, 1000, "A")
+	w.merge_update("s1", 20, 2000, "A")
+	w.merge_update("s1", 5, 1500, "A")  # stale, never queued
+	w.merge_update("s2", 1, 1000, "A")
+
+	repl = w.pop_replication_updates()["A"]
+	assert set(repl) == {"A:s1", "A:s2"}
+	assert repl["A:s1"]["value"] == 20
+
+
+def test_global_sensor_ids_are_cached():
+	w = make_worker()
+	w.merge_update("s1", 10, 1000, "A")
+
+	key1 = next(iter(w.get_state_snapshot()["A"]))
+	key2 = next(iter(w.pop_replication_updates()["A"]))
+	assert key1 == "A:s1"
+	assert key1 is key2
+
+
+def test_merge_skips_log_formatting_when_level_disabled():
+	class QuietLog(DummyLog):
+		def __init__(self):
+			self.calls = 0
+
+		def isEnabledFor(self, level):
+			return False
+
+		def info(self, *args, **kwargs):
+			self.calls += 1
+
+		debug = info
+
+	log = QuietLog()
+	w = NodeStateWorker(node_id="A", event_queue=Queue(), log=log)
+	w.merge_update("s1", 10, 1000, "A")
+	w.merge_update("s1", 5, 500, "A")
+
+	assert log.calls == 0
+
+
+def test_updates_snapshot_is_independent_of_replication():
+	w = make_worker()
+	w.merge_update("s1", 10, 1000, "A")
+	w.merge_update("s1", 20, 2000, "A")
+
+	ui = w.get_updates_snapshot()["A"]
+	assert list(ui) == ["A:s1"]
+	assert ui["A:s1"]["value"] == 20
+	assert w.get_updates_snapshot() == {"A": {}}
+
+	# draining the UI stream does not steal replication updates
+	assert w.pop_replication_updates()["A"]["A:s1"]["value"] == 20
+
+
+def test_dump_full_state_groups_by_origin():
+	w = make_worker()
+	w.merge_update("s2", 2, 1000, "B", {"unit": "C", "period_ms": 500})
+	w.merge_update("s1", 1, 1000, "B")
+	w.merge_update("s3", 3, 1000, "A")
+
+	dump = w.dump_full_state()
+
+	assert dump["total"] == 3
+	assert list(dump["by_origin"]) == ["A", "B"]
+	assert dump["by_origin"]["B"]["count"] == 2
+	assert [s["sensor_id"] for s in dump["by_origin"]["B"]["sensors"]] == ["s1", "s2"]
+	assert dump["by_origin"]["B"]["sensors"][1] == {
+		"sensor_id": "s2", "ts_ms": 1000, "value": 2, "unit": "C", "period_ms": 500,
+	}
+
+
+def test_log_full_state_lists_every_record():
+	class RecordingLog(DummyLog):
+		def __init__(self):
+			self.lines = []
+
+		def info(self, msg, *args, **kwargs):
+			self.lines.append(msg)
+
+	log = RecordingLog()
+	w = NodeStateWorker(node_id="A", event_queue=Queue(), log=log)
+	w.merge_update("s1", 1, 1000, "A")
+	w.merge_update("s2", 2, 1000, "B")
+	log.lines.clear()
+
+	w.log_full_state()
+
+	assert log.lines[0].startswith("FULL_STATE_DUMP node=A total=2")
+	assert "qdepth=0 qdepth_peak=0 qdropped=0" in log.lines[0]
+	assert [line.split()[0] for line in log.lines[1:]] == ["sensor_id=s1", "sensor_id=s2"]
+
+
+def test_local_sensor_events_skip_malformed_entries():
+	w = make_worker()
+
+	w._handle_sensor_events([
+		("s1", 10, 1000, {"unit": "C", "period_ms": 100}),
+		("too", "short"),
+		("s2", 20, 1000, None),
+	])
+
+	state = w.get_state_snapshot()["A"]
+	assert list(state) == ["A:s1"]
+	assert state["A:s1"]["meta"] == {"unit": "C", "period_ms": 100}
+
+
+def test_iter_records_streams_whole_state():
+	w = make_worker()
+	for i in range(50):
+		w.merge_update(f"s{i}", i, 1000, "A")
+
+	records = dict(w.iter_records())
+
+	assert len(records) == 50
+	assert records["s7"] == SensorRecord(7, 1000, "A", None, None)
+
+
+def test_stale_update_is_rejected_before_building_a_record(monkeypatch):
+	w = make_worker()
+	w.merge_update("s1", 10, 2000, "A")
+
+	built = []
+	real_record = SensorRecord
+
+	def counting_record(*args):
+		built.append(args)
+		return real_record(*args)
+
+	monkeypatch.setattr("state.node_state_worker.SensorRecord", counting_record)
+
+	assert w.merge_update("s1", 5, 1000, "B") is False
+	assert w.merge_update("s1", 6, 2000, "0") is False  # tie, smaller origin
+	assert built == []
+
+	assert w.merge_update("s1", 7, 2000, "B") is True
+	assert len(built) == 1
+
+
+def test_state_version_changes_only_on_applied_updates():
+	w = make_worker()
+	v0 = w.state_version
+
+	w.merge_update("s1", 10, 2000, "A")
+	v1 = w.state_version
+	assert v1 != v0
+
+	w.merge_update("s1", 5, 1000, "A")  # stale
+	assert w.state_version == v1
+
+	w.merge_updates([("s2", 1, 1000, "A", None)])
+	assert w.state_version != v1
+
+
+def test_state_delta_returns_records_applied_since_version():
+	w = make_worker()
+	w.merge_update("s1", 10, 1000, "A")
+	w.merge_update("s2", 20, 1000, "B")
+
+	v1, delta = w.get_state_delta(0)
+	assert set(delta["A"]) == {"A:s1", "B:s2"}
+	assert v1 == w.state_version
+
+	w.merge_update("s2", 21, 2000, "B")
+	w.merge_update("s1", 5, 500, "A")  # stale
+
+	v2, delta = w.get_state_delta(v1)
+	assert list(delta["A"]) == ["B:s2"]
+	assert delta["A"]["B:s2"]["value"] == 21
+
+	assert w.get_state_delta(v2) == (v2, {"A": {}})
+
+
+def test_state_delta_since_beyond_current_version_returns_full_state():
+	w = make_worker()
+	w.merge_update("s1", 10, 1000, "A")
+	w.merge_update("s2", 20, 1000, "A")
+
+	# e.g. a cursor kept from before a restart
+	version, delta = w.get_state_delta(w.state_version + 100)
+
+	assert version == w.state_version
+	assert set(delta["A"]) == {"A:s1", "A:s2"}
+
+
+def test_state_version_never_moves_backwards():
+	w = make_worker()
+
+	# a write on another shard drew a later number and published it first
+	w._version = 10
+
+	w.merge_update("s1", 1, 1000, "A")
+	assert w.state_version == 10
+
+	w._version_seq = iter([11])
+	w.merge_update("s2", 1, 1000, "A")
+	assert w.state_version == 11
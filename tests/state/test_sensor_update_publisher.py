@@ -0,0 +1,174 @@
+# tests/state/test_sensor_update_publisher.py
+import json
+import time
+from queue import Queue
+from types import SimpleNamespace
+
+from state.node_state_worker import NodeStateWorker
+from state.sensor_update_publisher import MAX_BATCH_ITEMS, SensorUpdatePublisher
+
+
+class DummyLog:
+	def warning(self, *args, **kwargs):
+		pass
+
+	def error(self, *args, **kwargs):
+		pass
+
+
+class DummyPeerTable:
+	def __init__(self, peers):
+		self._peers = peers
+
+	def list_peers(self):
+		return list(self._peers)
+
+
+class DummyStateWorker:
+	def __init__(self, snapshot):
+		self._snapshot = snapshot
+
+	def pop_replication_updates(self):
+		snapshot, self._snapshot = self._snapshot, {}
+		return snapshot
+
+
+class RecordingClient:
+	def __init__(self, known):
+		self.known = set(known)
+		self.added = []
+		self.batches = []
+
+	def send_raw_batch(self, peer_id, payloads):
+		if peer_id not in self.known:
+			raise KeyError(peer_id)
+		self.batches.append((peer_id, list(payloads)))
+
+	def add_peer(self, peer):
+		if peer.node_id in self.known:
+			raise RuntimeError(f"Peer already exists: {peer.node_id}")
+		self.added.append(peer.node_id)
+		self.known.add(peer.node_id)
+
+
+def _record(origin, ts_ms, value):
+	return {"value": value, "ts_ms": ts_ms, "origin": origin, "meta": {"unit": "C", "period_ms": 1000}}
+
+
+def make_publisher(snapshot, peers, client):
+	return SensorUpdatePublisher(
+		self_node_id="A",
+		peer_table=DummyPeerTable(peers),
+		tcp_client=client,
+		state_worker=DummyStateWorker(snapshot),
+		log=DummyLog(),
+	)
+
+
+def test_publish_sends_one_batch_per_peer():
+	snapshot = {
+		"A": {
+			"A:temp": _record("A", 10, 21.5),
+			"A:hum": _record("A", 11, 40),
+			"B:remote": _record("B", 12, 1),
+		}
+	}
+	peers = [
+		SimpleNamespace(node_id="B", host="b", port=9001),
+		SimpleNamespace(node_id="C", host="c", port=9002),
+	]
+	client = RecordingClient(known={"B"})
+
+	make_publisher(snapshot, peers, client)._publish_once()
+
+	# Unknown peer C is added before the send, then gets the same batch
+	assert client.added == ["C"]
+	assert [peer_id for peer_id, _ in client.batches] == ["B", "C"]
+
+	batch_b, batch_c = client.batches[0][1], client.batches[1][1]
+	assert batch_b == batch_c
+
+	# Only local-origin updates, packed into one message encoded once and
+	# shared across peers
+	assert len(batch_b) == 1
+	assert batch_b[0] is batch_c[0]
+
+	decoded = json.loads(batch_b[0])
+	assert decoded["type"] == "SENSOR_UPDATE_BATCH"
+	items = decoded["payload"]["items"]
+	assert [item["sensor_id"] for item in items] == ["temp", "hum"]
+	assert items[0] == {
+		"sensor_id": "temp",
+		"value": 21.5,
+		"ts_ms": 10,
+		"origin": "A",
+		"meta": {"unit": "C", "period_ms": 1000},
+	}
+
+
+def test_publish_without_local_updates_sends_nothing():
+	snapshot = {"A": {"B:remote": _record("B", 12, 1)}}
+	peers = [SimpleNamespace(node_id="B", host="b", port=9001)]
+	client = RecordingClient(known={"B"})
+
+	make_publisher(snapshot, peers, client)._publish_once()
+
+	assert client.batches == []
+
+
+def test_publish_splits_large_flushes_into_bounded_batches():
+	count = MAX_BATCH_ITEMS + 3
+	snapshot = {"A": {f"A:s{i}": _record("A", i, i) for i in range(count)}}
+	peers = [SimpleNamespace(node_id="B", host="b", port=9001)]
+	client = RecordingClient(known={"B"})
+
+	make_publisher(snapshot, peers, client)._publish_once()
+
+	(peer_id, batch), = client.batches
+	sizes = [len(json.loads(b)["payload"]["items"]) for b in batch]
+	assert sizes == [MAX_BATCH_ITEMS, 3]
+
+
+def test_publisher_wakes_on_replication_ready():
+	class QuietLog(DummyLog):
+		def info(self, *args, **kwargs):
+			pass
+
+	worker = NodeStateWorker(node_id="A", event_queue=Queue(), log=QuietLog())
+	peers = [SimpleNamespace(node_id="B", host="b", port=9001)]
+	client = RecordingClient(known={"B"})
+
+	publisher = SensorUpdatePublisher(
+		self_node_id="A",
+		peer_table=DummyPeerTable(peers),
+		tcp_client=client,
+		state_worker=worker,
+		log=DummyLog(),
+		interval_s=10.0,
+	)
+	publisher.start()
+	try:
+		worker.merge_update("temp", 21.5, 1000, "A")
+		deadline = time.monotonic() + 2.0
+		while not client.batches and time.monotonic() < deadline:
+			time.sleep(0.01)
+	finally:
+		publisher.stop()
+		publisher.join(timeout=2.0)
+
+	# delivered long before the 10 s interval, and stop() woke run()
+	assert client.batches
+	assert not publisher.is_alive()
+
+
+def test_publish_adds_unknown_peers_once():
+	peers = [SimpleNamespace(node_id="C", host="c", port=9002)]
+	client = RecordingClient(known=set())
+	publisher = make_publisher({"A": {"A:temp": _record("A", 10, 1)}}, peers, client)
+
+	publisher._publish_once()
+	publisher._state_worker._snapshot = {"A": {"A:temp": _record("A", 11, 2)}}
+	publisher._publish_once()
+
+	assert client.added == ["C"]
+	assert [peer_id for peer_id, _ in client.batches] == ["C", "C"]
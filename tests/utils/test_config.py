@@ -49,3 +49,49 @@ def test_empty_bootstrap_peers(monkeypatch):
 def test_invalid_peer_format():
     with pytest.raises(RuntimeError):
         _parse_peers("127.0.0.1")
+
+
+def test_peer_with_bad_port_reports_port_error():
+    with pytest.raises(RuntimeError, match="PORT must be an integer"):
+        _parse_peers("127.0.0.1:abc")
+
+    with pytest.raises(RuntimeError, match="Invalid PORT value"):
+        _parse_peers("127.0.0.1:70000")
+
+
+def test_peer_bracketed_ipv6_and_missing_host():
+    assert _parse_peers(" [::1]:9001 , host:9002") == [("::1", 9001), ("host", 9002)]
+
+    with pytest.raises(RuntimeError, match="Invalid peer format"):
+        _parse_peers(":9001")
+
+
+def test_reactor_threads_default_and_validation(monkeypatch):
+    _set_base_env(monkeypatch)
+    monkeypatch.delenv("TCP_REACTOR_THREADS", raising=False)
+    assert load_config().reactor_threads == 1
+
+    monkeypatch.setenv("TCP_REACTOR_THREADS", "4")
+    assert load_config().reactor_threads == 4
+
+    monkeypatch.setenv("TCP_REACTOR_THREADS", "many")
+    with pytest.raises(RuntimeError, match="TCP_REACTOR_THREADS must be an integer"):
+        load_config()
+
+    monkeypatch.setenv("TCP_REACTOR_THREADS", "0")
+    with pytest.raises(RuntimeError, match="Invalid TCP_REACTOR_THREADS"):
+        load_config()
+
+
+def test_reactor_cpus_parsing_and_validation(monkeypatch):
+    _set_base_env(monkeypatch)
+    monkeypatch.delenv("TCP_REACTOR_CPUS", raising=False)
+    assert load_config().reactor_cpus is None
+
+    monkeypatch.setenv("TCP_REACTOR_CPUS", " 0, 2 ")
+    assert load_config().reactor_cpus == [0, 2]
+
+    for bad in ("0,,2", "a", "1,-1"):
+        monkeypatch.setenv("TCP_REACTOR_CPUS", bad)
+        with pytest.raises(RuntimeError, match="Invalid TCP_REACTOR_CPUS entry"):
+            load_config()
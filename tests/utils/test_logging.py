@@ -0,0 +1,47 @@
+import logging
+
+import pytest
+
+from utils.logging import setup_logging, stop_logging, get_logger
+
+
+@pytest.fixture
+def restore_root_logger():
+    root = logging.getLogger()
+    handlers, level = list(root.handlers), root.level
+    yield
+    stop_logging()
+    root.handlers[:] = handlers
+    root.setLevel(level)
+
+
+def test_records_reach_file_through_listener(tmp_path, restore_root_logger):
+    log_file = tmp_path / "logs" / "node.log"
+
+    listener = setup_logging("node-1", "INFO", str(log_file))
+    assert listener is not None
+
+    log = get_logger("test", "node-1")
+    log.info("Started %d sensors", 3)
+    log.debug("dropped by level")
+
+    # Stopping the listener flushes everything still queued
+    stop_logging()
+
+    lines = log_file.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 1
+    assert "INFO | test | node-1 | Started 3 sensors" in lines[0]
+
+
+def test_setup_logging_replaces_previous_listener(tmp_path, restore_root_logger):
+    first = tmp_path / "first.log"
+    second = tmp_path / "second.log"
+
+    setup_logging("node-1", "INFO", str(first))
+    setup_logging("node-1", "INFO", str(second))
+
+    get_logger("test", "node-1").info("only in second")
+    stop_logging()
+
+    assert first.read_text(encoding="utf-8") == ""
+    assert "only in second" in second.read_text(encoding="utf-8")
@@ -0,0 +1,71 @@
+import threading
+from queue import Empty
+
+import pytest
+
+from utils.ring_queue import RingQueue
+
+
+def test_fifo_order():
+    q = RingQueue()
+    for i in range(5):
+        q.put(i)
+
+    assert [q.get_nowait() for _ in range(5)] == [0, 1, 2, 3, 4]
+    assert q.empty()
+
+
+def test_get_nowait_empty_raises():
+    q = RingQueue()
+    with pytest.raises(Empty):
+        q.get_nowait()
+
+
+def test_get_timeout_raises_empty():
+    q = RingQueue()
+    with pytest.raises(Empty):
+        q.get(timeout=0.05)
+
+
+def test_maxlen_drops_oldest():
+    q = RingQueue(maxlen=3)
+    for i in range(5):
+        q.put(i)
+
+    assert q.qsize() == 3
+    assert [q.get_nowait() for _ in range(3)] == [2, 3, 4]
+
+
+def test_blocking_get_wakes_on_put():
+    q = RingQueue()
+    result = []
+
+    t = threading.Thread(target=lambda: result.append(q.get(timeout=2.0)))
+    t.start()
+    q.put("x")
+    t.join(timeout=2.0)
+
+    assert result == ["x"]
+
+
+def test_put_many_preserves_order_and_maxlen():
+    q = RingQueue(maxlen=3)
+    q.put_many([])
+    assert q.empty()
+
+    q.put_many(range(5))
+
+    assert [q.get(timeout=0.1) for _ in range(3)] == [2, 3, 4]
+
+
+def test_dropped_counts_overwritten_items():
+    q = RingQueue(maxlen=3)
+    for i in range(4):
+        q.put(i)
+    assert q.dropped == 1
+
+    q.put_many([4, 5])
+    assert q.dropped == 3
+    assert [q.get_nowait() for _ in range(3)] == [3, 4, 5]
+
+    assert RingQueue().dropped == 0
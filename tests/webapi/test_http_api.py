@@ -0,0 +1,239 @@
+import email.utils
+import http.client
+import json
+
+import pytest
+
+from webapi.http_api import WebAPIServer
+
+
+class DummyLog:
+	def info(self, *args, **kwargs):
+		pass
+
+	def error(self, *args, **kwargs):
+		pass
+
+	def critical(self, *args, **kwargs):
+		pass
+
+
+@pytest.fixture
+def web_api():
+	server = WebAPIServer(
+		host="127.0.0.1",
+		port=0,
+		state_provider=lambda: {"A": {"A:s1": {"value": 1}}},
+		updates_provider=lambda: {"A": {}},
+		log=DummyLog(),
+	)
+	server.start()
+	try:
+		yield server._server.server_address[1]
+	finally:
+		server.stop()
+		server._server.server_close()
+
+
+def test_requests_share_one_keep_alive_connection(web_api):
+	conn = http.client.HTTPConnection("127.0.0.1", web_api, timeout=2.0)
+	try:
+		conn.request("GET", "/api/state")
+		resp = conn.getresponse()
+		assert resp.status == 200
+		assert json.loads(resp.read()) == {"A": {"A:s1": {"value": 1}}}
+		assert email.utils.parsedate_to_datetime(resp.getheader("Date")) is not None
+		assert resp.getheader("Server")
+		sock = conn.sock
+
+		conn.request("GET", "/nope")
+		resp = conn.getresponse()
+		assert resp.status == 404
+		assert resp.read() == b""
+
+		conn.request("GET", "/api/updates")
+		resp = conn.getresponse()
+		assert json.loads(resp.read()) == {"A": {}}
+
+		# no reconnect happened between requests
+		assert conn.sock is sock
+	finally:
+		conn.close()
+
+
+def test_state_is_encoded_once_per_version_and_honours_etag():
+	calls = []
+	version = [1]
+
+	def state_provider():
+		calls.append(version[0])
+		return {"A": {"A:s1": {"value": version[0]}}}
+
+	server = WebAPIServer(
+		host="127.0.0.1",
+		port=0,
+		state_provider=state_provider,
+		updates_provider=lambda: {"A": {}},
+		log=DummyLog(),
+		state_version_provider=lambda: version[0],
+	)
+	server.start()
+	conn = http.client.HTTPConnection("127.0.0.1", server._server.server_address[1], timeout=2.0)
+	try:
+		conn.request("GET", "/api/state")
+		resp = conn.getresponse()
+		body = resp.read()
+		etag = resp.getheader("ETag")
+		assert etag.startswith('W/"') and etag.endswith('-1"')
+
+		conn.request("GET", "/api/state")
+		resp = conn.getresponse()
+		assert resp.read() == body
+		assert calls == [1]
+
+		conn.request("GET", "/api/state", headers={"If-None-Match": etag})
+		resp = conn.getresponse()
+		assert resp.status == 304
+		assert resp.read() == b""
+
+		version[0] = 2
+		conn.request("GET", "/api/state", headers={"If-None-Match": etag})
+		resp = conn.getresponse()
+		assert resp.status == 200
+		assert json.loads(resp.read()) == {"A": {"A:s1": {"value": 2}}}
+		assert calls == [1, 2]
+	finally:
+		conn.close()
+		server.stop()
+		server._server.server_close()
+
+
+def test_state_since_returns_delta_with_epoch_cursor():
+	seen = []
+
+	def delta_provider(since):
+		seen.append(since)
+		return 7, {"A": {"A:s2": {"value": 2}}}
+
+	server = WebAPIServer(
+		host="127.0.0.1",
+		port=0,
+		state_provider=lambda: {"A": {}},
+		updates_provider=lambda: {"A": {}},
+		log=DummyLog(),
+		state_delta_provider=delta_provider,
+	)
+	server.start()
+	conn = http.client.HTTPConnection("127.0.0.1", server._server.server_address[1], timeout=2.0)
+
+	def get(path):
+		conn.request("GET", path)
+		resp = conn.getresponse()
+		return resp.status, resp.getheader("ETag"), resp.read()
+
+	try:
+		# a bare number carries no epoch: full state, plus a cursor
+		status, etag, body = get("/api/state?since=5")
+		assert status == 200
+		assert etag.endswith('-7"')
+		assert json.loads(body) == {"A": {"A:s2": {"value": 2}}}
+
+		# the returned ETag is the cursor, with or without W/ and quotes
+		get(f"/api/state?since={etag}")
+		get(f"/api/state?since={etag[3:-1]}")
+
+		# a cursor from another epoch (e.g. before a restart) starts over
+		get("/api/state?since=deadbeef-7")
+		assert seen == [0, 7, 7, 0]
+
+		assert get("/api/state?since=abc")[0] == 400
+
+		# without since the full-state endpoint ignores other parameters
+		status, _, body = get("/api/state?foo=1")
+		assert status == 200
+		assert json.loads(body) == {"A": {}}
+		assert seen == [0, 7, 7, 0]
+	finally:
+		conn.close()
+		server.stop()
+		server._server.server_close()
+
+
+def test_json_responses_carry_cors_and_content_headers(web_api):
+	conn = http.client.HTTPConnection("127.0.0.1", web_api, timeout=2.0)
+	try:
+		conn.request("GET", "/api/state")
+		resp = conn.getresponse()
+		body = resp.read()
+
+		assert resp.status == 200
+		assert resp.getheader("Access-Control-Allow-Origin") == "*"
+		assert resp.getheader("Content-Type") == "application/json"
+		assert int(resp.getheader("Content-Length")) == len(body)
+	finally:
+		conn.close()
+
+
+def test_large_state_body_is_sent_intact():
+	state = {"A": {f"A:s{i}": {"value": i, "ts_ms": 1000 + i} for i in range(5000)}}
+
+	server = WebAPIServer(
+		host="127.0.0.1",
+		port=0,
+		state_provider=lambda: state,
+		updates_provider=lambda: {"A": {}},
+		log=DummyLog(),
+	)
+	server.start()
+	conn = http.client.HTTPConnection("127.0.0.1", server._server.server_address[1], timeout=2.0)
+	try:
+		conn.request("GET", "/api/state")
+		resp = conn.getresponse()
+		body = resp.read()
+
+		assert len(body) > 64 * 1024
+		assert int(resp.getheader("Content-Length")) == len(body)
+		assert json.loads(body) == state
+	finally:
+		conn.close()
+		server.stop()
+		server._server.server_close()
+
+
+def test_state_etag_from_previous_server_does_not_match():
+	def make_server():
+		return WebAPIServer(
+			host="127.0.0.1",
+			port=0,
+			state_provider=lambda: {"A": {}},
+			updates_provider=lambda: {"A": {}},
+			log=DummyLog(),
+			state_version_provider=lambda: 3,
+		)
+
+	def get_state(server, headers):
+		conn = http.client.HTTPConnection("127.0.0.1", server._server.server_address[1], timeout=2.0)
+		try:
+			conn.request("GET", "/api/state", headers=headers)
+			resp = conn.getresponse()
+			resp.read()
+			return resp.status, resp.getheader("ETag")
+		finally:
+			conn.close()
+
+	# same state version on both sides of a "restart"
+	old, new = make_server(), make_server()
+	old.start()
+	new.start()
+	try:
+		status, old_etag = get_state(old, {})
+		assert status == 200
+		assert get_state(old, {"If-None-Match": old_etag})[0] == 304
+
+		status, new_etag = get_state(new, {"If-None-Match": old_etag})
+		assert status == 200
+		assert new_etag != old_etag
+	finally:
+		for server in (old, new):
+			server.stop()
+			server._server.server_close()
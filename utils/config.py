@@ -1,6 +1,6 @@
 import os
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 
 _ALLOWED_LOG_LEVELS = {
@@ -31,6 +31,41 @@ def _parse_port(raw: str) -> int:
     return port
 
 
+def _parse_reactor_threads(raw: str) -> int:
+    try:
+        threads = int(raw)
+    except ValueError:
+        raise RuntimeError(f"TCP_REACTOR_THREADS must be an integer, got: {raw}")
+
+    if threads < 1:
+        raise RuntimeError(f"Invalid TCP_REACTOR_THREADS value: {threads} (must be >= 1)")
+
+    return threads
+
+
+def _parse_reactor_cpus(raw: str) -> Optional[List[int]]:
+    if raw.strip() == "":
+        return None
+
+    cpus: List[int] = []
+
+    for item in raw.split(","):
+        item = item.strip()
+        try:
+            cpu = int(item)
+        except ValueError:
+            raise RuntimeError(
+                f"Invalid TCP_REACTOR_CPUS entry: {item!r} (expected comma-separated CPU ids)"
+            )
+
+        if cpu < 0:
+            raise RuntimeError(f"Invalid TCP_REACTOR_CPUS entry: {cpu} (must be >= 0)")
+
+        cpus.append(cpu)
+
+    return cpus
+
+
 def _parse_peers(raw: str) -> List[Tuple[str, int]]:
     if raw.strip() == "":
         return []
@@ -39,13 +74,17 @@ def _parse_peers(raw: str) -> List[Tuple[str, int]]:
 
     for item in raw.split(","):
         item = item.strip()
-        try:
-            host, port = item.split(":")
-            peers.append((host.strip(), _parse_port(port)))
-        except ValueError:
+        # split on the last ":" so bracketed IPv6 hosts ([::1]:9000) work
+        host, sep, port = item.rpartition(":")
+        host = host.strip()
+        if host.startswith("[") and host.endswith("]"):
+            host = host[1:-1]
+        if not sep or not host:
             raise RuntimeError(
                 f"Invalid peer format: {item} (expected host:port)"
             )
+        # port errors are reported by _parse_port, not as a format error
+        peers.append((host, _parse_port(port.strip())))
 
     return peers
 
@@ -58,6 +97,10 @@ class Config:
     bootstrap_peers: List[Tuple[str, int]]
     log_level: str
     log_file: str
+    # >1 enables one SO_REUSEPORT listener per reactor (opt-in)
+    reactor_threads: int = 1
+    # CPUs reactor threads are pinned to, round-robin (None: unpinned)
+    reactor_cpus: Optional[List[int]] = None
 
 
 def load_config() -> Config:
@@ -77,6 +120,12 @@ def load_config() -> Config:
     raw_peers = os.getenv("BOOTSTRAP_PEERS", "")
     bootstrap_peers = _parse_peers(raw_peers)
 
+    reactor_threads = _parse_reactor_threads(
+        os.getenv("TCP_REACTOR_THREADS", "1").strip() or "1"
+    )
+
+    reactor_cpus = _parse_reactor_cpus(os.getenv("TCP_REACTOR_CPUS", ""))
+
     return Config(
         node_id=node_id,
         host=host,
@@ -84,4 +133,6 @@ def load_config() -> Config:
         bootstrap_peers=bootstrap_peers,
         log_level=log_level,
         log_file=log_file,
+        reactor_threads=reactor_threads,
+        reactor_cpus=reactor_cpus,
     )
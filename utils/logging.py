@@ -1,8 +1,24 @@
 import logging
+import logging.handlers
 import os
+import queue
+from typing import Optional
 
 
-def setup_logging(node_id: str, level: str, log_file: str) -> None:
+# Background thread owning the file handler (see setup_logging)
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def setup_logging(node_id: str, level: str, log_file: str) -> logging.handlers.QueueListener:
+    """
+    Route all records through a queue to a single listener thread that
+    owns the file handler, so logging threads only pay for an enqueue.
+
+    Returns the started listener; call stop_logging() (or listener.stop())
+    on shutdown to flush pending records.
+    """
+    global _listener
+
     log_dir = os.path.dirname(log_file)
     if log_dir:
         os.makedirs(log_dir, exist_ok=True)
@@ -15,10 +31,33 @@ def setup_logging(node_id: str, level: str, log_file: str) -> None:
     handler = logging.FileHandler(log_file, mode="a", encoding="utf-8")
     handler.setFormatter(formatter)
 
+    stop_logging()
+
+    records: queue.SimpleQueue = queue.SimpleQueue()
+
     root = logging.getLogger()
     root.setLevel(level)
     root.handlers.clear()
-    root.addHandler(handler)
+    root.addHandler(logging.handlers.QueueHandler(records))
+
+    _listener = logging.handlers.QueueListener(records, handler)
+    _listener.start()
+    return _listener
+
+
+def stop_logging() -> None:
+    """
+    Stop the listener started by setup_logging(), flushing queued records.
+    """
+    global _listener
+
+    listener, _listener = _listener, None
+    if listener is None:
+        return
+
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
 
 
 class NodeLogger(logging.LoggerAdapter):
@@ -0,0 +1,89 @@
+import collections
+import threading
+import time
+from queue import Empty
+from typing import Any, Optional, Sequence
+
+
+class RingQueue:
+    """
+    Lightweight multi-producer / single-consumer queue.
+
+    Backed by collections.deque (append/popleft are atomic) plus a
+    threading.Event used only to wake a blocked consumer, so producers
+    never take a lock. Exposes the subset of queue.Queue used by the
+    node (put / put_nowait / get / get_nowait / qsize / empty) and raises
+    queue.Empty the same way; put_many() adds a batch of items at once.
+
+    If maxlen is set, the buffer is a ring: appending to a full queue
+    drops the oldest item, counted in dropped (approximate when several
+    producers race on a full queue).
+    """
+
+    def __init__(self, maxlen: Optional[int] = None):
+        self._items: collections.deque = collections.deque(maxlen=maxlen)
+        self._not_empty = threading.Event()
+        self._dropped = 0
+
+    @property
+    def maxlen(self) -> Optional[int]:
+        return self._items.maxlen
+
+    @property
+    def dropped(self) -> int:
+        # items discarded because the ring was full
+        return self._dropped
+
+    def put(self, item: Any, block: bool = True, timeout: Optional[float] = None) -> None:
+        items = self._items
+        if items.maxlen is not None and len(items) >= items.maxlen:
+            self._dropped += 1
+        items.append(item)
+        self._not_empty.set()
+
+    def put_nowait(self, item: Any) -> None:
+        self.put(item, block=False)
+
+    def put_many(self, items: Sequence[Any]) -> None:
+        # one extend and one consumer wake-up for the whole batch
+        buf = self._items
+        if buf.maxlen is not None:
+            overflow = len(buf) + len(items) - buf.maxlen
+            if overflow > 0:
+                self._dropped += overflow
+        buf.extend(items)
+        if buf:
+            self._not_empty.set()
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Any:
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            try:
+                return self._items.popleft()
+            except IndexError:
+                pass
+
+            if not block:
+                raise Empty
+
+            remaining = None
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise Empty
+
+            if not self._not_empty.wait(timeout=remaining):
+                raise Empty
+            # Clear before retrying popleft: a racing put() either is seen
+            # by the retry or sets the event again.
+            self._not_empty.clear()
+
+    def get_nowait(self) -> Any:
+        return self.get(block=False)
+
+    def qsize(self) -> int:
+        return len(self._items)
+
+    def empty(self) -> bool:
+        return not self._items
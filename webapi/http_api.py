@@ -1,19 +1,90 @@
 import json
+import secrets
 import threading
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+try:
+	import orjson
+except ImportError:  # fall back to stdlib json
+	orjson = None
+
+
+_CORS_HEADERS = (
+	("Access-Control-Allow-Origin", "*"),
+	("Access-Control-Allow-Methods", "GET, OPTIONS"),
+	("Access-Control-Allow-Headers", "Content-Type"),
+)
+
+# Bodies up to this size are sent in one write together with the header;
+# larger ones are written after it, so the body is never copied
+_COALESCE_MAX = 64 * 1024
+
+# Fixed headers of every 200 JSON response; the status line, Server and
+# Date come before them, ETag and Content-Length after
+_JSON_200_HEAD = (
+	"".join(f"{name}: {value}\r\n" for name, value in _CORS_HEADERS)
+	+ "Content-Type: application/json\r\n"
+).encode("latin-1")
+
+
+def _dumps(obj) -> bytes:
+	# encode a snapshot to JSON bytes, with orjson when available
+	if orjson is not None:
+		try:
+			return orjson.dumps(obj)
+		except TypeError:
+			# orjson is stricter (e.g. non-str keys); use json below
+			pass
+	return json.dumps(obj).encode("utf-8")
+
+
+class _EncodedSnapshot:
+	"""
+	Last encoded /api/state body and the state version it was built from,
+	shared by all requests of one server.
+	"""
+
+	def __init__(self):
+		self.lock = threading.Lock()
+		self.version = None
+		self.payload = b""
+
+	def get(self, version, produce):
+		with self.lock:
+			if version != self.version:
+				self.payload = _dumps(produce())
+				self.version = version
+			return self.payload
 
 
 class RequestHandler(BaseHTTPRequestHandler):
+	# Keep-alive: dashboards poll over one connection instead of paying an
+	# accept() and a server thread per request. Every response therefore
+	# carries a Content-Length, including empty ones.
+	protocol_version = "HTTP/1.1"
+
+	# Idle keep-alive connections are closed after this many seconds
+	timeout = 30
+
 	def __init__(
 		self,
 		*args,
 		state_provider=None,
 		updates_provider=None,
+		state_version_provider=None,
+		state_delta_provider=None,
+		state_cache=None,
+		epoch="",
 		log=None,
 		**kwargs,
 	):
 		self._state_provider = state_provider
 		self._updates_provider = updates_provider
+		self._state_version_provider = state_version_provider
+		self._state_delta_provider = state_delta_provider
+		self._state_cache = state_cache
+		self._epoch = epoch
 		self._log = log
 		super().__init__(*args, **kwargs)
 
@@ -22,31 +93,62 @@ class RequestHandler(BaseHTTPRequestHandler):
 	# --------------------------------------------------
 
 	def _send_cors_headers(self):
-		self.send_header("Access-Control-Allow-Origin", "*")
-		self.send_header("Access-Control-Allow-Methods", "GET, OPTIONS")
-		self.send_header("Access-Control-Allow-Headers", "Content-Type")
+		for name, value in _CORS_HEADERS:
+			self.send_header(name, value)
 
-	def do_OPTIONS(self):
-		self.send_response(204)
+	def _etag(self, version):
+		# the epoch keeps tags from before a restart (when state versions
+		# start over) from matching a different state with the same number
+		return f'W/"{self._epoch}-{version}"'
+
+	def _send_empty(self, status):
+		self.send_response(status)
 		self._send_cors_headers()
+		self.send_header("Content-Length", "0")
 		self.end_headers()
 
+	def _send_json(self, payload, etag=None):
+		# hot polling path: prebuilt header bytes and a single write instead
+		# of send_response()/send_header() formatting each line; the rare
+		# empty and 304 responses keep the regular helpers
+		head = b"HTTP/1.1 200 OK\r\nServer: %s\r\nDate: %s\r\n%s" % (
+			self.version_string().encode("latin-1"),
+			self.date_time_string().encode("latin-1"),
+			_JSON_200_HEAD,
+		)
+		if etag is not None:
+			head += b"ETag: %s\r\n" % etag.encode("latin-1")
+		head += b"Content-Length: %d\r\n\r\n" % len(payload)
+		if len(payload) <= _COALESCE_MAX:
+			self.wfile.write(head + payload)
+		else:
+			self.wfile.write(head)
+			self.wfile.write(payload)
+
+	def do_OPTIONS(self):
+		self._send_empty(204)
+
 	# --------------------------------------------------
 	# HTTP routing
 	# --------------------------------------------------
 
 	def do_GET(self):
 		try:
-			if self.path == "/api/state":
-				self._handle_state()
+			path, _, query = self.path.partition("?")
+
+			if path == "/api/state":
+				# other parameters (e.g. a "_=<ts>" cache-buster) are ignored
+				since = parse_qs(query).get("since") if query else None
+				if since and self._state_delta_provider is not None:
+					self._handle_state_delta(since[0])
+				else:
+					self._handle_state()
 
-			elif self.path == "/api/updates":
+			elif path == "/api/updates":
 				self._handle_updates()
 
 			else:
-				self.send_response(404)
-				self._send_cors_headers()
-				self.end_headers()
+				self._send_empty(404)
 
 		except Exception:
 			if self._log:
@@ -54,57 +156,85 @@ class RequestHandler(BaseHTTPRequestHandler):
 					"Unhandled exception in HTTP handler",
 					exc_info=True,
 				)
-			self.send_response(500)
-			self._send_cors_headers()
-			self.end_headers()
+			self._send_empty(500)
 
 	# --------------------------------------------------
 	# Handlers
 	# --------------------------------------------------
 
 	def _handle_state(self):
+		etag = None
 		try:
-			state = self._state_provider()
-			payload = json.dumps(state).encode("utf-8")
+			if self._state_version_provider is not None and self._state_cache is not None:
+				# unchanged state: answer 304 or reuse the last encoded body
+				version = self._state_version_provider()
+				etag = self._etag(version)
+				if self.headers.get("If-None-Match") == etag:
+					self.send_response(304)
+					self._send_cors_headers()
+					self.send_header("ETag", etag)
+					self.end_headers()
+					return
+				payload = self._state_cache.get(version, self._state_provider)
+			else:
+				payload = _dumps(self._state_provider())
 		except Exception:
 			if self._log:
 				self._log.error(
 					"Failed to produce state snapshot",
 					exc_info=True,
 				)
-			self.send_response(500)
-			self._send_cors_headers()
-			self.end_headers()
+			self._send_empty(500)
 			return
 
-		self.send_response(200)
-		self._send_cors_headers()
-		self.send_header("Content-Type", "application/json")
-		self.send_header("Content-Length", str(len(payload)))
-		self.end_headers()
-		self.wfile.write(payload)
+		self._send_json(payload, etag)
+
+	def _handle_state_delta(self, since_token):
+		# ?since=<etag>: only records applied after the state version named
+		# by an ETag from this endpoint or /api/state (W/ and quotes
+		# optional); the cursor for the next call is returned in the ETag.
+		# A cursor from another epoch (e.g. before a restart) gets the full
+		# state instead, since its version number means nothing here.
+		try:
+			token = since_token.removeprefix("W/").strip('"')
+			epoch, _, version = token.rpartition("-")
+			since = int(version)
+		except ValueError:
+			self._send_empty(400)
+			return
+
+		if epoch != self._epoch or since < 0:
+			since = 0
+
+		try:
+			version, delta = self._state_delta_provider(since)
+			payload = _dumps(delta)
+		except Exception:
+			if self._log:
+				self._log.error(
+					"Failed to produce state delta",
+					exc_info=True,
+				)
+			self._send_empty(500)
+			return
+
+		self._send_json(payload, self._etag(version))
 
 	def _handle_updates(self):
+		# updates are drained on read, so every response is fresh
 		try:
 			updates = self._updates_provider()
-			payload = json.dumps(updates).encode("utf-8")
+			payload = _dumps(updates)
 		except Exception:
 			if self._log:
 				self._log.error(
 					"Failed to produce updates snapshot",
 					exc_info=True,
 				)
-			self.send_response(500)
-			self._send_cors_headers()
-			self.end_headers()
+			self._send_empty(500)
 			return
 
-		self.send_response(200)
-		self._send_cors_headers()
-		self.send_header("Content-Type", "application/json")
-		self.send_header("Content-Length", str(len(payload)))
-		self.end_headers()
-		self.wfile.write(payload)
+		self._send_json(payload)
 
 	def log_message(self, format, *args):
 		return  # silence default HTTP logs
@@ -118,15 +248,27 @@ class WebAPIServer(threading.Thread):
 		state_provider,
 		updates_provider,
 		log,
+		state_version_provider=None,
+		state_delta_provider=None,
 	):
 		super().__init__(daemon=True)
 		self._log = log
 
+		# Per-process token tying ETags to this server's state versions
+		epoch = secrets.token_hex(4)
+
+		# With a version provider, /api/state is re-encoded only on change
+		state_cache = _EncodedSnapshot() if state_version_provider is not None else None
+
 		def handler_factory(*args, **kwargs):
 			return RequestHandler(
 				*args,
 				state_provider=state_provider,
 				updates_provider=updates_provider,
+				state_version_provider=state_version_provider,
+				state_delta_provider=state_delta_provider,
+				state_cache=state_cache,
+				epoch=epoch,
 				log=log,
 				**kwargs,
 			)